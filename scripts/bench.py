@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+
+def _timed(fn: Callable[[], object], iterations: int) -> dict[str, float]:
+    samples: list[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000.0)
+    samples.sort()
+    return {
+        "iterations": iterations,
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "p50_ms": round(samples[len(samples) // 2], 3),
+        "max_ms": round(samples[-1], 3),
+    }
+
+
+def bench_construction(state_dir: Path, iterations: int) -> dict[str, object]:
+    from benjamin.core.infra.services import reset_services
+    from benjamin.core.orchestration.orchestrator import Orchestrator
+
+    def cold() -> None:
+        reset_services()
+        Orchestrator()
+
+    def shared() -> None:
+        Orchestrator()
+
+    cold_stats = _timed(cold, iterations)
+    reset_services()
+    Orchestrator()
+    shared_stats = _timed(shared, iterations)
+    return {"per_instance_clients": cold_stats, "shared_services": shared_stats}
+
+
+class _LatencyEmailConnector:
+    def __init__(self, delay_s: float) -> None:
+        self.delay_s = delay_s
+
+    def search_messages(self, query: str, max_results: int) -> list[dict]:
+        time.sleep(self.delay_s)
+        return [{"id": f"{query}-{index}", "subject": f"{query} update {index}", "snippet": ""} for index in range(max_results)]
+
+
+def bench_rules(state_dir: Path, iterations: int) -> dict[str, object]:
+    from benjamin.core.infra.services import reset_services
+    from benjamin.core.notifications.notifier import NotificationRouter
+    from benjamin.core.rules.evaluator import run_rules_evaluation
+    from benjamin.core.rules.schemas import Rule, RuleCondition, RuleTrigger
+    from benjamin.core.rules.store import RuleStore
+
+    store = RuleStore(state_dir)
+    for index in range(100):
+        store.upsert(
+            Rule(
+                name=f"bench rule {index}",
+                trigger=RuleTrigger(type="gmail", query=f"label:bench-{index}", max_results=5),
+                condition=RuleCondition(contains="update"),
+            )
+        )
+    connector = _LatencyEmailConnector(delay_s=0.02)
+    router = NotificationRouter(channels=[])
+
+    def tick() -> None:
+        run_rules_evaluation(state_dir=str(state_dir), router=router, email_connector=connector)
+
+    results: dict[str, object] = {}
+    for concurrency in ("1", os.getenv("BENJAMIN_RULES_CONCURRENCY", "8")):
+        os.environ["BENJAMIN_RULES_CONCURRENCY"] = concurrency
+        reset_services()
+        tick()
+        results[f"concurrency_{concurrency}"] = _timed(tick, iterations)
+    reset_services()
+    return {"rules": 100, "fetch_latency_ms": 20, **results}
+
+
+def bench_google(state_dir: Path, iterations: int) -> dict[str, object]:
+    from benjamin.core.infra.services import get_services, reset_services
+    from benjamin.core.integrations.fake import fake_backend
+    from benjamin.core.notifications.notifier import NotificationRouter
+    from benjamin.core.rules.evaluator import run_rules_evaluation
+    from benjamin.core.rules.schemas import Rule, RuleCondition, RuleTrigger
+    from benjamin.core.rules.store import RuleStore
+    from benjamin.core.scheduler.jobs import _build_default_connectors, run_daily_briefing
+
+    os.environ["BENJAMIN_GOOGLE_ENABLED"] = "fake"
+    os.environ.setdefault("BENJAMIN_FAKE_GOOGLE_LATENCY_MS", "20")
+    queries = ["in:inbox invoice", "from:ci failed", "is:unread", "subject:status", "category:updates newer_than:2d"]
+    store = RuleStore(state_dir)
+    for index in range(50):
+        store.upsert(
+            Rule(
+                name=f"fake rule {index}",
+                trigger=RuleTrigger(type="gmail", query=queries[index % len(queries)], max_results=10),
+                condition=RuleCondition(contains=""),
+            )
+        )
+    router = NotificationRouter(channels=[])
+    mailbox, _, faults = fake_backend(state_dir)
+
+    def tick() -> None:
+        calendar, email = _build_default_connectors(str(state_dir))
+        mailbox.deliver(1)
+        run_rules_evaluation(state_dir=str(state_dir), router=router, calendar_connector=calendar, email_connector=email)
+
+    def briefing() -> None:
+        run_daily_briefing(state_dir=str(state_dir), router=router)
+
+    results: dict[str, object] = {}
+    for mode in ("poll", "history"):
+        os.environ["BENJAMIN_GMAIL_SYNC_MODE"] = mode
+        reset_services()
+        tick()
+        before = faults.round_trips
+        results[f"rules_tick_{mode}"] = {**_timed(tick, iterations), "round_trips_per_tick": round((faults.round_trips - before) / iterations, 2)}
+    before = faults.round_trips
+    results["daily_briefing"] = {**_timed(briefing, iterations), "round_trips_per_run": round((faults.round_trips - before) / iterations, 2)}
+    results["gmail_cache"] = get_services(state_dir).gmail_cache().stats()
+    reset_services()
+    return {"rules": 50, "fetch_latency_ms": faults.latency_ms, **results}
+
+
+SCENARIOS: dict[str, Callable[[Path, int], dict[str, object]]] = {
+    "construction": bench_construction,
+    "google": bench_google,
+    "rules": bench_rules,
+}
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for BENJAMIN hot paths")
+    parser.add_argument("scenario", choices=sorted(SCENARIOS), help="Scenario to run")
+    parser.add_argument("--iterations", type=int, default=50, help="Iterations per measurement")
+    parser.add_argument("--state-dir", default=None, help="State directory (defaults to a temporary directory)")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    with tempfile.TemporaryDirectory(prefix="benjamin-bench-") as tmp:
+        state_dir = Path(args.state_dir or tmp).expanduser()
+        os.environ["BENJAMIN_STATE_DIR"] = str(state_dir)
+        result = SCENARIOS[args.scenario](state_dir, max(1, args.iterations))
+    print(json.dumps({"scenario": args.scenario, **result}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -107,8 +107,10 @@ def main() -> int:
     else:
         print("OK: auth disabled (BENJAMIN_AUTH_MODE=off)")
 
-    google_enabled = _is_on("BENJAMIN_GOOGLE_ENABLED", default="off")
-    if google_enabled:
+    google_mode = os.getenv("BENJAMIN_GOOGLE_ENABLED", "off").strip().casefold()
+    if google_mode == "fake":
+        print("OK: Google integrations use synthetic fake connectors (BENJAMIN_GOOGLE_ENABLED=fake)")
+    elif google_mode == "on":
         token_path = _google_token_path(state_dir)
         if token_path.exists():
             print(f"OK: Google token file found at {token_path}")
@@ -6,11 +6,13 @@ from functools import lru_cache
 from benjamin.core.approvals.service import ApprovalService
 from benjamin.core.approvals.store import ApprovalStore
 from benjamin.core.integrations.base import CalendarConnector, EmailConnector
-from benjamin.core.integrations.google_auth import GoogleDependencyError, GoogleTokenError
+from benjamin.core.integrations.fake import build_fake_connectors
+from benjamin.core.integrations.google_auth import GoogleDependencyError, GoogleTokenError, google_mode
 from benjamin.core.integrations.google_calendar import GoogleCalendarConnector
 from benjamin.core.integrations.google_gmail import GoogleGmailConnector
 from benjamin.core.ledger.ledger import ExecutionLedger
 from benjamin.core.infra.breaker_manager import BreakerManager
+from benjamin.core.infra.services import get_services
 from benjamin.core.memory.manager import MemoryManager
 from benjamin.core.notifications.notifier import NotificationRouter, build_notification_router
 from benjamin.core.orchestration.orchestrator import Orchestrator
@@ -19,12 +21,11 @@ from benjamin.core.scheduler.scheduler import SchedulerService
 
 @lru_cache(maxsize=1)
 def get_memory_manager() -> MemoryManager:
-    return MemoryManager()
+    return get_services().memory_manager()
 
 
 def get_breaker_manager() -> BreakerManager:
-    memory = get_memory_manager()
-    return BreakerManager(state_dir=memory.state_dir, memory_manager=memory)
+    return get_services(get_memory_manager().state_dir).breaker_manager()
 
 
 def get_execution_ledger() -> ExecutionLedger:
@@ -32,7 +33,7 @@ def get_execution_ledger() -> ExecutionLedger:
 
 
 def _google_enabled() -> bool:
-    return os.getenv("BENJAMIN_GOOGLE_ENABLED", "off").casefold() == "on"
+    return google_mode() == "on"
 
 
 def _google_token_path() -> str:
@@ -44,6 +45,8 @@ def _google_token_path() -> str:
 
 @lru_cache(maxsize=1)
 def get_calendar_connector() -> CalendarConnector | None:
+    if google_mode() == "fake":
+        return build_fake_connectors(get_memory_manager().state_dir, breaker_manager=get_breaker_manager())[0]
     if not _google_enabled():
         return None
     try:
@@ -54,10 +57,17 @@ def get_calendar_connector() -> CalendarConnector | None:
 
 @lru_cache(maxsize=1)
 def get_email_connector() -> EmailConnector | None:
+    state_dir = get_memory_manager().state_dir
+    if google_mode() == "fake":
+        return build_fake_connectors(state_dir, breaker_manager=get_breaker_manager(), cache=get_services(state_dir).gmail_cache())[1]
     if not _google_enabled():
         return None
     try:
-        return GoogleGmailConnector(token_path=_google_token_path(), breaker_manager=get_breaker_manager())
+        return GoogleGmailConnector(
+            token_path=_google_token_path(),
+            breaker_manager=get_breaker_manager(),
+            cache=get_services(state_dir).gmail_cache(),
+        )
     except (GoogleDependencyError, GoogleTokenError):
         return None
 
@@ -80,7 +90,7 @@ def get_scheduler_service() -> SchedulerService:
 
 @lru_cache(maxsize=1)
 def get_notification_router() -> NotificationRouter:
-    return build_notification_router()
+    return build_notification_router(get_memory_manager().state_dir)
 
 
 @lru_cache(maxsize=1)
@@ -9,8 +9,10 @@ from fastapi.responses import JSONResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 import uvicorn
 
+from benjamin.core.infra.services import get_services, reset_services
 from benjamin.core.rules.evaluator import run_rules_evaluation
 from benjamin.core.rules.store import RuleStore
+from benjamin.core.scheduler.lanes import lane_for_job
 from benjamin.core.observability.query import search_runs
 from benjamin.core.runs.store import TaskStore
 
@@ -40,6 +42,9 @@ from .routes_ui import router as ui_router
 from benjamin.core.cache.ttl import TTLCache
 from benjamin.core.http.client import request_with_retry
 from benjamin.core.http.errors import BenjaminHTTPError
+from benjamin.core.http.transport import get_transport
+from benjamin.core.integrations.google_auth import google_mode
+from benjamin.core.infra.ratelimit import get_rate_limiter
 from benjamin.core.logging import configure_logging
 from benjamin.core.logging.context import log_context
 from benjamin.core.models.llm_provider import BenjaminLLM
@@ -204,6 +209,7 @@ def startup() -> None:
             trigger="interval",
             id="rules-evaluator",
             minutes=every_minutes,
+            executor=lane_for_job("rules-evaluator"),
             kwargs={
                 "state_dir": str(app.state.memory_manager.state_dir),
                 "job_id": "rules-evaluator",
@@ -218,6 +224,7 @@ def startup() -> None:
 @app.on_event("shutdown")
 def shutdown() -> None:
     get_scheduler_service().shutdown()
+    reset_services()
 
 
 @app.get("/runs/search")
@@ -261,7 +268,7 @@ def healthz() -> dict[str, bool]:
 def healthz_full() -> dict[str, object]:
     provider = os.getenv("BENJAMIN_LLM_PROVIDER", "off").strip().casefold()
     state_dir = _state_dir()
-    google_enabled = _is_on("BENJAMIN_GOOGLE_ENABLED", "off")
+    mode = google_mode()
     token_path = _google_token_path(state_dir)
     auth_mode = os.getenv("BENJAMIN_AUTH_MODE", "token").strip().casefold()
     auth_enabled = auth_mode != "off"
@@ -292,17 +299,23 @@ def healthz_full() -> dict[str, object]:
             "features": llm_features,
         },
         "google": {
-            "enabled": google_enabled,
+            "enabled": mode != "off",
+            "mode": mode,
             "token_present": token_path.exists(),
             "calendar_ready": calendar_ready,
             "gmail_ready": gmail_ready,
         },
         "safe_mode": {"enabled": safe_mode_enabled},
         "breakers": breaker_snapshot,
+        "http": get_transport().snapshot(),
+        "rate_limits": get_rate_limiter(state_dir).snapshot(),
+        "gmail_cache": get_services(state_dir).gmail_cache().stats(),
         "maintenance": load_maintenance_status(state_dir),
         "scheduler": {
             "rules_enabled": _is_on("BENJAMIN_RULES_ENABLED", "off"),
             "daily_briefing_enabled": any(job.id == "daily-briefing" for job in app.state.scheduler_service.list_jobs()),
+            "lanes": app.state.scheduler_service.lane_stats(),
+            "leader": app.state.scheduler_service.leader_status(),
         },
     }
 
@@ -310,7 +323,7 @@ def healthz_full() -> dict[str, object]:
         payload["ok"] = False
     if not state_writable:
         payload["ok"] = False
-    if google_enabled and not token_path.exists():
+    if mode == "on" and not token_path.exists():
         payload["ok"] = False
 
     return payload
@@ -6,6 +6,7 @@ from pathlib import Path
 from fastapi import APIRouter, Depends
 
 from .deps import get_breaker_manager, get_calendar_connector, get_email_connector, get_memory_manager
+from benjamin.core.integrations.google_auth import google_mode
 from benjamin.core.ops.safe_mode import is_safe_mode_enabled
 
 router = APIRouter()
@@ -18,11 +19,12 @@ def integrations_status(
     email_connector=Depends(get_email_connector),
     breaker_manager=Depends(get_breaker_manager),
 ) -> dict[str, object]:
-    google_enabled = os.getenv("BENJAMIN_GOOGLE_ENABLED", "off").casefold() == "on"
+    mode = google_mode()
     token_path = Path(os.getenv("BENJAMIN_GOOGLE_TOKEN_PATH", str(memory_manager.state_dir / "google_token.json"))).expanduser()
     return {
         "safe_mode": is_safe_mode_enabled(memory_manager.state_dir),
-        "google_enabled": google_enabled,
+        "google_enabled": mode != "off",
+        "google_mode": mode,
         "google_token_present": token_path.exists(),
         "calendar_ready": calendar_connector is not None,
         "gmail_ready": email_connector is not None,
@@ -5,7 +5,8 @@ from uuid import uuid4
 from fastapi import APIRouter, Depends, HTTPException
 
 from benjamin.core.memory.manager import MemoryManager
-from benjamin.core.scheduler.jobs import run_daily_briefing, run_reminder
+from benjamin.core.scheduler.briefing import briefing_prefetch_minutes
+from benjamin.core.scheduler.jobs import run_briefing_prefetch, run_daily_briefing, run_reminder
 from benjamin.core.scheduler.scheduler import SchedulerService
 from benjamin.core.scheduler.schemas import DailyBriefingRequest, JobInfo, ReminderRequest
 
@@ -61,6 +62,19 @@ def upsert_daily_briefing(
         func=run_daily_briefing,
         kwargs={"state_dir": str(memory_manager.state_dir), "job_id": "daily-briefing"},
     )
+    lead_minutes = briefing_prefetch_minutes()
+    if lead_minutes:
+        prefetch_hour, prefetch_minute = divmod((hour * 60 + minute - lead_minutes) % (24 * 60), 60)
+        scheduler.add_cron(
+            job_id="daily-briefing-prefetch",
+            hour=prefetch_hour,
+            minute=prefetch_minute,
+            timezone=timezone,
+            func=run_briefing_prefetch,
+            kwargs={"state_dir": str(memory_manager.state_dir), "job_id": "daily-briefing-prefetch"},
+        )
+    elif any(job.id == "daily-briefing-prefetch" for job in scheduler.list_jobs()):
+        scheduler.remove_job("daily-briefing-prefetch")
     return {"job_id": "daily-briefing", "time_hhmm": request.time_hhmm}
 
 
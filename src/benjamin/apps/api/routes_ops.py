@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Query, Request
 
 from benjamin.core.ops.doctor import run_doctor
 
@@ -11,3 +11,8 @@ router = APIRouter()
 def get_doctor_report(request: Request) -> dict:
     report = run_doctor(state_dir=request.app.state.memory_manager.state_dir)
     return report.model_dump()
+
+
+@router.get("/jobs/stats")
+def get_job_stats(request: Request, recent: int = Query(default=20)) -> dict:
+    return request.app.state.scheduler_service.job_stats(recent=max(0, min(200, recent)))
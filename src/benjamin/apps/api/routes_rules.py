@@ -8,6 +8,7 @@ from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 
 from benjamin.core.rules.evaluator import run_rules_evaluation
+from benjamin.core.rules.runtime import get_rules_runtime
 from benjamin.core.rules.nl_builder import RuleNLBuilder
 from benjamin.core.rules.engine import RuleEngine
 from benjamin.core.ops.safe_mode import is_safe_mode_enabled
@@ -202,6 +203,11 @@ def evaluate_now(request: Request) -> dict[str, list[dict]]:
     return {"results": [item.model_dump() for item in results]}
 
 
+@router.get("/runtime")
+def runtime_stats(request: Request) -> dict[str, object]:
+    return get_rules_runtime(request.app.state.memory_manager.state_dir).snapshot()
+
+
 @router.post("/{rule_id}/test", response_model=RuleTestPreview)
 def test_existing_rule(rule_id: str, request: Request, include_seen: bool = Query(default=False)):
     store = _store_from_request(request)
@@ -165,7 +165,8 @@ def ui_reject(request: Request, approval_id: str, reason: str = Form(default="")
 @router.get("/jobs")
 def ui_jobs(request: Request):
     jobs = request.app.state.scheduler_service.list_jobs()
-    return templates.TemplateResponse("jobs.html", _template_payload(request, jobs=jobs))
+    job_stats = request.app.state.scheduler_service.job_stats()
+    return templates.TemplateResponse("jobs.html", _template_payload(request, jobs=jobs, job_stats=job_stats))
 
 
 @router.post("/jobs/reminder")
@@ -3,22 +3,21 @@ from __future__ import annotations
 import os
 import signal
 import time
-from pathlib import Path
 
-from benjamin.core.infra.breaker_manager import BreakerManager
-from benjamin.core.memory.manager import MemoryManager
+from benjamin.core.infra.services import get_services, reset_services
 from benjamin.core.notifications.notifier import build_notification_router
-from benjamin.core.ops.maintenance import run_doctor_validate, run_weekly_compact
-from benjamin.core.ops.safe_mode import is_safe_mode_enabled
+from benjamin.core.ops.maintenance import run_doctor_validate_job, run_weekly_compact_job
+from benjamin.core.scheduler.lanes import lane_for_job
 from benjamin.core.scheduler.scheduler import SchedulerService
 
 
 class Worker:
     def __init__(self) -> None:
-        self.memory_manager = MemoryManager()
+        self.services = get_services()
+        self.memory_manager = self.services.memory_manager()
         self.scheduler = SchedulerService(state_dir=self.memory_manager.state_dir)
-        self.notification_router = build_notification_router()
-        self.breaker_manager = BreakerManager(state_dir=self.memory_manager.state_dir, memory_manager=self.memory_manager)
+        self.notification_router = build_notification_router(self.memory_manager.state_dir)
+        self.breaker_manager = self.services.breaker_manager()
         self._running = True
 
     def _maintenance_enabled(self) -> bool:
@@ -43,35 +42,27 @@ class Worker:
         compact_dow = os.getenv("BENJAMIN_WEEKLY_COMPACT_DOW", "sun").strip().casefold() or "sun"
 
         self.scheduler.scheduler.add_job(
-            run_doctor_validate,
+            run_doctor_validate_job,
             trigger="cron",
             id="maintenance:doctor_validate",
             hour=doctor_hour,
             minute=doctor_minute,
             timezone=self.scheduler.timezone,
-            kwargs={
-                "state_dir": self.memory_manager.state_dir,
-                "notifier": self.notification_router,
-                "memory_manager": self.memory_manager,
-                "breaker_manager": self.breaker_manager,
-                "safe_mode_snapshot": is_safe_mode_enabled(Path(self.memory_manager.state_dir)),
-            },
+            executor=lane_for_job("maintenance:doctor_validate"),
+            kwargs={"state_dir": str(self.memory_manager.state_dir)},
             replace_existing=True,
         )
 
         self.scheduler.scheduler.add_job(
-            run_weekly_compact,
+            run_weekly_compact_job,
             trigger="cron",
             id="maintenance:weekly_compact",
             day_of_week=compact_dow,
             hour=compact_hour,
             minute=compact_minute,
             timezone=self.scheduler.timezone,
-            kwargs={
-                "state_dir": self.memory_manager.state_dir,
-                "notifier": self.notification_router,
-                "memory_manager": self.memory_manager,
-            },
+            executor=lane_for_job("maintenance:weekly_compact"),
+            kwargs={"state_dir": str(self.memory_manager.state_dir)},
             replace_existing=True,
         )
 
@@ -91,6 +82,7 @@ class Worker:
                 time.sleep(0.5)
         finally:
             self.scheduler.shutdown()
+            reset_services()
             print("[worker] scheduler stopped")
 
 
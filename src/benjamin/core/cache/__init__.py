@@ -1,3 +1,5 @@
+from .gmail import GmailMessageCache
+from .singleflight import SingleFlight, singleflight_key
 from .ttl import TTLCache
 
-__all__ = ["TTLCache"]
+__all__ = ["GmailMessageCache", "SingleFlight", "TTLCache", "singleflight_key"]
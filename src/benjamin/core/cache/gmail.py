@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+class GmailMessageCache:
+    def __init__(self, state_dir: Path | None, memory_entries: int | None = None, disk_entries: int | None = None) -> None:
+        self.enabled = os.getenv("BENJAMIN_GMAIL_CACHE", "on").casefold() != "off"
+        self.path = state_dir / "gmail_cache.sqlite" if state_dir is not None else None
+        self.memory_entries = max(0, memory_entries if memory_entries is not None else _env_int("BENJAMIN_GMAIL_CACHE_MEMORY", 1024))
+        self.disk_entries = max(0, disk_entries if disk_entries is not None else _env_int("BENJAMIN_GMAIL_CACHE_MAX_ENTRIES", 20000))
+        self._memory: OrderedDict[str, tuple[str | None, dict]] = OrderedDict()
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._writes_since_evict = 0
+        self._counts = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stale": 0, "evicted": 0}
+
+    def get_message(self, message_id: str, format_kind: str) -> dict | None:
+        return self._get(f"message:{format_kind}:{message_id}")
+
+    def put_message(self, message_id: str, format_kind: str, payload: dict) -> None:
+        self._put(f"message:{format_kind}:{message_id}", None, payload)
+
+    def get_thread(self, thread_id: str, max_messages: int, history_id: str | None) -> dict | None:
+        return self._get(f"thread:{max_messages}:{thread_id}", history_id=history_id, validate=True)
+
+    def has_thread(self, thread_id: str, max_messages: int) -> bool:
+        if not self.enabled:
+            return False
+        key = f"thread:{max_messages}:{thread_id}"
+        with self._lock:
+            if key in self._memory:
+                return True
+            conn = self._connection()
+            return conn is not None and conn.execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone() is not None
+
+    def put_thread(self, thread_id: str, max_messages: int, history_id: str | None, payload: dict) -> None:
+        if history_id:
+            self._put(f"thread:{max_messages}:{thread_id}", history_id, payload)
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            counts = dict(self._counts)
+            memory_size = len(self._memory)
+        lookups = counts["memory_hits"] + counts["disk_hits"] + counts["misses"]
+        hits = counts["memory_hits"] + counts["disk_hits"]
+        return {
+            "enabled": self.enabled,
+            "memory_entries": memory_size,
+            "memory_capacity": self.memory_entries,
+            "disk_capacity": self.disk_entries if self.path is not None else 0,
+            **counts,
+            "hit_rate": round(hits / lookups, 4) if lookups else None,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _get(self, key: str, history_id: str | None = None, validate: bool = False) -> dict | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._memory.get(key)
+            tier = "memory_hits"
+            if entry is None:
+                entry = self._disk_get(key)
+                tier = "disk_hits"
+            if entry is None:
+                self._counts["misses"] += 1
+                return None
+            stored_history, payload = entry
+            if validate and (history_id is None or stored_history != history_id):
+                self._counts["stale"] += 1
+                self._counts["misses"] += 1
+                return None
+            self._counts[tier] += 1
+            self._remember(key, entry)
+            return dict(payload)
+
+    def _put(self, key: str, history_id: str | None, payload: dict) -> None:
+        if not self.enabled:
+            return
+        entry = (history_id, dict(payload))
+        with self._lock:
+            self._remember(key, entry)
+            conn = self._connection()
+            if conn is None:
+                return
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, history_id, payload, accessed) VALUES (?, ?, ?, ?)",
+                (key, history_id, json.dumps(payload, ensure_ascii=False), time.time()),
+            )
+            conn.commit()
+            self._writes_since_evict += 1
+            if self._writes_since_evict >= 256:
+                self._evict(conn)
+
+    def _remember(self, key: str, entry: tuple[str | None, dict]) -> None:
+        if self.memory_entries <= 0:
+            return
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_get(self, key: str) -> tuple[str | None, dict] | None:
+        conn = self._connection()
+        if conn is None:
+            return None
+        row = conn.execute("SELECT history_id, payload FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        try:
+            payload = json.loads(row[1])
+        except json.JSONDecodeError:
+            return None
+        conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+        conn.commit()
+        return row[0], payload
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        self._writes_since_evict = 0
+        (count,) = conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        overflow = count - self.disk_entries
+        if overflow <= 0:
+            return
+        conn.execute(
+            "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY accessed ASC LIMIT ?)",
+            (overflow,),
+        )
+        conn.commit()
+        self._counts["evicted"] += overflow
+
+    def _connection(self) -> sqlite3.Connection | None:
+        if self.path is None or self.disk_entries <= 0:
+            return None
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, history_id TEXT, payload TEXT NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+            self._conn.commit()
+        return self._conn
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from benjamin.core.infra.services import get_services
 from benjamin.core.models.llm_provider import BenjaminLLM, LLMUnavailable
 
 
 class Drafter:
     def __init__(self, llm: BenjaminLLM | None = None) -> None:
-        self.llm = llm or BenjaminLLM()
+        self.llm = llm or get_services().llm()
         self.enabled = BenjaminLLM.feature_enabled("BENJAMIN_LLM_DRAFTER")
 
     def draft_email(self, to: list[str], subject: str, context_text: str, tone: str = "neutral") -> str:
@@ -1,8 +1,12 @@
 from .client import get_http_client, request_with_retry
 from .errors import BenjaminHTTPError, BenjaminHTTPNetworkError, BenjaminHTTPStatusError
+from .transport import HTTPTransport, RetryBudget, get_transport
 
 __all__ = [
     "get_http_client",
+    "get_transport",
+    "HTTPTransport",
+    "RetryBudget",
     "request_with_retry",
     "BenjaminHTTPError",
     "BenjaminHTTPNetworkError",
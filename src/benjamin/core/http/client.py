@@ -1,25 +1,18 @@
 from __future__ import annotations
 
 import os
-import random
-import threading
-import time
+from pathlib import Path
 
 import httpx
 
+from benjamin.core.infra.ratelimit import RateLimitExceeded
+
 from .errors import BenjaminHTTPNetworkError, BenjaminHTTPStatusError
+from .transport import RETRYABLE_EXCEPTIONS, get_transport
 
-_RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
-_RETRYABLE_EXCEPTIONS = (httpx.ConnectError, httpx.ReadTimeout, httpx.RemoteProtocolError)
-_DEFAULT_TIMEOUT_S = 15.0
-_DEFAULT_CONNECT_TIMEOUT_S = 5.0
 _DEFAULT_RETRIES = 2
 _DEFAULT_BACKOFF_BASE_S = 0.25
 _DEFAULT_BACKOFF_MAX_S = 2.0
-_DEFAULT_USER_AGENT = "BENJAMIN/1.0"
-
-_client: httpx.Client | None = None
-_client_lock = threading.Lock()
 
 
 def _get_float_env(name: str, default: float) -> float:
@@ -42,22 +35,8 @@ def _get_int_env(name: str, default: int) -> int:
         return default
 
 
-def _build_timeout(total_s: float | None = None) -> httpx.Timeout:
-    connect_s = max(0.1, _get_float_env("BENJAMIN_HTTP_CONNECT_TIMEOUT_S", _DEFAULT_CONNECT_TIMEOUT_S))
-    read_total = max(0.1, total_s if total_s is not None else _get_float_env("BENJAMIN_HTTP_TIMEOUT_S", _DEFAULT_TIMEOUT_S))
-    return httpx.Timeout(read_total, connect=min(connect_s, read_total))
-
-
 def get_http_client() -> httpx.Client:
-    global _client
-    if _client is not None:
-        return _client
-
-    with _client_lock:
-        if _client is None:
-            user_agent = os.getenv("BENJAMIN_HTTP_USER_AGENT", _DEFAULT_USER_AGENT)
-            _client = httpx.Client(timeout=_build_timeout(), headers={"User-Agent": user_agent})
-    return _client
+    return get_transport().client_for()
 
 
 def _safe_url(url: str, redact_url: bool) -> str:
@@ -78,6 +57,8 @@ def request_with_retry(
     allowed_statuses: set[int] | None = None,
     redact_url: bool = False,
     idempotency_key: str | None = None,
+    service: str | None = None,
+    state_dir: Path | str | None = None,
 ) -> httpx.Response:
     max_retries = _get_int_env("BENJAMIN_HTTP_RETRIES", _DEFAULT_RETRIES) if retries is None else max(0, retries)
     backoff_base = max(0.01, _get_float_env("BENJAMIN_HTTP_BACKOFF_BASE_S", _DEFAULT_BACKOFF_BASE_S))
@@ -87,43 +68,32 @@ def request_with_retry(
     if idempotency_key and "Idempotency-Key" not in merged_headers:
         merged_headers["Idempotency-Key"] = idempotency_key
 
-    client = get_http_client()
-    attempts = max_retries + 1
     safe_url = _safe_url(url, redact_url)
-
-    last_exc: Exception | None = None
-    for attempt in range(attempts):
-        try:
-            response = client.request(
-                method,
-                url,
-                headers=merged_headers or None,
-                json=json,
-                data=data,
-                timeout=_build_timeout(timeout_override) if timeout_override is not None else None,
-            )
-        except _RETRYABLE_EXCEPTIONS as exc:
-            last_exc = exc
-            if attempt >= max_retries:
-                raise BenjaminHTTPNetworkError(f"HTTP request failed after retries for {safe_url}: {exc.__class__.__name__}") from exc
-            _sleep_for_retry(attempt, backoff_base, backoff_max)
-            continue
-        except httpx.HTTPError as exc:
-            raise BenjaminHTTPNetworkError(f"HTTP request error for {safe_url}: {exc.__class__.__name__}") from exc
-
-        status = response.status_code
-        if allowed_statuses is not None and status in allowed_statuses:
-            return response
-        if 200 <= status < 300:
-            return response
-        if status in _RETRYABLE_STATUS_CODES and attempt < max_retries:
-            _sleep_for_retry(attempt, backoff_base, backoff_max)
-            continue
-        raise BenjaminHTTPStatusError(f"HTTP status {status} for {safe_url}", status_code=status)
-
-    raise BenjaminHTTPNetworkError(f"HTTP request failed for {safe_url}: {last_exc}")
-
-
-def _sleep_for_retry(attempt: int, backoff_base: float, backoff_max: float) -> None:
-    sleep_s = min(backoff_max, backoff_base * (2**attempt)) * (0.5 + random.random())
-    time.sleep(sleep_s)
+    try:
+        response = get_transport().request(
+            method,
+            url,
+            headers=merged_headers or None,
+            json=json,
+            data=data,
+            timeout_s=timeout_override,
+            retries=max_retries,
+            backoff_base_s=backoff_base,
+            backoff_max_s=backoff_max,
+            accept_statuses=allowed_statuses,
+            service=service,
+            state_dir=state_dir,
+        )
+    except RateLimitExceeded as exc:
+        raise BenjaminHTTPStatusError(f"HTTP request rate limited locally for {safe_url}", status_code=429) from exc
+    except RETRYABLE_EXCEPTIONS as exc:
+        raise BenjaminHTTPNetworkError(f"HTTP request failed after retries for {safe_url}: {exc.__class__.__name__}") from exc
+    except httpx.HTTPError as exc:
+        raise BenjaminHTTPNetworkError(f"HTTP request error for {safe_url}: {exc.__class__.__name__}") from exc
+
+    status = response.status_code
+    if allowed_statuses is not None and status in allowed_statuses:
+        return response
+    if 200 <= status < 300:
+        return response
+    raise BenjaminHTTPStatusError(f"HTTP status {status} for {safe_url}", status_code=status)
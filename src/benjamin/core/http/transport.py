@@ -0,0 +1,411 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import httpx
+
+from benjamin.core.infra.ratelimit import RateLimiter, RetryBudget, get_rate_limiter
+from benjamin.core.observability.latency import LatencyHistogram
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRYABLE_EXCEPTIONS = (httpx.TimeoutException, httpx.ConnectError, httpx.NetworkError, httpx.RemoteProtocolError)
+
+_DEFAULT_TIMEOUT_S = 15.0
+_DEFAULT_CONNECT_TIMEOUT_S = 5.0
+_DEFAULT_USER_AGENT = "BENJAMIN/1.0"
+
+
+def _get_float_env(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+def _get_int_env(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+def _parse_host_limits(raw: str) -> dict[str, int]:
+    limits: dict[str, int] = {}
+    for item in raw.split(","):
+        host, _, value = item.partition("=")
+        host = host.strip().casefold()
+        if not host or not value.strip():
+            continue
+        try:
+            limits[host] = max(1, int(value))
+        except ValueError:
+            continue
+    return limits
+
+
+def _host_key(url: str) -> str:
+    parts = urlsplit(url)
+    return (parts.netloc or "default").casefold()
+
+
+@dataclass
+class TransportConfig:
+    timeout_s: float = _DEFAULT_TIMEOUT_S
+    connect_timeout_s: float = _DEFAULT_CONNECT_TIMEOUT_S
+    max_connections: int = 20
+    max_keepalive: int = 10
+    keepalive_expiry_s: float = 30.0
+    host_max_connections: dict[str, int] = field(default_factory=dict)
+    http2: bool = False
+    user_agent: str = _DEFAULT_USER_AGENT
+    retry_budget_ratio: float = 0.2
+    retry_budget_min: int = 10
+    retry_budget_window_s: float = 10.0
+
+    @classmethod
+    def from_env(cls) -> "TransportConfig":
+        http2_requested = os.getenv("BENJAMIN_HTTP2", "off").casefold() == "on"
+        return cls(
+            timeout_s=max(0.1, _get_float_env("BENJAMIN_HTTP_TIMEOUT_S", _DEFAULT_TIMEOUT_S)),
+            connect_timeout_s=max(0.1, _get_float_env("BENJAMIN_HTTP_CONNECT_TIMEOUT_S", _DEFAULT_CONNECT_TIMEOUT_S)),
+            max_connections=max(1, _get_int_env("BENJAMIN_HTTP_MAX_CONNECTIONS", 20)),
+            max_keepalive=max(0, _get_int_env("BENJAMIN_HTTP_MAX_KEEPALIVE", 10)),
+            keepalive_expiry_s=max(0.0, _get_float_env("BENJAMIN_HTTP_KEEPALIVE_S", 30.0)),
+            host_max_connections=_parse_host_limits(os.getenv("BENJAMIN_HTTP_HOST_MAX_CONNECTIONS", "")),
+            http2=http2_requested and importlib.util.find_spec("h2") is not None,
+            user_agent=os.getenv("BENJAMIN_HTTP_USER_AGENT", _DEFAULT_USER_AGENT),
+            retry_budget_ratio=max(0.0, _get_float_env("BENJAMIN_HTTP_RETRY_BUDGET_RATIO", 0.2)),
+            retry_budget_min=max(0, _get_int_env("BENJAMIN_HTTP_RETRY_BUDGET_MIN", 10)),
+            retry_budget_window_s=max(1.0, _get_float_env("BENJAMIN_HTTP_RETRY_BUDGET_WINDOW_S", 10.0)),
+        )
+
+    def timeout(self, total_s: float | None = None) -> httpx.Timeout:
+        read_total = max(0.1, total_s if total_s is not None else self.timeout_s)
+        return httpx.Timeout(read_total, connect=min(self.connect_timeout_s, read_total))
+
+    def limits(self, host: str) -> httpx.Limits:
+        max_connections = self.host_max_connections.get(host, self.max_connections)
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(self.max_keepalive, max_connections),
+            keepalive_expiry=self.keepalive_expiry_s,
+        )
+
+
+class HostMetrics:
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._errors = 0
+        self._retries = 0
+        self._statuses: dict[str, int] = {}
+        self._last_error: str | None = None
+
+    def record(self, duration_ms: float, status: int | None = None, error: str | None = None) -> None:
+        self.latency.observe(duration_ms)
+        with self._lock:
+            self._requests += 1
+            if status is not None:
+                bucket = f"{status // 100}xx"
+                self._statuses[bucket] = self._statuses.get(bucket, 0) + 1
+                if status >= 500 or status == 429:
+                    self._errors += 1
+            if error is not None:
+                self._errors += 1
+                self._last_error = error
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self._retries += 1
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            payload: dict[str, object] = {
+                "requests": self._requests,
+                "errors": self._errors,
+                "retries": self._retries,
+                "statuses": dict(self._statuses),
+                "last_error": self._last_error,
+            }
+        payload["latency"] = self.latency.summary()
+        return payload
+
+
+class HTTPTransport:
+    def __init__(
+        self,
+        config: TransportConfig | None = None,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.config = config or TransportConfig.from_env()
+        self.retry_budget = RetryBudget(
+            ratio=self.config.retry_budget_ratio,
+            min_retries=self.config.retry_budget_min,
+            window_s=self.config.retry_budget_window_s,
+        )
+        self._transport = transport
+        if async_transport is None and isinstance(transport, httpx.AsyncBaseTransport):
+            async_transport = transport
+        self._async_transport = async_transport
+        self._clients: dict[str, httpx.Client] = {}
+        # Async clients are bound to the event loop that created them, so they are kept per loop.
+        self._async_clients: dict[tuple[str, int], tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]] = {}
+        self._metrics: dict[str, HostMetrics] = {}
+        self._lock = threading.Lock()
+
+    def client_for(self, url: str = "") -> httpx.Client:
+        host = _host_key(url)
+        client = self._clients.get(host)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(host)
+            if client is None:
+                client = httpx.Client(
+                    timeout=self.config.timeout(),
+                    headers={"User-Agent": self.config.user_agent},
+                    limits=self.config.limits(host),
+                    http2=self.config.http2,
+                    transport=self._transport,
+                )
+                self._clients[host] = client
+        return client
+
+    def async_client_for(self, url: str = "") -> httpx.AsyncClient:
+        host = _host_key(url)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._async_clients.get((host, id(loop)))
+            if entry is not None and entry[1] is loop:
+                return entry[0]
+            for key, (_, owner) in list(self._async_clients.items()):
+                if owner.is_closed():
+                    del self._async_clients[key]
+            client = httpx.AsyncClient(
+                timeout=self.config.timeout(),
+                headers={"User-Agent": self.config.user_agent},
+                limits=self.config.limits(host),
+                http2=self.config.http2,
+                transport=self._async_transport,
+            )
+            self._async_clients[(host, id(loop))] = (client, loop)
+        return client
+
+    def metrics_for(self, url: str) -> HostMetrics:
+        host = _host_key(url)
+        with self._lock:
+            metrics = self._metrics.get(host)
+            if metrics is None:
+                metrics = HostMetrics()
+                self._metrics[host] = metrics
+        return metrics
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        json: object | None = None,
+        data: object | None = None,
+        timeout_s: float | None = None,
+        retries: int = 0,
+        backoff_base_s: float = 0.25,
+        backoff_max_s: float = 2.0,
+        accept_statuses: set[int] | None = None,
+        service: str | None = None,
+        state_dir: Path | str | None = None,
+    ) -> httpx.Response:
+        client = self.client_for(url)
+        metrics = self.metrics_for(url)
+        timeout = self.config.timeout(timeout_s) if timeout_s is not None else None
+        limiter = get_rate_limiter(state_dir) if service is not None else None
+        attempt = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire(service)
+            budget = self._retry_budget(service, limiter)
+            if budget is self.retry_budget:
+                budget.record_request()
+            started = time.perf_counter()
+            try:
+                response = client.request(method, url, headers=headers, json=json, data=data, timeout=timeout)
+            except RETRYABLE_EXCEPTIONS as exc:
+                metrics.record(_elapsed_ms(started), error=exc.__class__.__name__)
+                if not self._may_retry(attempt, retries, metrics, service, limiter):
+                    raise
+                time.sleep(_backoff_s(attempt, backoff_base_s, backoff_max_s))
+                attempt += 1
+                continue
+            except httpx.HTTPError as exc:
+                metrics.record(_elapsed_ms(started), error=exc.__class__.__name__)
+                raise
+
+            metrics.record(_elapsed_ms(started), status=response.status_code)
+            if not self._should_retry_status(response.status_code, accept_statuses):
+                return response
+            if not self._may_retry(attempt, retries, metrics, service, limiter):
+                return response
+            response.close()
+            time.sleep(_backoff_s(attempt, backoff_base_s, backoff_max_s))
+            attempt += 1
+
+    async def arequest(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        json: object | None = None,
+        data: object | None = None,
+        timeout_s: float | None = None,
+        retries: int = 0,
+        backoff_base_s: float = 0.25,
+        backoff_max_s: float = 2.0,
+        accept_statuses: set[int] | None = None,
+        service: str | None = None,
+        state_dir: Path | str | None = None,
+    ) -> httpx.Response:
+        client = self.async_client_for(url)
+        metrics = self.metrics_for(url)
+        timeout = self.config.timeout(timeout_s) if timeout_s is not None else None
+        limiter = get_rate_limiter(state_dir) if service is not None else None
+        attempt = 0
+        while True:
+            if limiter is not None:
+                await asyncio.to_thread(limiter.acquire, service)
+            budget = self._retry_budget(service, limiter)
+            if budget is self.retry_budget:
+                budget.record_request()
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, url, headers=headers, json=json, data=data, timeout=timeout)
+            except RETRYABLE_EXCEPTIONS as exc:
+                metrics.record(_elapsed_ms(started), error=exc.__class__.__name__)
+                if not self._may_retry(attempt, retries, metrics, service, limiter):
+                    raise
+                await asyncio.sleep(_backoff_s(attempt, backoff_base_s, backoff_max_s))
+                attempt += 1
+                continue
+            except httpx.HTTPError as exc:
+                metrics.record(_elapsed_ms(started), error=exc.__class__.__name__)
+                raise
+
+            metrics.record(_elapsed_ms(started), status=response.status_code)
+            if not self._should_retry_status(response.status_code, accept_statuses):
+                return response
+            if not self._may_retry(attempt, retries, metrics, service, limiter):
+                return response
+            await response.aclose()
+            await asyncio.sleep(_backoff_s(attempt, backoff_base_s, backoff_max_s))
+            attempt += 1
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            metrics = dict(self._metrics)
+        return {
+            "http2": self.config.http2,
+            "pools": len(self._clients) + len(self._async_clients),
+            "retry_budget": self.retry_budget.snapshot(),
+            "hosts": {host: item.snapshot() for host, item in sorted(metrics.items())},
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            async_clients = list(self._async_clients.values())
+            self._clients.clear()
+            self._async_clients.clear()
+        for client in clients:
+            client.close()
+        for async_client, loop in async_clients:
+            _close_async_client(async_client, loop)
+
+    def _should_retry_status(self, status: int, accept_statuses: set[int] | None) -> bool:
+        if accept_statuses is not None and status in accept_statuses:
+            return False
+        return status in RETRYABLE_STATUS_CODES
+
+    def _retry_budget(self, service: str | None, limiter: RateLimiter | None) -> RetryBudget:
+        """Service calls spend the rate limiter's per-service budget; everything else the transport's."""
+        if service is not None and limiter is not None:
+            budget = limiter.retry_budgets.get(service)
+            if budget is not None:
+                return budget
+        return self.retry_budget
+
+    def _may_retry(
+        self,
+        attempt: int,
+        retries: int,
+        metrics: HostMetrics,
+        service: str | None,
+        limiter: RateLimiter | None,
+    ) -> bool:
+        if attempt >= retries or not self._retry_budget(service, limiter).try_spend():
+            return False
+        metrics.record_retry()
+        return True
+
+
+def _close_async_client(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+    if loop.is_closed():
+        # Its connections died with the loop; there is nothing left to await.
+        return
+    if loop.is_running():
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            loop.create_task(client.aclose())
+        else:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        return
+    loop.run_until_complete(client.aclose())
+
+
+def _elapsed_ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000.0
+
+
+def _backoff_s(attempt: int, base_s: float, max_s: float) -> float:
+    return min(max_s, base_s * (2**attempt)) * (0.5 + random.random())
+
+
+_transport: HTTPTransport | None = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> HTTPTransport:
+    global _transport
+    if _transport is not None:
+        return _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = HTTPTransport()
+    return _transport
+
+
+def close_transport() -> None:
+    global _transport
+    with _transport_lock:
+        transport, _transport = _transport, None
+    if transport is not None:
+        transport.close()
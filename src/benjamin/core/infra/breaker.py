@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 
 
 _BREAKER_STATES = {"closed", "open", "half_open"}
+_BREAKER_MODES = {"consecutive", "window"}
+_WINDOW_MAX_SAMPLES = 512
 
 
 def _utc_now() -> datetime:
@@ -39,17 +42,28 @@ class CircuitBreaker:
     last_failure: datetime | None = None
     last_error: str | None = None
     half_open_trials_used: int = 0
+    mode: str = "consecutive"
+    window_s: float = 60.0
+    min_calls: int = 10
+    failure_rate_threshold: float = 0.5
+    slow_call_ms: float = 5000.0
+    slow_call_rate_threshold: float = 0.5
+    max_open_seconds: int = 600
+    open_count: int = 0
+    _outcomes: deque[tuple[datetime, bool, bool]] = field(default_factory=lambda: deque(maxlen=_WINDOW_MAX_SAMPLES), repr=False)
 
     def __post_init__(self) -> None:
         if self.state not in _BREAKER_STATES:
             self.state = "closed"
+        if self.mode not in _BREAKER_MODES:
+            self.mode = "consecutive"
 
     def allow_request(self, now: datetime | None = None) -> bool:
         current = now or _utc_now()
         if self.state == "closed":
             return True
         if self.state == "open":
-            if self.opened_at is not None and current >= self.opened_at + timedelta(seconds=max(1, self.open_seconds)):
+            if self.opened_at is not None and current >= self.opened_at + timedelta(seconds=self.open_interval_s()):
                 self.state = "half_open"
                 self.half_open_trials_used = 0
             else:
@@ -61,7 +75,15 @@ class CircuitBreaker:
             return True
         return True
 
-    def record_success(self, now: datetime | None = None) -> tuple[str, str] | None:
+    def open_interval_s(self) -> int:
+        base = max(1, self.open_seconds)
+        if self.mode != "window" or self.open_count <= 1:
+            return base
+        return min(max(base, self.max_open_seconds), base * (2 ** min(self.open_count - 1, 16)))
+
+    def record_success(self, now: datetime | None = None, duration_ms: float | None = None) -> tuple[str, str] | None:
+        if self.mode == "window":
+            return self._record_window(True, now or _utc_now(), duration_ms, None)
         previous = self.state
         self.failure_count = 0
         self.last_error = None
@@ -73,8 +95,10 @@ class CircuitBreaker:
             return previous, self.state
         return None
 
-    def record_failure(self, error_str: str, now: datetime | None = None) -> tuple[str, str] | None:
+    def record_failure(self, error_str: str, now: datetime | None = None, duration_ms: float | None = None) -> tuple[str, str] | None:
         current = now or _utc_now()
+        if self.mode == "window":
+            return self._record_window(False, current, duration_ms, error_str)
         self.last_error = error_str
         self.last_failure = current
         previous = self.state
@@ -96,6 +120,65 @@ class CircuitBreaker:
             return previous, self.state
         return None
 
+    def window_stats(self, now: datetime | None = None) -> dict[str, object]:
+        self._trim_window(now or _utc_now())
+        calls = len(self._outcomes)
+        failures = sum(1 for _, ok, _ in self._outcomes if not ok)
+        slow = sum(1 for _, _, is_slow in self._outcomes if is_slow)
+        return {
+            "window_s": self.window_s,
+            "calls": calls,
+            "failures": failures,
+            "slow_calls": slow,
+            "failure_rate": round(failures / calls, 3) if calls else 0.0,
+            "slow_call_rate": round(slow / calls, 3) if calls else 0.0,
+            "open_interval_s": self.open_interval_s(),
+        }
+
+    def _record_window(self, ok: bool, current: datetime, duration_ms: float | None, error_str: str | None) -> tuple[str, str] | None:
+        previous = self.state
+        slow = duration_ms is not None and duration_ms >= self.slow_call_ms
+        self._outcomes.append((current, ok, slow))
+        if ok:
+            self.failure_count = 0
+        else:
+            self.failure_count += 1
+            self.last_error = error_str
+            self.last_failure = current
+
+        if self.state == "half_open":
+            if ok and not slow:
+                self.state = "closed"
+                self.opened_at = None
+                self.open_count = 0
+                self.half_open_trials_used = 0
+                self._outcomes.clear()
+            else:
+                self._open(current)
+        elif self.state == "closed" and self._window_tripped(current):
+            self._open(current)
+
+        if previous != self.state:
+            return previous, self.state
+        return None
+
+    def _window_tripped(self, current: datetime) -> bool:
+        stats = self.window_stats(current)
+        if int(stats["calls"]) < max(1, self.min_calls):
+            return False
+        return float(stats["failure_rate"]) >= self.failure_rate_threshold or float(stats["slow_call_rate"]) >= self.slow_call_rate_threshold
+
+    def _open(self, current: datetime) -> None:
+        self.state = "open"
+        self.opened_at = current
+        self.half_open_trials_used = 0
+        self.open_count = min(255, self.open_count + 1)
+
+    def _trim_window(self, current: datetime) -> None:
+        cutoff = current - timedelta(seconds=max(1.0, self.window_s))
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            self._outcomes.popleft()
+
     def to_dict(self) -> dict[str, object]:
         return {
             "state": self.state,
@@ -104,6 +187,8 @@ class CircuitBreaker:
             "last_failure_iso": _to_iso(self.last_failure),
             "last_error": self.last_error,
             "half_open_trials_used": self.half_open_trials_used,
+            "mode": self.mode,
+            "open_count": self.open_count,
         }
 
     @classmethod
@@ -115,6 +200,7 @@ class CircuitBreaker:
         failure_threshold: int,
         open_seconds: int,
         half_open_max_trials: int,
+        **settings: object,
     ) -> "CircuitBreaker":
         return cls(
             service=service,
@@ -127,4 +213,6 @@ class CircuitBreaker:
             last_failure=_parse_iso(payload.get("last_failure_iso") if isinstance(payload.get("last_failure_iso"), str) else None),
             last_error=str(payload.get("last_error")) if payload.get("last_error") is not None else None,
             half_open_trials_used=int(payload.get("half_open_trials_used") or 0),
+            open_count=int(payload.get("open_count") or 0),
+            **settings,  # type: ignore[arg-type]
         )
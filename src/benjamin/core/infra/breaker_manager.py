@@ -1,15 +1,22 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, TypeVar
+from typing import TYPE_CHECKING, Callable, Iterator, TypeVar
 
 from benjamin.core.memory.manager import MemoryManager
 
 from .breaker import CircuitBreaker
+from .breaker_shm import SharedBreakerTable, open_shared_table, shared_state_supported
 from .breaker_store import BreakerStore
 
+if TYPE_CHECKING:
+    from .ratelimit import RateLimiter
+
 SERVICES = ("llm", "gmail", "calendar")
 T = TypeVar("T")
 
@@ -32,6 +39,20 @@ def _env_int(name: str, default: int) -> int:
         return default
 
 
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+def _service_env_float(name: str, service_suffix: str, default: float) -> float:
+    return _env_float(f"{name}_{service_suffix}", _env_float(name, default))
+
+
 class BreakerManager:
     def __init__(self, state_dir: Path, memory_manager: MemoryManager | None = None) -> None:
         self.state_dir = state_dir
@@ -41,67 +62,206 @@ class BreakerManager:
         self.half_open_max_trials = max(1, _env_int("BENJAMIN_BREAKER_HALFOPEN_MAX_TRIALS", 1))
         self.store = BreakerStore(state_dir)
         self.memory_manager = memory_manager or MemoryManager(state_dir=state_dir)
+        self.persist_interval_s = max(0.0, _env_float("BENJAMIN_BREAKER_PERSIST_INTERVAL_S", 5.0))
+        self.increment_episode_interval_s = max(0.0, _env_float("BENJAMIN_BREAKER_EPISODE_INTERVAL_S", 60.0))
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._last_persist = float("-inf")
+        self._flush_timer: threading.Timer | None = None
+        self._pending_increments: dict[str, int] = {}
+        self._last_increment_episode: dict[str, float] = {}
+        self._limiter: RateLimiter | None = None
+        self.shared = os.getenv("BENJAMIN_BREAKER_SHARED", "on").casefold() != "off" and shared_state_supported()
+        self._table: SharedBreakerTable | None = open_shared_table(state_dir) if self.shared else None
+        self._seen_seq: dict[str, int] = {}
         loaded = self.store.load()
         self._breakers: dict[str, CircuitBreaker] = {}
         for service in SERVICES:
-            payload = loaded.get(service, {})
-            self._breakers[service] = CircuitBreaker.from_dict(
-                service,
-                payload,
-                failure_threshold=self.failure_threshold,
-                open_seconds=self.open_seconds,
-                half_open_max_trials=self.half_open_max_trials,
-            )
+            self._breakers[service] = self._from_payload(service, loaded.get(service, {}))
+        if self._table is not None:
+            with self._table.locked():
+                for service in sorted(set(SERVICES) | set(self._table.services())):
+                    if not self._sync(service) and service in self._breakers:
+                        self._publish(service, self._breakers[service])
 
     def get(self, service: str) -> CircuitBreaker:
-        if service not in self._breakers:
-            self._breakers[service] = CircuitBreaker(
-                service=service,
-                failure_threshold=self.failure_threshold,
-                open_seconds=self.open_seconds,
-                half_open_max_trials=self.half_open_max_trials,
-            )
-        return self._breakers[service]
+        breaker = self._breakers.get(service)
+        if breaker is not None:
+            return breaker
+        with self._lock:
+            if service not in self._breakers:
+                self._breakers[service] = self._from_payload(service, {})
+            return self._breakers[service]
 
     def snapshot(self) -> dict[str, dict[str, object]]:
-        return {name: breaker.to_dict() for name, breaker in self._breakers.items()}
+        with self._lock:
+            if self._table is not None:
+                with self._table.locked():
+                    for service in self._table.services():
+                        self._sync(service)
+            snapshot: dict[str, dict[str, object]] = {}
+            for name, breaker in self._breakers.items():
+                payload = breaker.to_dict()
+                if breaker.mode == "window":
+                    payload["window"] = breaker.window_stats()
+                snapshot[name] = payload
+            return snapshot
 
     def wrap(self, service: str, fn: Callable[[], T]) -> T:
+        self._rate_limiter().acquire(service)
         if not self.enabled:
             return fn()
 
-        breaker = self.get(service)
-        previous_state = breaker.state
-        if not breaker.allow_request():
-            self._persist()
-            self._record_transition_if_needed(service, previous_state, breaker.state, "cooldown elapsed")
-            raise ServiceDegradedError(service, breaker.last_error)
-
-        self._record_transition_if_needed(service, previous_state, breaker.state, "cooldown elapsed")
-        self._persist()
+        with self._locked(service) as breaker:
+            previous_state = breaker.state
+            allowed = breaker.allow_request()
+            current_state = breaker.state
+            last_error = breaker.last_error
+            if current_state != previous_state:
+                self._persist()
+            elif current_state == "half_open":
+                self._mark_dirty()
+        self._record_transition_if_needed(service, previous_state, current_state, "cooldown elapsed")
+        if not allowed:
+            raise ServiceDegradedError(service, last_error)
 
+        started = time.perf_counter()
         try:
             result = fn()
         except Exception as exc:
-            before = breaker.state
-            transition = breaker.record_failure(str(exc))
-            self._persist()
+            duration_ms = (time.perf_counter() - started) * 1000.0
+            with self._locked(service) as breaker:
+                transition = breaker.record_failure(str(exc), duration_ms=duration_ms)
+                if transition is not None:
+                    self._persist()
+                else:
+                    self._mark_dirty()
             if transition is not None:
                 self._record_transition(service, transition[0], transition[1], str(exc), correlation_id=self._current_correlation_id())
-            elif before == breaker.state:
+            else:
                 self._record_increment(service, str(exc))
             raise
 
-        transition = breaker.record_success()
-        self._persist()
+        duration_ms = (time.perf_counter() - started) * 1000.0
+        with self._locked(service) as breaker:
+            before = breaker.to_dict()
+            transition = breaker.record_success(duration_ms=duration_ms)
+            if transition is not None:
+                self._persist()
+            elif before != breaker.to_dict():
+                self._mark_dirty()
         if transition is not None:
             self._record_transition(service, transition[0], transition[1], "request succeeded", correlation_id=self._current_correlation_id())
         return result
 
+    def flush(self) -> None:
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._dirty:
+                self._persist()
+
+    @contextmanager
+    def _locked(self, service: str) -> Iterator[CircuitBreaker]:
+        with self._lock:
+            if self._table is None:
+                yield self.get(service)
+                return
+            with self._table.locked():
+                self._sync(service)
+                breaker = self.get(service)
+                before = breaker.to_dict()
+                yield breaker
+                if breaker.to_dict() != before:
+                    self._publish(service, breaker)
+
+    def _sync(self, service: str) -> bool:
+        entry = self._table.read(service) if self._table is not None else None
+        if entry is None:
+            return False
+        seq, payload = entry
+        if self._seen_seq.get(service) != seq:
+            previous = self._breakers.get(service)
+            breaker = self._from_payload(service, payload)
+            if previous is not None:
+                breaker._outcomes = previous._outcomes
+            self._breakers[service] = breaker
+            self._seen_seq[service] = seq
+        return True
+
+    def _publish(self, service: str, breaker: CircuitBreaker) -> None:
+        if self._table is None:
+            return
+        seq = self._table.write(service, breaker.to_dict())
+        if seq is not None:
+            self._seen_seq[service] = seq
+
+    def _from_payload(self, service: str, payload: dict[str, object]) -> CircuitBreaker:
+        return CircuitBreaker.from_dict(
+            service,
+            payload,
+            failure_threshold=self.failure_threshold,
+            open_seconds=self.open_seconds,
+            half_open_max_trials=self.half_open_max_trials,
+            **self._window_settings(service),
+        )
+
+    def _window_settings(self, service: str) -> dict[str, object]:
+        suffix = service.upper()
+        mode = (os.getenv(f"BENJAMIN_BREAKER_MODE_{suffix}") or os.getenv("BENJAMIN_BREAKER_MODE", "consecutive")).strip().casefold()
+        return {
+            "mode": mode,
+            "window_s": max(1.0, _service_env_float("BENJAMIN_BREAKER_WINDOW_S", suffix, 60.0)),
+            "min_calls": max(1, int(_service_env_float("BENJAMIN_BREAKER_MIN_CALLS", suffix, 10))),
+            "failure_rate_threshold": min(1.0, max(0.0, _service_env_float("BENJAMIN_BREAKER_FAILURE_RATE", suffix, 0.5))),
+            "slow_call_ms": max(1.0, _service_env_float("BENJAMIN_BREAKER_SLOW_CALL_MS", suffix, 5000.0)),
+            "slow_call_rate_threshold": min(1.0, max(0.0, _service_env_float("BENJAMIN_BREAKER_SLOW_CALL_RATE", suffix, 0.5))),
+            "max_open_seconds": max(1, int(_service_env_float("BENJAMIN_BREAKER_MAX_OPEN_SECONDS", suffix, 600))),
+        }
+
+    def _rate_limiter(self) -> RateLimiter:
+        if self._limiter is None:
+            from .ratelimit import get_rate_limiter
+
+            self._limiter = get_rate_limiter(self.state_dir)
+        return self._limiter
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        elapsed = time.monotonic() - self._last_persist
+        if elapsed >= self.persist_interval_s:
+            self._persist()
+            return
+        # Write deferred changes once the interval ends even if no further calls arrive.
+        with self._lock:
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.persist_interval_s - elapsed, self._timer_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _timer_flush(self) -> None:
+        with self._lock:
+            self._flush_timer = None
+            if self._dirty:
+                self._persist()
+
     def _persist(self) -> None:
-        self.store.save(self.snapshot())
+        with self._lock:
+            self.store.save(self.snapshot())
+            self._dirty = False
+            self._last_persist = time.monotonic()
 
     def _record_increment(self, service: str, reason: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            pending = self._pending_increments.get(service, 0) + 1
+            last = self._last_increment_episode.get(service)
+            if last is not None and now - last < self.increment_episode_interval_s:
+                self._pending_increments[service] = pending
+                return
+            self._pending_increments[service] = 0
+            self._last_increment_episode[service] = now
         self.memory_manager.episodic.append(
             kind="infra",
             summary=f"Breaker failure recorded for {service}",
@@ -110,6 +270,7 @@ class BreakerManager:
                 "state": self.get(service).state,
                 "reason": reason,
                 "failure_count": self.get(service).failure_count,
+                "aggregated_failures": pending,
                 "ts_iso": datetime.now(timezone.utc).isoformat(),
                 "correlation_id": self._current_correlation_id(),
             },
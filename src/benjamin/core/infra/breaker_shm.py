@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms fall back to breakers.json
+    fcntl = None  # type: ignore[assignment]
+
+_MAGIC = b"BJBR"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHH")
+_SLOT = struct.Struct("<16sBBHIdddQ200s")
+_STATES = ("closed", "open", "half_open")
+DEFAULT_SLOTS = 16
+
+
+def shared_state_supported() -> bool:
+    return fcntl is not None
+
+
+def _to_epoch(value: object) -> float:
+    if not isinstance(value, str) or not value:
+        return 0.0
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return 0.0
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _from_epoch(value: float) -> str | None:
+    if value <= 0:
+        return None
+    return datetime.fromtimestamp(value, tz=timezone.utc).isoformat()
+
+
+class SharedBreakerTable:
+    def __init__(self, path: Path, slots: int = DEFAULT_SLOTS) -> None:
+        self.path = path
+        self.slots = slots
+        self.size = _HEADER.size + _SLOT.size * slots
+        self._lock = threading.RLock()
+        self._depth = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        with self._flock():
+            if os.fstat(self._fd).st_size < self.size:
+                os.ftruncate(self._fd, self.size)
+            self._map = mmap.mmap(self._fd, self.size)
+            magic, version, stored_slots = _HEADER.unpack_from(self._map, 0)
+            self.created = magic != _MAGIC or version != _VERSION or stored_slots != slots
+            if self.created:
+                self._map[:] = b"\x00" * self.size
+                _HEADER.pack_into(self._map, 0, _MAGIC, _VERSION, slots)
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        # flock is per open file, not per call: only the outermost entry may take and drop it.
+        with self._lock:
+            if self._depth == 0:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def read(self, service: str) -> tuple[int, dict[str, object]] | None:
+        index = self._find(service)
+        if index is None:
+            return None
+        _, state, open_count, trials, failures, opened_at, last_failure, _, seq, error = _SLOT.unpack_from(self._map, self._offset(index))
+        last_error = error.rstrip(b"\x00").decode("utf-8", errors="replace") or None
+        return seq, {
+            "state": _STATES[state] if state < len(_STATES) else "closed",
+            "failure_count": failures,
+            "opened_at_iso": _from_epoch(opened_at),
+            "last_failure_iso": _from_epoch(last_failure),
+            "last_error": last_error,
+            "half_open_trials_used": trials,
+            "open_count": open_count,
+        }
+
+    def write(self, service: str, payload: dict[str, object]) -> int | None:
+        index = self._find(service)
+        if index is None:
+            index = self._find("")
+            if index is None:
+                return None
+        offset = self._offset(index)
+        seq = _SLOT.unpack_from(self._map, offset)[8] + 1
+        state = str(payload.get("state") or "closed")
+        error = str(payload.get("last_error") or "").encode("utf-8")[:200]
+        _SLOT.pack_into(
+            self._map,
+            offset,
+            service.encode("utf-8")[:16],
+            _STATES.index(state) if state in _STATES else 0,
+            min(0xFF, int(payload.get("open_count") or 0)),
+            min(0xFFFF, int(payload.get("half_open_trials_used") or 0)),
+            min(0xFFFFFFFF, int(payload.get("failure_count") or 0)),
+            _to_epoch(payload.get("opened_at_iso")),
+            _to_epoch(payload.get("last_failure_iso")),
+            datetime.now(timezone.utc).timestamp(),
+            seq,
+            error,
+        )
+        return seq
+
+    def services(self) -> list[str]:
+        names: list[str] = []
+        for index in range(self.slots):
+            name = self._name_at(index)
+            if name:
+                names.append(name)
+        return names
+
+    def flush(self) -> None:
+        self._map.flush()
+
+    def _find(self, service: str) -> int | None:
+        for index in range(self.slots):
+            if self._name_at(index) == service:
+                return index
+        return None
+
+    def _name_at(self, index: int) -> str:
+        raw = self._map[self._offset(index) : self._offset(index) + 16]
+        return raw.rstrip(b"\x00").decode("utf-8", errors="replace")
+
+    def _offset(self, index: int) -> int:
+        return _HEADER.size + index * _SLOT.size
+
+    @contextmanager
+    def _flock(self) -> Iterator[None]:
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+
+_tables: dict[Path, SharedBreakerTable] = {}
+_tables_lock = threading.Lock()
+
+
+def open_shared_table(state_dir: Path) -> SharedBreakerTable:
+    path = (state_dir / "breakers.shm").resolve()
+    with _tables_lock:
+        table = _tables.get(path)
+        if table is None or not path.exists():
+            table = SharedBreakerTable(path)
+            _tables[path] = table
+        return table
@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms keep buckets per process
+    fcntl = None  # type: ignore[assignment]
+
+from .breaker_manager import ServiceDegradedError
+
+RATE_LIMITED_SERVICES = ("llm", "gmail", "calendar", "discord")
+DEFAULT_LIMITS: dict[str, tuple[float, float]] = {
+    "llm": (10.0, 20.0),
+    "gmail": (20.0, 40.0),
+    "calendar": (10.0, 20.0),
+    "discord": (2.5, 5.0),
+}
+# Notifications are user-facing, so they queue behind the bucket instead of
+# failing after the global wait used for interactive calls.
+DEFAULT_MAX_WAIT_S: dict[str, float] = {"discord": 60.0}
+
+
+class RateLimitExceeded(ServiceDegradedError):
+    def __init__(self, service: str, wait_s: float) -> None:
+        self.wait_s = wait_s
+        super().__init__(service, f"rate_limited (retry in {wait_s:.2f}s)")
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+def _default_state_dir() -> Path:
+    configured = os.getenv("BENJAMIN_STATE_DIR")
+    if configured:
+        return Path(configured).expanduser()
+    return Path.home() / ".benjamin"
+
+
+@dataclass(frozen=True)
+class BucketConfig:
+    rate_per_s: float
+    burst: float
+
+    @classmethod
+    def from_env(cls, service: str) -> "BucketConfig | None":
+        rate, burst = DEFAULT_LIMITS.get(service, (0.0, 0.0))
+        raw = os.getenv(f"BENJAMIN_RATE_LIMIT_{service.upper()}")
+        if raw is not None:
+            value = raw.strip().casefold()
+            if value in {"", "off", "0"}:
+                return None
+            rate_raw, _, burst_raw = value.partition("/")
+            try:
+                rate = float(rate_raw)
+                burst = float(burst_raw) if burst_raw else max(1.0, rate)
+            except ValueError:
+                pass
+        if rate <= 0:
+            return None
+        return cls(rate_per_s=rate, burst=max(1.0, burst))
+
+
+class RetryBudget:
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window_s: float = 10.0) -> None:
+        self.ratio = max(0.0, ratio)
+        self.min_retries = max(0, min_retries)
+        self.window_s = max(1.0, window_s)
+        self._requests: deque[float] = deque()
+        self._retries: deque[float] = deque()
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._requests.append(time.monotonic())
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self._trim(now)
+            allowed = self.min_retries + self.ratio * len(self._requests)
+            if len(self._retries) >= allowed:
+                self._rejected += 1
+                return False
+            self._retries.append(now)
+            return True
+
+    def snapshot(self) -> dict[str, float | int]:
+        with self._lock:
+            self._trim(time.monotonic())
+            return {
+                "window_s": self.window_s,
+                "requests": len(self._requests),
+                "retries": len(self._retries),
+                "allowed": int(self.min_retries + self.ratio * len(self._requests)),
+                "rejected_total": self._rejected,
+            }
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self.window_s
+        for samples in (self._requests, self._retries):
+            while samples and samples[0] <= cutoff:
+                samples.popleft()
+
+
+class TokenBucketStore:
+    """Token buckets kept in memory, or in an mmap slot table shared by processes on one state dir."""
+
+    _SLOT = struct.Struct("<16sdd")
+
+    def __init__(self, state_dir: Path | None) -> None:
+        self.path = state_dir / "ratelimit.shm" if state_dir is not None and fcntl is not None else None
+        self._local: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        self._fd: int | None = None
+        self._map: mmap.mmap | None = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            size = self._SLOT.size * len(RATE_LIMITED_SERVICES) * 2
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            with self._flock():
+                if os.fstat(self._fd).st_size < size:
+                    os.ftruncate(self._fd, size)
+                self._map = mmap.mmap(self._fd, size)
+
+    def take(self, service: str, config: BucketConfig, tokens: float = 1.0) -> float:
+        with self._lock, self._flock():
+            now = time.time()
+            stored_tokens, stored_ts = self._read(service) or (config.burst, now)
+            available = min(config.burst, stored_tokens + max(0.0, now - stored_ts) * config.rate_per_s)
+            if available >= tokens:
+                self._write(service, available - tokens, now)
+                return 0.0
+            self._write(service, available, now)
+            return (tokens - available) / config.rate_per_s
+
+    def peek(self, service: str, config: BucketConfig) -> float:
+        with self._lock, self._flock():
+            bucket = self._read(service)
+        if bucket is None:
+            return config.burst
+        stored_tokens, stored_ts = bucket
+        elapsed = max(0.0, time.time() - stored_ts)
+        return round(min(config.burst, stored_tokens + elapsed * config.rate_per_s), 3)
+
+    def _read(self, service: str) -> tuple[float, float] | None:
+        if self._map is None:
+            return self._local.get(service)
+        index = self._find(service)
+        if index is None:
+            return None
+        _, stored_tokens, stored_ts = self._SLOT.unpack_from(self._map, index * self._SLOT.size)
+        return stored_tokens, stored_ts
+
+    def _write(self, service: str, stored_tokens: float, stored_ts: float) -> None:
+        if self._map is None:
+            self._local[service] = (stored_tokens, stored_ts)
+            return
+        index = self._find(service)
+        if index is None:
+            index = self._find("")
+            if index is None:
+                self._local[service] = (stored_tokens, stored_ts)
+                return
+        self._SLOT.pack_into(self._map, index * self._SLOT.size, service.encode("utf-8")[:16], stored_tokens, stored_ts)
+
+    def _find(self, service: str) -> int | None:
+        assert self._map is not None
+        encoded = service.encode("utf-8")[:16]
+        for index in range(len(self._map) // self._SLOT.size):
+            offset = index * self._SLOT.size
+            if self._map[offset : offset + 16].rstrip(b"\x00") == encoded:
+                return index
+        return None
+
+    @contextmanager
+    def _flock(self) -> Iterator[None]:
+        if self._fd is None:
+            yield
+            return
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+
+class RateLimiter:
+    def __init__(self, state_dir: Path | None = None, shared: bool | None = None) -> None:
+        self.enabled = os.getenv("BENJAMIN_RATE_LIMITS_ENABLED", "on").casefold() != "off"
+        if shared is None:
+            shared = os.getenv("BENJAMIN_RATE_LIMIT_SHARED", "on").casefold() != "off"
+        self.shared = shared and state_dir is not None
+        self.max_wait_s = max(0.0, _env_float("BENJAMIN_RATE_LIMIT_MAX_WAIT_S", 2.0))
+        self.service_max_wait_s = {
+            service: max(
+                0.0,
+                _env_float(
+                    f"BENJAMIN_RATE_LIMIT_MAX_WAIT_S_{service.upper()}",
+                    DEFAULT_MAX_WAIT_S.get(service, self.max_wait_s),
+                ),
+            )
+            for service in RATE_LIMITED_SERVICES
+        }
+        self.configs = {service: BucketConfig.from_env(service) for service in RATE_LIMITED_SERVICES}
+        self.store = TokenBucketStore(state_dir if self.shared else None)
+        ratio = max(0.0, _env_float("BENJAMIN_RETRY_BUDGET_RATIO", 0.2))
+        min_retries = max(0, _env_int("BENJAMIN_RETRY_BUDGET_MIN", 3))
+        window_s = max(1.0, _env_float("BENJAMIN_RETRY_BUDGET_WINDOW_S", 30.0))
+        self.retry_budgets = {
+            service: RetryBudget(ratio=ratio, min_retries=min_retries, window_s=window_s) for service in RATE_LIMITED_SERVICES
+        }
+        self._throttled: dict[str, int] = {service: 0 for service in RATE_LIMITED_SERVICES}
+        self._rejected: dict[str, int] = {service: 0 for service in RATE_LIMITED_SERVICES}
+        self._counter_lock = threading.Lock()
+
+    def acquire(self, service: str, max_wait_s: float | None = None) -> float:
+        budget = self.retry_budgets.get(service)
+        if budget is not None:
+            budget.record_request()
+        config = self.configs.get(service)
+        if not self.enabled or config is None:
+            return 0.0
+
+        if max_wait_s is None:
+            limit_s = self.service_max_wait_s.get(service, self.max_wait_s)
+        else:
+            limit_s = max(0.0, max_wait_s)
+        started = time.monotonic()
+        while True:
+            wait_s = self.store.take(service, config)
+            if wait_s <= 0:
+                waited = time.monotonic() - started
+                if waited > 0.001:
+                    self._bump(self._throttled, service)
+                return waited
+            remaining = limit_s - (time.monotonic() - started)
+            if wait_s > remaining:
+                self._bump(self._rejected, service)
+                raise RateLimitExceeded(service, wait_s)
+            time.sleep(wait_s)
+
+    def allow_retry(self, service: str) -> bool:
+        budget = self.retry_budgets.get(service)
+        return True if budget is None else budget.try_spend()
+
+    def snapshot(self) -> dict[str, object]:
+        services: dict[str, object] = {}
+        for service in RATE_LIMITED_SERVICES:
+            config = self.configs.get(service)
+            with self._counter_lock:
+                throttled = self._throttled[service]
+                rejected = self._rejected[service]
+            services[service] = {
+                "rate_per_s": config.rate_per_s if config else None,
+                "burst": config.burst if config else None,
+                "tokens": self.store.peek(service, config) if config else None,
+                "throttled_total": throttled,
+                "rejected_total": rejected,
+                "retry_budget": self.retry_budgets[service].snapshot(),
+            }
+        return {"enabled": self.enabled, "shared": self.shared, "services": services}
+
+    def _bump(self, counters: dict[str, int], service: str) -> None:
+        with self._counter_lock:
+            counters[service] = counters.get(service, 0) + 1
+
+
+_limiters: dict[Path, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(state_dir: Path | str | None = None) -> RateLimiter:
+    resolved = (Path(state_dir).expanduser() if state_dir is not None else _default_state_dir()).resolve()
+    with _limiters_lock:
+        limiter = _limiters.get(resolved)
+        if limiter is None:
+            limiter = RateLimiter(state_dir=resolved)
+            _limiters[resolved] = limiter
+        return limiter
+
+
+def reset_rate_limiters() -> None:
+    with _limiters_lock:
+        _limiters.clear()
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+import httpx
+
+from benjamin.core.cache.gmail import GmailMessageCache
+from benjamin.core.http.transport import close_transport, get_transport
+from benjamin.core.integrations.calendar_sync import CalendarMirror
+from benjamin.core.memory.manager import MemoryManager
+
+from .breaker_manager import BreakerManager
+from .ratelimit import reset_rate_limiters
+
+if TYPE_CHECKING:
+    from benjamin.core.models.llm_provider import BenjaminLLM
+    from benjamin.core.rules.runtime import RulesRuntime
+
+_LLM_ENV_PREFIXES = ("BENJAMIN_LLM_", "BENJAMIN_VLLM_")
+
+logger = logging.getLogger("benjamin.services")
+
+
+def _default_state_dir() -> Path:
+    configured = os.getenv("BENJAMIN_STATE_DIR")
+    if configured:
+        return Path(configured).expanduser()
+    return Path.home() / ".benjamin"
+
+
+def _llm_fingerprint() -> tuple[tuple[str, str], ...]:
+    return tuple(sorted((key, value) for key, value in os.environ.items() if key.startswith(_LLM_ENV_PREFIXES)))
+
+
+class ServiceContainer:
+    def __init__(self, state_dir: Path) -> None:
+        self.state_dir = state_dir
+        self._lock = threading.RLock()
+        self._memory_manager: MemoryManager | None = None
+        self._breaker_manager: BreakerManager | None = None
+        self._llms: dict[tuple[tuple[str, str], ...], BenjaminLLM] = {}
+        self._rules_runtime: RulesRuntime | None = None
+        self._gmail_cache: GmailMessageCache | None = None
+        self._calendar_mirror: CalendarMirror | None = None
+        self._shutdown_hooks: list[Callable[[], None]] = []
+        self._closed = False
+
+    def memory_manager(self) -> MemoryManager:
+        with self._lock:
+            if self._memory_manager is None:
+                self._memory_manager = MemoryManager(state_dir=self.state_dir)
+            return self._memory_manager
+
+    def breaker_manager(self) -> BreakerManager:
+        with self._lock:
+            if self._breaker_manager is None:
+                self._breaker_manager = BreakerManager(state_dir=self.state_dir, memory_manager=self.memory_manager())
+                self._shutdown_hooks.append(self._breaker_manager.flush)
+            return self._breaker_manager
+
+    def gmail_cache(self) -> GmailMessageCache:
+        with self._lock:
+            if self._gmail_cache is None:
+                self._gmail_cache = GmailMessageCache(state_dir=self.state_dir)
+                self._shutdown_hooks.append(self._gmail_cache.close)
+            return self._gmail_cache
+
+    def calendar_mirror(self) -> CalendarMirror:
+        with self._lock:
+            if self._calendar_mirror is None:
+                self._calendar_mirror = CalendarMirror(state_dir=self.state_dir)
+            return self._calendar_mirror
+
+    def llm(self) -> BenjaminLLM:
+        from benjamin.core.models.llm_provider import BenjaminLLM
+
+        fingerprint = _llm_fingerprint()
+        with self._lock:
+            llm = self._llms.get(fingerprint)
+            if llm is None:
+                llm = BenjaminLLM(breaker_manager=self.breaker_manager())
+                self._llms[fingerprint] = llm
+            return llm
+
+    def rules_runtime(self) -> RulesRuntime:
+        from benjamin.core.rules.runtime import RulesRuntime
+
+        with self._lock:
+            if self._rules_runtime is None:
+                self._rules_runtime = RulesRuntime(memory_manager=self.memory_manager())
+                self._shutdown_hooks.append(self._rules_runtime.close)
+            return self._rules_runtime
+
+    def http_client(self) -> httpx.Client:
+        return get_transport().client_for()
+
+    def on_shutdown(self, hook: Callable[[], None]) -> None:
+        with self._lock:
+            self._shutdown_hooks.append(hook)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            hooks = list(reversed(self._shutdown_hooks))
+            self._shutdown_hooks.clear()
+            self._llms.clear()
+            self._rules_runtime = None
+            self._gmail_cache = None
+            self._calendar_mirror = None
+            self._breaker_manager = None
+            self._memory_manager = None
+        for hook in hooks:
+            try:
+                hook()
+            except Exception:
+                logger.exception("service_shutdown_hook_failed")
+
+
+_containers: dict[Path, ServiceContainer] = {}
+_containers_lock = threading.Lock()
+
+
+def get_services(state_dir: Path | str | None = None) -> ServiceContainer:
+    resolved = Path(state_dir).expanduser() if state_dir is not None else _default_state_dir()
+    with _containers_lock:
+        container = _containers.get(resolved)
+        if container is None:
+            container = ServiceContainer(resolved)
+            _containers[resolved] = container
+        return container
+
+
+def reset_services() -> None:
+    with _containers_lock:
+        containers = list(_containers.values())
+        _containers.clear()
+    for container in containers:
+        container.close()
+    close_transport()
+    reset_rate_limiters()
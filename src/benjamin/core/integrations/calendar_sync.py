@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+
+logger = logging.getLogger("benjamin.integrations.calendar_sync")
+
+_PUBLIC_FIELDS = ("id", "title", "start_iso", "end_iso", "location", "attendees_count")
+
+
+class SyncTokenExpiredError(RuntimeError):
+    def __init__(self, calendar_id: str) -> None:
+        super().__init__(f"calendar sync token for {calendar_id} is no longer valid")
+        self.calendar_id = calendar_id
+
+
+def calendar_sync_enabled() -> bool:
+    return os.getenv("BENJAMIN_CALENDAR_SYNC", "off").strip().casefold() == "on"
+
+
+def _parse_iso(value: object) -> datetime | None:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class CalendarMirror:
+    """Local copy of upcoming events per calendar, kept current with Calendar API sync tokens."""
+
+    def __init__(self, state_dir: Path, horizon_days: int | None = None) -> None:
+        self.path = state_dir / "calendar_mirror.json"
+        if horizon_days is None:
+            try:
+                horizon_days = int(os.getenv("BENJAMIN_CALENDAR_SYNC_HORIZON_DAYS", "14"))
+            except ValueError:
+                horizon_days = 14
+        self.horizon = timedelta(days=max(1, horizon_days))
+        self._lock = threading.Lock()
+        self._state: dict[str, dict[str, Any]] = self._load()
+        self.full_syncs = 0
+        self.incremental_syncs = 0
+
+    def sync(self, connector: Any, calendar_id: str) -> int:
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            entry = self._state.get(calendar_id)
+            coverage_end = _parse_iso((entry or {}).get("coverage_end_iso"))
+            if entry is None or not entry.get("sync_token") or coverage_end is None or coverage_end - now < self.horizon / 2:
+                return self._full_sync(connector, calendar_id, now)
+            try:
+                changes, sync_token = connector.list_event_changes(calendar_id, sync_token=entry["sync_token"])
+            except SyncTokenExpiredError:
+                return self._full_sync(connector, calendar_id, now)
+            events = entry["events"]
+            for event in changes:
+                if event.get("status") == "cancelled":
+                    events.pop(event.get("id"), None)
+                elif event.get("id"):
+                    events[event["id"]] = event
+            entry["sync_token"] = sync_token
+            self._prune(entry, now)
+            self._save()
+            self.incremental_syncs += 1
+            return len(changes)
+
+    def search_events(
+        self,
+        calendar_id: str,
+        time_min_iso: str,
+        time_max_iso: str,
+        query: str | None,
+        max_results: int,
+    ) -> list[dict] | None:
+        time_min, time_max = _parse_iso(time_min_iso), _parse_iso(time_max_iso)
+        with self._lock:
+            entry = self._state.get(calendar_id)
+            coverage_end = _parse_iso((entry or {}).get("coverage_end_iso"))
+            if entry is None or time_min is None or time_max is None or coverage_end is None or time_max > coverage_end:
+                return None
+            events = list(entry["events"].values())
+
+        terms = (query or "").casefold().split()
+        matches: list[tuple[datetime, dict]] = []
+        for event in events:
+            start, end = _parse_iso(event.get("start_iso")), _parse_iso(event.get("end_iso"))
+            if start is None or start >= time_max or (end or start) <= time_min:
+                continue
+            haystack = " ".join(
+                [str(event.get(key) or "") for key in ("title", "location", "description")] + list(event.get("attendees") or [])
+            ).casefold()
+            if all(term in haystack for term in terms):
+                matches.append((start, event))
+        matches.sort(key=lambda match: match[0])
+        return [{key: event.get(key) for key in _PUBLIC_FIELDS} for _, event in matches[:max_results]]
+
+    def events(
+        self,
+        connector: Any,
+        calendar_id: str,
+        time_min_iso: str,
+        time_max_iso: str,
+        query: str | None,
+        max_results: int,
+    ) -> list[dict] | None:
+        if not calendar_sync_enabled() or not hasattr(connector, "list_event_changes"):
+            return None
+        try:
+            self.sync(connector, calendar_id)
+        except Exception as exc:
+            logger.warning("calendar_sync_failed", extra={"extra_fields": {"calendar_id": calendar_id, "error": str(exc)}})
+            return None
+        return self.search_events(calendar_id, time_min_iso, time_max_iso, query, max_results)
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            calendars = {
+                calendar_id: {"events": len(entry.get("events", {})), "synced_iso": entry.get("synced_iso")}
+                for calendar_id, entry in self._state.items()
+            }
+        return {
+            "enabled": calendar_sync_enabled(),
+            "calendars": calendars,
+            "full_syncs": self.full_syncs,
+            "incremental_syncs": self.incremental_syncs,
+        }
+
+    def _full_sync(self, connector: Any, calendar_id: str, now: datetime) -> int:
+        time_min = now - timedelta(days=1)
+        coverage_end = now + self.horizon
+        changes, sync_token = connector.list_event_changes(
+            calendar_id,
+            time_min_iso=time_min.isoformat(),
+            time_max_iso=coverage_end.isoformat(),
+        )
+        entry = {
+            "sync_token": sync_token,
+            "coverage_end_iso": coverage_end.isoformat(),
+            "events": {event["id"]: event for event in changes if event.get("id") and event.get("status") != "cancelled"},
+        }
+        self._prune(entry, now)
+        self._state[calendar_id] = entry
+        self._save()
+        self.full_syncs += 1
+        return len(entry["events"])
+
+    @staticmethod
+    def _prune(entry: dict[str, Any], now: datetime) -> None:
+        cutoff = now - timedelta(days=1)
+        entry["events"] = {
+            event_id: event
+            for event_id, event in entry["events"].items()
+            if (_parse_iso(event.get("end_iso")) or _parse_iso(event.get("start_iso")) or now) >= cutoff
+        }
+        entry["synced_iso"] = now.isoformat()
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            return {}
+        return payload if isinstance(payload, dict) else {}
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self._state, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(self.path)
@@ -0,0 +1,543 @@
+from __future__ import annotations
+
+import base64
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable
+
+from benjamin.core.cache.gmail import GmailMessageCache
+from benjamin.core.infra.breaker_manager import BreakerManager
+from benjamin.core.integrations.gmail_query import parse_gmail_query
+from benjamin.core.integrations.google_calendar import GoogleCalendarConnector
+from benjamin.core.integrations.google_gmail import GoogleGmailConnector
+
+_SENDERS = (
+    "Billing <billing@example.com>",
+    "Dana Lee <dana@example.com>",
+    "CI Bot <ci@example.com>",
+    "Alex Kim <alex@example.com>",
+    "Newsletter <news@example.com>",
+    "Priya Shah <priya@example.com>",
+)
+_SUBJECTS = (
+    "Invoice {n} is due",
+    "Weekly status update {n}",
+    "Build {n} failed on main",
+    "Meeting notes: planning {n}",
+    "Lunch on Thursday?",
+    "Your order {n} has shipped",
+)
+_SNIPPETS = (
+    "Please review the attached details before Friday.",
+    "Quick summary of what changed this week.",
+    "The pipeline reported a failing test.",
+    "Following up on our conversation earlier.",
+)
+_CATEGORIES = ("CATEGORY_PERSONAL", "CATEGORY_UPDATES", "CATEGORY_PROMOTIONS", "CATEGORY_SOCIAL", "CATEGORY_FORUMS")
+_EVENT_TITLES = ("Standup", "Design review", "1:1 with Dana", "Customer call", "Planning", "Dentist", "Focus time")
+_LOCATIONS = ("Room 4A", "Video call", "Cafe", None)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _parse_iso(value: object) -> datetime | None:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class FakeGoogleApiError(RuntimeError):
+    def __init__(self, status: int, reason: str) -> None:
+        super().__init__(f"fake google api error {status}: {reason}")
+        self.resp = SimpleNamespace(status=status)
+
+
+class FaultInjector:
+    """Per-round-trip latency and error injection shared by the synthetic Google services."""
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0, seed: int = 0) -> None:
+        self.latency_ms = max(0.0, latency_ms)
+        self.jitter_ms = max(0.0, jitter_ms)
+        self.error_rate = min(1.0, max(0.0, error_rate))
+        self.round_trips = 0
+        self.errors = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> FaultInjector:
+        return cls(
+            latency_ms=_env_float("BENJAMIN_FAKE_GOOGLE_LATENCY_MS", 0.0),
+            jitter_ms=_env_float("BENJAMIN_FAKE_GOOGLE_JITTER_MS", 0.0),
+            error_rate=_env_float("BENJAMIN_FAKE_GOOGLE_ERROR_RATE", 0.0),
+            seed=_env_int("BENJAMIN_FAKE_GOOGLE_SEED", 0),
+        )
+
+    def round_trip(self) -> None:
+        with self._lock:
+            self.round_trips += 1
+            delay_ms = self.latency_ms + (self._random.uniform(0.0, self.jitter_ms) if self.jitter_ms else 0.0)
+        if delay_ms:
+            time.sleep(delay_ms / 1000.0)
+        self.maybe_fail()
+
+    def maybe_fail(self) -> None:
+        with self._lock:
+            failed = self.error_rate > 0 and self._random.random() < self.error_rate
+            self.errors += failed
+        if failed:
+            raise FakeGoogleApiError(503, "backendError")
+
+
+class _FakeRequest:
+    def __init__(self, faults: FaultInjector, fn: Callable[[], dict]) -> None:
+        self.faults = faults
+        self.fn = fn
+
+    def execute(self) -> dict:
+        self.faults.round_trip()
+        return self.fn()
+
+
+class _FakeBatch:
+    def __init__(self, faults: FaultInjector, callback: Callable[[str, dict | None, Exception | None], None]) -> None:
+        self.faults = faults
+        self.callback = callback
+        self.requests: list[tuple[str, _FakeRequest]] = []
+
+    def add(self, request: _FakeRequest, request_id: str) -> None:
+        self.requests.append((request_id, request))
+
+    def execute(self) -> None:
+        self.faults.round_trip()
+        for request_id, request in self.requests:
+            try:
+                self.faults.maybe_fail()
+                response = request.fn()
+            except Exception as exc:
+                self.callback(request_id, None, exc)
+            else:
+                self.callback(request_id, response, None)
+
+
+class SyntheticMailbox:
+    """Generated Gmail mailbox with a history log so incremental sync paths can be exercised."""
+
+    def __init__(self, message_count: int = 1000, seed: int = 0) -> None:
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self.messages: dict[str, dict] = {}
+        self.history: list[dict] = []
+        self.history_id = 1000
+        self.drafts: list[dict] = []
+        now = datetime.now(timezone.utc)
+        for index in range(max(0, message_count)):
+            self._add(now - timedelta(minutes=37 * (message_count - index)))
+        self.history.clear()
+
+    def deliver(self, count: int = 1) -> list[str]:
+        with self._lock:
+            return [self._add(datetime.now(timezone.utc))["id"] for _ in range(count)]
+
+    def search(self, query: str, max_results: int) -> list[dict]:
+        # Operators go through the shared parser; bare words search the body the way Gmail does.
+        tokens = re.findall(r'-?"[^"]*"|\S+', query or "")
+        operators = [token for token in tokens if ":" in token and not token.lstrip("-").startswith('"')]
+        words = [token.casefold() for token in tokens if token not in operators]
+        parsed = parse_gmail_query(" ".join(operators))
+        if any(word in {"or", "and"} or any(char in word for char in "(){}") for word in words):
+            parsed = None
+        terms = (query or "").casefold().split()
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            newest_first = sorted(self.messages.values(), key=lambda message: message["internalDate"], reverse=True)
+            matches: list[dict] = []
+            for message in newest_first:
+                view = message["_view"]
+                haystack = f"{view['from']} {view['subject']} {view['snippet']}".casefold()
+                if parsed is not None:
+                    matched = parsed.matches(view, now) and all(
+                        (word.lstrip("-").strip('"') in haystack) != word.startswith("-") for word in words
+                    )
+                else:
+                    matched = all(term in haystack for term in terms)
+                if matched:
+                    matches.append(message)
+                    if len(matches) >= max_results:
+                        break
+            return matches
+
+    def message(self, message_id: str, format_kind: str) -> dict:
+        with self._lock:
+            message = self.messages.get(message_id)
+            if message is None:
+                raise FakeGoogleApiError(404, "notFound")
+            if format_kind == "minimal":
+                return {key: message[key] for key in ("id", "threadId", "labelIds", "historyId")}
+            payload = dict(message["payload"])
+            if format_kind == "metadata":
+                payload = {"headers": payload["headers"]}
+            return {**{key: value for key, value in message.items() if key != "_view"}, "payload": payload}
+
+    def thread(self, thread_id: str, format_kind: str) -> dict:
+        with self._lock:
+            members = sorted(
+                (message for message in self.messages.values() if message["threadId"] == thread_id),
+                key=lambda message: message["internalDate"],
+            )
+            if not members:
+                raise FakeGoogleApiError(404, "notFound")
+            history_id = max(int(message["historyId"]) for message in members)
+            if format_kind == "minimal":
+                return {"id": thread_id, "historyId": str(history_id)}
+            return {
+                "id": thread_id,
+                "historyId": str(history_id),
+                "messages": [self.message(message["id"], "metadata") for message in members],
+            }
+
+    def history_since(self, start_history_id: str, page_token: str | None, max_results: int) -> dict:
+        with self._lock:
+            start = int(start_history_id)
+            oldest = int(self.history[0]["id"]) - 1 if self.history else self.history_id
+            if start < oldest:
+                raise FakeGoogleApiError(404, "historyId too old")
+            records = [record for record in self.history if int(record["id"]) > start]
+            offset = int(page_token or 0)
+            page = records[offset : offset + max_results]
+            response: dict[str, Any] = {"history": page, "historyId": str(self.history_id)}
+            if offset + max_results < len(records):
+                response["nextPageToken"] = str(offset + max_results)
+            return response
+
+    def add_draft(self, body: dict) -> dict:
+        with self._lock:
+            draft_id = f"d{len(self.drafts):06d}"
+            self.drafts.append({"id": draft_id, **body})
+            return {"id": draft_id, "message": {"id": f"dm{len(self.drafts):06d}"}}
+
+    def trim_history(self) -> None:
+        with self._lock:
+            self.history.clear()
+            self.history_id += 1
+
+    def _add(self, sent: datetime) -> dict:
+        index = len(self.messages)
+        sender = self._random.choice(_SENDERS)
+        subject = self._random.choice(_SUBJECTS).format(n=index)
+        snippet = self._random.choice(_SNIPPETS)
+        labels = ["INBOX", self._random.choice(_CATEGORIES)]
+        if self._random.random() < 0.3:
+            labels.append("UNREAD")
+        if self._random.random() < 0.1:
+            labels.append("IMPORTANT")
+        self.history_id += 1
+        message_id = f"m{index:06d}"
+        thread_id = f"t{index // 3:06d}"
+        body = base64.urlsafe_b64encode(f"{subject}\n\n{snippet}".encode("utf-8")).decode("utf-8")
+        message = {
+            "id": message_id,
+            "threadId": thread_id,
+            "labelIds": labels,
+            "snippet": snippet,
+            "historyId": str(self.history_id),
+            "internalDate": str(int(sent.timestamp() * 1000)),
+            "payload": {
+                "mimeType": "text/plain",
+                "headers": [
+                    {"name": "From", "value": sender},
+                    {"name": "To", "value": "me@example.com"},
+                    {"name": "Subject", "value": subject},
+                    {"name": "Date", "value": format_datetime(sent)},
+                ],
+                "body": {"data": body},
+            },
+            "_view": {"from": sender, "subject": subject, "snippet": snippet, "date_iso": sent.isoformat(), "label_ids": labels},
+        }
+        self.messages[message_id] = message
+        self.history.append(
+            {"id": str(self.history_id), "messagesAdded": [{"message": {"id": message_id, "threadId": thread_id, "labelIds": labels}}]}
+        )
+        return message
+
+
+class SyntheticGmailService:
+    """Duck-typed stand-in for the googleapiclient Gmail v1 resource."""
+
+    def __init__(self, mailbox: SyntheticMailbox, faults: FaultInjector) -> None:
+        self.mailbox = mailbox
+        self.faults = faults
+
+    def users(self) -> SyntheticGmailService:
+        return self
+
+    def messages(self) -> _GmailMessages:
+        return _GmailMessages(self)
+
+    def threads(self) -> _GmailThreads:
+        return _GmailThreads(self)
+
+    def history(self) -> _GmailHistory:
+        return _GmailHistory(self)
+
+    def drafts(self) -> _GmailDrafts:
+        return _GmailDrafts(self)
+
+    def getProfile(self, userId: str) -> _FakeRequest:
+        del userId
+        return _FakeRequest(
+            self.faults,
+            lambda: {"emailAddress": "me@example.com", "historyId": str(self.mailbox.history_id), "messagesTotal": len(self.mailbox.messages)},
+        )
+
+    def new_batch_http_request(self, callback: Callable[[str, dict | None, Exception | None], None]) -> _FakeBatch:
+        return _FakeBatch(self.faults, callback)
+
+
+class _GmailMessages:
+    def __init__(self, service: SyntheticGmailService) -> None:
+        self.service = service
+
+    def list(self, userId: str, q: str = "", maxResults: int = 100) -> _FakeRequest:
+        del userId
+        return _FakeRequest(
+            self.service.faults,
+            lambda: {"messages": [{"id": item["id"], "threadId": item["threadId"]} for item in self.service.mailbox.search(q, maxResults)]},
+        )
+
+    def get(self, userId: str, id: str, format: str = "full", fields: str | None = None) -> _FakeRequest:
+        del userId, fields
+        return _FakeRequest(self.service.faults, lambda: self.service.mailbox.message(id, format))
+
+
+class _GmailThreads:
+    def __init__(self, service: SyntheticGmailService) -> None:
+        self.service = service
+
+    def get(self, userId: str, id: str, format: str = "full", fields: str | None = None) -> _FakeRequest:
+        del userId, fields
+        return _FakeRequest(self.service.faults, lambda: self.service.mailbox.thread(id, format))
+
+
+class _GmailHistory:
+    def __init__(self, service: SyntheticGmailService) -> None:
+        self.service = service
+
+    def list(
+        self,
+        userId: str,
+        startHistoryId: str,
+        historyTypes: list[str] | None = None,
+        pageToken: str | None = None,
+        maxResults: int = 100,
+    ) -> _FakeRequest:
+        del userId, historyTypes
+        return _FakeRequest(self.service.faults, lambda: self.service.mailbox.history_since(startHistoryId, pageToken, maxResults))
+
+
+class _GmailDrafts:
+    def __init__(self, service: SyntheticGmailService) -> None:
+        self.service = service
+
+    def create(self, userId: str, body: dict) -> _FakeRequest:
+        del userId
+
+        return _FakeRequest(self.service.faults, lambda: self.service.mailbox.add_draft(body))
+
+
+class SyntheticCalendar:
+    """Generated calendar with a change log that honours sync tokens."""
+
+    def __init__(self, event_count: int = 200, seed: int = 0, horizon_days: int = 30) -> None:
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self.events: dict[str, dict] = {}
+        self.changes: list[tuple[int, str]] = []
+        self.version = 0
+        now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        for _ in range(max(0, event_count)):
+            start = now + timedelta(hours=self._random.randint(-24, horizon_days * 24))
+            self.add_event(self._random.choice(_EVENT_TITLES), start, self._random.choice((15, 30, 60)))
+        self.changes.clear()
+
+    def add_event(self, title: str, start: datetime, duration_minutes: int = 30, location: str | None = None) -> dict:
+        with self._lock:
+            event_id = f"ev{len(self.events):06d}"
+            event = {
+                "id": event_id,
+                "status": "confirmed",
+                "summary": title,
+                "location": location if location is not None else self._random.choice(_LOCATIONS),
+                "start": {"dateTime": start.isoformat()},
+                "end": {"dateTime": (start + timedelta(minutes=duration_minutes)).isoformat()},
+                "attendees": [{"email": f"guest{index}@example.com"} for index in range(self._random.randint(0, 4))],
+            }
+            if event["location"] is None:
+                del event["location"]
+            self._record(event)
+            return event
+
+    def cancel_event(self, event_id: str) -> None:
+        with self._lock:
+            event = self.events.get(event_id)
+            if event is not None:
+                self._record({**event, "status": "cancelled"})
+
+    def expire_sync_tokens(self) -> None:
+        with self._lock:
+            self.changes.clear()
+            self.version += 1
+
+    def list(self, params: dict) -> dict:
+        with self._lock:
+            max_results = int(params.get("maxResults") or 250)
+            offset = int(params.get("pageToken") or 0)
+            sync_token = params.get("syncToken")
+            if sync_token is not None:
+                since = int(sync_token) if str(sync_token).isdigit() else -1
+                oldest = self.changes[0][0] - 1 if self.changes else self.version
+                if since < oldest:
+                    raise FakeGoogleApiError(410, "fullSyncRequired")
+                changed_ids = list(dict.fromkeys(event_id for version, event_id in self.changes if version > since))
+                items = [self.events[event_id] for event_id in changed_ids]
+            else:
+                items = self._window(params)
+            page = items[offset : offset + max_results]
+            response: dict[str, Any] = {"items": [dict(item) for item in page]}
+            if offset + max_results < len(items):
+                response["nextPageToken"] = str(offset + max_results)
+            elif not params.get("q") and not params.get("orderBy"):
+                response["nextSyncToken"] = str(self.version)
+            return response
+
+    def _window(self, params: dict) -> list[dict]:
+        time_min, time_max = _parse_iso(params.get("timeMin")), _parse_iso(params.get("timeMax"))
+        terms = str(params.get("q") or "").casefold().split()
+        items: list[dict] = []
+        for event in self.events.values():
+            if event["status"] == "cancelled":
+                continue
+            start, end = _parse_iso(event["start"]["dateTime"]), _parse_iso(event["end"]["dateTime"])
+            if time_min is not None and end is not None and end <= time_min:
+                continue
+            if time_max is not None and start is not None and start >= time_max:
+                continue
+            haystack = " ".join([event["summary"], event.get("location", "")] + [guest["email"] for guest in event["attendees"]]).casefold()
+            if all(term in haystack for term in terms):
+                items.append(event)
+        items.sort(key=lambda event: event["start"]["dateTime"])
+        return items
+
+    def _record(self, event: dict) -> None:
+        self.version += 1
+        self.events[event["id"]] = event
+        self.changes.append((self.version, event["id"]))
+
+
+class SyntheticCalendarService:
+    """Duck-typed stand-in for the googleapiclient Calendar v3 resource."""
+
+    def __init__(self, calendar: SyntheticCalendar, faults: FaultInjector) -> None:
+        self.calendar = calendar
+        self.faults = faults
+
+    def events(self) -> SyntheticCalendarService:
+        return self
+
+    def list(self, **params: Any) -> _FakeRequest:
+        return _FakeRequest(self.faults, lambda: self.calendar.list(params))
+
+    def insert(self, calendarId: str, body: dict, fields: str | None = None) -> _FakeRequest:
+        del calendarId, fields
+
+        def _insert() -> dict:
+            start = _parse_iso(body["start"]["dateTime"]) or datetime.now(timezone.utc)
+            end = _parse_iso(body["end"]["dateTime"]) or start
+            event = self.calendar.add_event(body.get("summary", "(untitled)"), start, int((end - start).total_seconds() // 60), body.get("location"))
+            return {**event, "htmlLink": f"https://calendar.example.com/event/{event['id']}"}
+
+        return _FakeRequest(self.faults, _insert)
+
+
+class FakeEmailConnector(GoogleGmailConnector):
+    def __init__(
+        self,
+        mailbox: SyntheticMailbox | None = None,
+        faults: FaultInjector | None = None,
+        breaker_manager: BreakerManager | None = None,
+        cache: GmailMessageCache | None = None,
+    ) -> None:
+        self.mailbox = mailbox or SyntheticMailbox()
+        self.faults = faults or FaultInjector()
+        super().__init__(
+            token_path="",
+            breaker_manager=breaker_manager,
+            cache=cache,
+            service=SyntheticGmailService(self.mailbox, self.faults),
+        )
+
+
+class FakeCalendarConnector(GoogleCalendarConnector):
+    def __init__(
+        self,
+        calendar: SyntheticCalendar | None = None,
+        faults: FaultInjector | None = None,
+        breaker_manager: BreakerManager | None = None,
+    ) -> None:
+        self.calendar = calendar or SyntheticCalendar()
+        self.faults = faults or FaultInjector()
+        super().__init__(token_path="", breaker_manager=breaker_manager, service=SyntheticCalendarService(self.calendar, self.faults))
+
+
+_backends: dict[Path, tuple[SyntheticMailbox, SyntheticCalendar, FaultInjector]] = {}
+_backends_lock = threading.Lock()
+
+
+def fake_backend(state_dir: Path | str) -> tuple[SyntheticMailbox, SyntheticCalendar, FaultInjector]:
+    resolved = Path(state_dir).expanduser()
+    with _backends_lock:
+        backend = _backends.get(resolved)
+        if backend is None:
+            seed = _env_int("BENJAMIN_FAKE_GOOGLE_SEED", 0)
+            backend = (
+                SyntheticMailbox(message_count=_env_int("BENJAMIN_FAKE_GOOGLE_MESSAGES", 1000), seed=seed),
+                SyntheticCalendar(event_count=_env_int("BENJAMIN_FAKE_GOOGLE_EVENTS", 200), seed=seed),
+                FaultInjector.from_env(),
+            )
+            _backends[resolved] = backend
+        return backend
+
+
+def build_fake_connectors(
+    state_dir: Path | str,
+    breaker_manager: BreakerManager | None = None,
+    cache: GmailMessageCache | None = None,
+) -> tuple[FakeCalendarConnector, FakeEmailConnector]:
+    mailbox, calendar, faults = fake_backend(state_dir)
+    return (
+        FakeCalendarConnector(calendar=calendar, faults=faults, breaker_manager=breaker_manager),
+        FakeEmailConnector(mailbox=mailbox, faults=faults, breaker_manager=breaker_manager, cache=cache),
+    )
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+_TOKEN = re.compile(r'(-?)(?:([A-Za-z_]+):("[^"]*"|\S+)|("[^"]*")|(\S+))')
+_SYSTEM_LABELS = {
+    "inbox": "INBOX",
+    "spam": "SPAM",
+    "trash": "TRASH",
+    "unread": "UNREAD",
+    "starred": "STARRED",
+    "important": "IMPORTANT",
+    "sent": "SENT",
+    "draft": "DRAFT",
+    "drafts": "DRAFT",
+}
+_CATEGORIES = {
+    "primary": "CATEGORY_PERSONAL",
+    "social": "CATEGORY_SOCIAL",
+    "promotions": "CATEGORY_PROMOTIONS",
+    "updates": "CATEGORY_UPDATES",
+    "forums": "CATEGORY_FORUMS",
+}
+
+
+@dataclass(frozen=True)
+class _Term:
+    field: str
+    value: str
+    negated: bool
+
+
+@dataclass(frozen=True)
+class GmailQuery:
+    terms: tuple[_Term, ...]
+    include_spam_trash: bool
+
+    def matches(self, message: dict, now: datetime | None = None) -> bool:
+        labels = set(message.get("label_ids") or [])
+        if not self.include_spam_trash and labels & {"SPAM", "TRASH"}:
+            return False
+        current = now or datetime.now(timezone.utc)
+        return all(self._term_matches(term, message, labels, current) != term.negated for term in self.terms)
+
+    @staticmethod
+    def _term_matches(term: _Term, message: dict, labels: set[str], now: datetime) -> bool:
+        if term.field == "label":
+            return term.value in labels
+        if term.field == "not_label":
+            return term.value not in labels
+        if term.field in {"newer_than", "older_than"}:
+            sent = _parse_iso(message.get("date_iso"))
+            if sent is None:
+                return False
+            cutoff = now - timedelta(days=int(term.value))
+            return sent >= cutoff if term.field == "newer_than" else sent < cutoff
+        # Gmail matches from:/subject: on whole words, not substrings.
+        pattern = rf"(?<!\w){re.escape(term.value)}(?!\w)"
+        return re.search(pattern, str(message.get(term.field) or "").casefold()) is not None
+
+
+def parse_gmail_query(query: str) -> GmailQuery | None:
+    """Parse the subset of Gmail search syntax that can be evaluated exactly from headers; None otherwise.
+
+    Bare words and phrases also search message bodies on Gmail, which the local mirror does not hold,
+    so they return None and callers fall back to a live search.
+    """
+    terms: list[_Term] = []
+    include_spam_trash = False
+    for match in _TOKEN.finditer(query.strip()):
+        negated = match.group(1) == "-"
+        operator, operand = match.group(2), match.group(3)
+        if operator is None:
+            return None
+
+        operator = operator.casefold()
+        value = operand.strip('"').casefold()
+        if operator in {"from", "subject"}:
+            if not value or any(char in value for char in "(){}*"):
+                return None
+            terms.append(_Term(operator, value, negated))
+        elif operator in {"label", "in"}:
+            if value == "anywhere":
+                include_spam_trash = True
+                continue
+            label = _SYSTEM_LABELS.get(value)
+            if label is None:
+                return None
+            include_spam_trash = include_spam_trash or label in {"SPAM", "TRASH"}
+            terms.append(_Term("label", label, negated))
+        elif operator == "is":
+            if value == "read":
+                terms.append(_Term("not_label", "UNREAD", negated))
+            elif value in {"unread", "starred", "important"}:
+                terms.append(_Term("label", _SYSTEM_LABELS[value], negated))
+            else:
+                return None
+        elif operator == "category":
+            label = _CATEGORIES.get(value)
+            if label is None:
+                return None
+            terms.append(_Term("label", label, negated))
+        elif operator in {"newer_than", "older_than"}:
+            # Months and years follow Gmail's calendar arithmetic; only day offsets are evaluated locally.
+            age = re.fullmatch(r"(\d+)d", value)
+            if age is None:
+                return None
+            terms.append(_Term(operator, age.group(1), negated))
+        else:
+            return None
+    return GmailQuery(terms=tuple(terms), include_spam_trash=include_spam_trash)
+
+
+def _parse_iso(value: object) -> datetime | None:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
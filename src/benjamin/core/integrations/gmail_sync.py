@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from .gmail_query import parse_gmail_query
+
+
+class HistoryExpiredError(RuntimeError):
+    def __init__(self, history_id: str) -> None:
+        super().__init__(f"gmail history {history_id} is no longer available")
+        self.history_id = history_id
+
+
+def gmail_sync_mode() -> str:
+    mode = os.getenv("BENJAMIN_GMAIL_SYNC_MODE", "poll").strip().casefold()
+    return mode if mode in {"poll", "history"} else "poll"
+
+
+class GmailHistorySync:
+    def __init__(self, connector: Any, state_dir: Path, max_messages: int | None = None, bootstrap_query: str | None = None) -> None:
+        self.connector = connector
+        self.path = state_dir / "gmail_sync.json"
+        if max_messages is None:
+            try:
+                max_messages = int(os.getenv("BENJAMIN_GMAIL_SYNC_MAX_MESSAGES", "500"))
+            except ValueError:
+                max_messages = 500
+        self.max_messages = max(1, max_messages)
+        self.bootstrap_query = bootstrap_query or os.getenv("BENJAMIN_GMAIL_SYNC_BOOTSTRAP_QUERY", "newer_than:7d")
+        self._lock = threading.Lock()
+        self._state = self._load()
+        self.bootstraps = 0
+        self.last_added = 0
+
+    @property
+    def history_id(self) -> str | None:
+        return self._state.get("history_id")
+
+    def sync(self) -> int:
+        with self._lock:
+            history_id = self._state.get("history_id")
+            if not history_id:
+                return self._bootstrap()
+            try:
+                records, latest = self.connector.history_since(history_id)
+            except HistoryExpiredError:
+                return self._bootstrap()
+            added = self._apply(records)
+            self._state["history_id"] = latest
+            self._save()
+            self.last_added = added
+            return added
+
+    def search(self, query: str, max_results: int) -> list[dict] | None:
+        parsed = parse_gmail_query(query)
+        if parsed is None or not self._state.get("history_id"):
+            return None
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            messages = list(self._state.get("messages", []))
+        matches: list[dict] = []
+        for message in messages:
+            if parsed.matches(message, now):
+                matches.append({key: value for key, value in message.items() if key != "label_ids"})
+                if len(matches) >= max_results:
+                    break
+        return matches
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "mode": gmail_sync_mode(),
+            "history_id": self._state.get("history_id"),
+            "messages": len(self._state.get("messages", [])),
+            "synced_iso": self._state.get("synced_iso"),
+            "last_added": self.last_added,
+            "bootstraps": self.bootstraps,
+        }
+
+    def _bootstrap(self) -> int:
+        history_id = self.connector.current_history_id()
+        refs = self.connector.list_message_refs(self.bootstrap_query, self.max_messages)
+        messages = self._hydrate(refs)
+        self._state = {"history_id": history_id, "messages": []}
+        self._store(messages)
+        self._save()
+        self.bootstraps += 1
+        self.last_added = len(messages)
+        return len(messages)
+
+    def _apply(self, records: list[dict]) -> int:
+        by_id = {message["id"]: message for message in self._state.get("messages", [])}
+        added: dict[str, dict] = {}
+        for record in records:
+            for entry in record.get("messagesAdded", []):
+                message = entry.get("message", {})
+                if message.get("id") and message["id"] not in by_id:
+                    added[message["id"]] = message
+            for entry in record.get("messagesDeleted", []):
+                message_id = entry.get("message", {}).get("id")
+                by_id.pop(message_id, None)
+                added.pop(message_id, None)
+            for key in ("labelsAdded", "labelsRemoved"):
+                for entry in record.get(key, []):
+                    message = entry.get("message", {})
+                    message_id, labels = message.get("id"), message.get("labelIds")
+                    if labels is None:
+                        continue
+                    if message_id in added:
+                        added[message_id]["labelIds"] = list(labels)
+                    elif message_id in by_id:
+                        by_id[message_id]["label_ids"] = list(labels)
+
+        self._state["messages"] = list(by_id.values())
+        self._store(self._hydrate(list(added.values())))
+        return len(added)
+
+    def _hydrate(self, refs: list[dict]) -> list[dict]:
+        if not refs:
+            return []
+        hydrated = self.connector.messages_metadata([ref["id"] for ref in refs])
+        return [{**message, "label_ids": list(ref.get("labelIds") or [])} for ref, message in zip(refs, hydrated)]
+
+    def _store(self, messages: list[dict]) -> None:
+        merged = {message["id"]: message for message in self._state.get("messages", [])}
+        merged.update({message["id"]: message for message in messages if message.get("id")})
+        ordered = sorted(merged.values(), key=lambda message: message.get("date_iso") or "", reverse=True)
+        self._state["messages"] = ordered[: self.max_messages]
+        self._state["synced_iso"] = datetime.now(timezone.utc).isoformat()
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            return {}
+        return payload if isinstance(payload, dict) else {}
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self._state, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(self.path)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 
@@ -11,6 +12,11 @@ class GoogleTokenError(RuntimeError):
     pass
 
 
+def google_mode() -> str:
+    mode = os.getenv("BENJAMIN_GOOGLE_ENABLED", "off").strip().casefold()
+    return mode if mode in {"on", "fake"} else "off"
+
+
 def build_google_service(service_name: str, version: str, token_path: str):
     try:
         from google.oauth2.credentials import Credentials
@@ -1,13 +1,43 @@
 from __future__ import annotations
 
+import threading
+from datetime import datetime, timezone
+
+from benjamin.core.cache.singleflight import SingleFlight, singleflight_key
 from benjamin.core.infra.breaker_manager import BreakerManager
+from benjamin.core.integrations.calendar_sync import SyncTokenExpiredError
 from benjamin.core.integrations.google_auth import build_google_service
 
 
+def _minute_key(value: str) -> str:
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return value
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).replace(second=0, microsecond=0).isoformat()
+
+
+def _normalize_event(item: dict) -> dict:
+    start = item.get("start", {})
+    end = item.get("end", {})
+    return {
+        "id": item.get("id"),
+        "title": item.get("summary", "(untitled)"),
+        "start_iso": start.get("dateTime") or start.get("date"),
+        "end_iso": end.get("dateTime") or end.get("date"),
+        "location": item.get("location"),
+        "attendees_count": len(item.get("attendees", [])),
+    }
+
+
 class GoogleCalendarConnector:
-    def __init__(self, token_path: str, breaker_manager: BreakerManager | None = None) -> None:
-        self.service = build_google_service("calendar", "v3", token_path)
+    def __init__(self, token_path: str, breaker_manager: BreakerManager | None = None, service=None) -> None:
+        self.service = service if service is not None else build_google_service("calendar", "v3", token_path)
         self.breaker_manager = breaker_manager
+        self._flights = SingleFlight()
+        self._service_lock = threading.Lock()
 
     def search_events(
         self,
@@ -18,9 +48,8 @@ class GoogleCalendarConnector:
         max_results: int,
     ) -> list[dict]:
         def _call() -> list[dict]:
-            response = (
-                self.service.events()
-                .list(
+            response = self._execute(
+                self.service.events().list(
                     calendarId=calendar_id,
                     q=query,
                     timeMin=time_min_iso,
@@ -29,25 +58,55 @@ class GoogleCalendarConnector:
                     singleEvents=True,
                     orderBy="startTime",
                 )
-                .execute()
             )
-            events = []
-            for item in response.get("items", []):
-                start = item.get("start", {})
-                end = item.get("end", {})
-                events.append(
-                    {
-                        "id": item.get("id"),
-                        "title": item.get("summary", "(untitled)"),
-                        "start_iso": start.get("dateTime") or start.get("date"),
-                        "end_iso": end.get("dateTime") or end.get("date"),
-                        "location": item.get("location"),
-                        "attendees_count": len(item.get("attendees", [])),
-                    }
-                )
-            return events
+            return [_normalize_event(item) for item in response.get("items", [])]
 
-        return self._guarded(_call)
+        key = singleflight_key(
+            "calendar.search_events",
+            calendar_id,
+            _minute_key(time_min_iso),
+            _minute_key(time_max_iso),
+            query,
+            max_results,
+        )
+        return self._flights.do(key, lambda: self._guarded(_call))
+
+    def list_event_changes(
+        self,
+        calendar_id: str,
+        sync_token: str | None = None,
+        time_min_iso: str | None = None,
+        time_max_iso: str | None = None,
+    ) -> tuple[list[dict], str]:
+        def _call() -> tuple[list[dict], str] | None:
+            events: list[dict] = []
+            page_token: str | None = None
+            while True:
+                params: dict = {"calendarId": calendar_id, "singleEvents": True, "maxResults": 250, "pageToken": page_token}
+                if sync_token:
+                    params["syncToken"] = sync_token
+                else:
+                    params.update(timeMin=time_min_iso, timeMax=time_max_iso)
+                try:
+                    response = self._execute(self.service.events().list(**params))
+                except Exception as exc:
+                    if getattr(getattr(exc, "resp", None), "status", None) == 410:
+                        return None
+                    raise
+                for item in response.get("items", []):
+                    event = _normalize_event(item)
+                    event["status"] = item.get("status")
+                    event["description"] = item.get("description")
+                    event["attendees"] = [attendee.get("email", "") for attendee in item.get("attendees", [])]
+                    events.append(event)
+                page_token = response.get("nextPageToken")
+                if not page_token:
+                    return events, str(response.get("nextSyncToken") or "")
+
+        result = self._guarded(_call)
+        if result is None:
+            raise SyncTokenExpiredError(calendar_id)
+        return result
 
     def create_event(
         self,
@@ -73,10 +132,8 @@ class GoogleCalendarConnector:
             if attendees:
                 body["attendees"] = [{"email": email} for email in attendees]
 
-            response = (
-                self.service.events()
-                .insert(calendarId=calendar_id, body=body, fields="id,summary,start,end,htmlLink")
-                .execute()
+            response = self._execute(
+                self.service.events().insert(calendarId=calendar_id, body=body, fields="id,summary,start,end,htmlLink")
             )
             start = response.get("start", {})
             end = response.get("end", {})
@@ -93,6 +150,11 @@ class GoogleCalendarConnector:
         except Exception as exc:  # pragma: no cover
             raise RuntimeError(f"google_calendar_create_event_failed: {exc}") from exc
 
+    def _execute(self, request):
+        # The discovery client's httplib2 transport is not thread-safe; rules fetch triggers concurrently.
+        with self._service_lock:
+            return request.execute()
+
     def _guarded(self, fn):
         if self.breaker_manager is None:
             return fn()
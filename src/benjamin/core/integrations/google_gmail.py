@@ -1,60 +1,152 @@
 from __future__ import annotations
 
 import base64
+import os
+import threading
 from datetime import datetime, timezone
 from email.message import EmailMessage
 from email.utils import parsedate_to_datetime
 
+from benjamin.core.cache.gmail import GmailMessageCache
+from benjamin.core.cache.singleflight import SingleFlight, singleflight_key
 from benjamin.core.infra.breaker_manager import BreakerManager
+from benjamin.core.integrations.gmail_sync import HistoryExpiredError
 from benjamin.core.integrations.google_auth import build_google_service
 
 
+def _batch_size() -> int:
+    try:
+        value = int(os.getenv("BENJAMIN_GMAIL_BATCH_SIZE", "50"))
+    except ValueError:
+        value = 50
+    return max(1, min(100, value))
+
+
 class GoogleGmailConnector:
-    def __init__(self, token_path: str, breaker_manager: BreakerManager | None = None) -> None:
-        self.service = build_google_service("gmail", "v1", token_path)
+    def __init__(
+        self,
+        token_path: str,
+        breaker_manager: BreakerManager | None = None,
+        cache: GmailMessageCache | None = None,
+        service=None,
+    ) -> None:
+        self.service = service if service is not None else build_google_service("gmail", "v1", token_path)
         self.breaker_manager = breaker_manager
+        self.cache = cache
+        self.batch_size = _batch_size()
+        self._flights = SingleFlight()
+        self._service_lock = threading.Lock()
 
     def search_messages(self, query: str, max_results: int) -> list[dict]:
         def _call() -> list[dict]:
-            response = self.service.users().messages().list(userId="me", q=query, maxResults=max_results).execute()
-            out: list[dict] = []
-            for item in response.get("messages", []):
-                out.append(self._normalize_message(item["id"]))
-            return out
+            response = self._execute(self.service.users().messages().list(userId="me", q=query, maxResults=max_results))
+            return self._hydrate_messages([item["id"] for item in response.get("messages", [])])
 
-        return self._guarded(_call)
+        key = singleflight_key("gmail.search_messages", query, max_results)
+        return self._flights.do(key, lambda: self._guarded(_call))
 
     def read_message(self, message_id: str) -> dict:
-        return self._guarded(lambda: self._normalize_message(message_id, include_body=True))
+        def _call() -> dict:
+            message = self._execute(self.service.users().messages().get(userId="me", id=message_id, format="full"))
+            return self._normalize_message(message, include_body=True)
+
+        def _cached() -> dict:
+            if self.cache is not None:
+                cached = self.cache.get_message(message_id, "full")
+                if cached is not None:
+                    return cached
+            payload = self._guarded(_call)
+            if self.cache is not None:
+                self.cache.put_message(message_id, "full", payload)
+            return payload
+
+        key = singleflight_key("gmail.read_message", message_id)
+        return self._flights.do(key, _cached)
 
     def thread_summary(self, thread_id: str, max_messages: int = 10) -> dict:
-        def _call() -> dict:
-            thread = self.service.users().threads().get(userId="me", id=thread_id, format="metadata").execute()
-            messages = thread.get("messages", [])[:max_messages]
-            participants: set[str] = set()
-            snippets: list[str] = []
-            subject = ""
-            for msg in messages:
-                headers = self._headers_map(msg.get("payload", {}).get("headers", []))
-                if headers.get("From"):
-                    participants.add(headers["From"])
-                if headers.get("To"):
-                    participants.add(headers["To"])
-                if not subject:
-                    subject = headers.get("Subject", "")
-                snippet = msg.get("snippet")
-                if snippet:
-                    snippets.append(snippet)
+        return self.thread_summaries([thread_id], max_messages=max_messages)[0]
 
-            return {
-                "thread_id": thread_id,
-                "subject": subject,
-                "participants": sorted(participants),
-                "snippets": snippets,
-            }
+    def thread_summaries(self, thread_ids: list[str], max_messages: int = 10) -> list[dict]:
+        def _call() -> list[dict]:
+            summaries: dict[str, dict] = {}
+            pending = list(dict.fromkeys(thread_ids))
+            if self.cache is not None:
+                known = [thread_id for thread_id in pending if self.cache.has_thread(thread_id, max_messages)]
+                if known:
+                    current = self._execute_batch(
+                        [
+                            self.service.users().threads().get(userId="me", id=thread_id, format="minimal", fields="id,historyId")
+                            for thread_id in known
+                        ]
+                    )
+                    for thread_id, thread in zip(known, current):
+                        cached = self.cache.get_thread(thread_id, max_messages, thread.get("historyId"))
+                        if cached is not None:
+                            summaries[thread_id] = cached
+                pending = [thread_id for thread_id in pending if thread_id not in summaries]
+
+            threads = self._execute_batch(
+                [self.service.users().threads().get(userId="me", id=thread_id, format="metadata") for thread_id in pending]
+            )
+            for thread_id, thread in zip(pending, threads):
+                summaries[thread_id] = self._summarize_thread(thread_id, thread, max_messages)
+                if self.cache is not None:
+                    self.cache.put_thread(thread_id, max_messages, thread.get("historyId"), summaries[thread_id])
+            return [summaries[thread_id] for thread_id in thread_ids]
+
+        key = singleflight_key("gmail.thread_summaries", tuple(thread_ids), max_messages)
+        return self._flights.do(key, lambda: self._guarded(_call))
+
+    def messages_metadata(self, message_ids: list[str]) -> list[dict]:
+        return self._guarded(lambda: self._hydrate_messages(message_ids))
+
+    def list_message_refs(self, query: str, max_results: int) -> list[dict]:
+        def _call() -> list[dict]:
+            response = self._execute(self.service.users().messages().list(userId="me", q=query, maxResults=max_results))
+            refs = [item["id"] for item in response.get("messages", [])]
+            labels = self._execute_batch(
+                [
+                    self.service.users().messages().get(userId="me", id=message_id, format="minimal", fields="id,labelIds")
+                    for message_id in refs
+                ]
+            )
+            return [{"id": message_id, "labelIds": item.get("labelIds", [])} for message_id, item in zip(refs, labels)]
 
         return self._guarded(_call)
 
+    def current_history_id(self) -> str:
+        return self._guarded(lambda: str(self._execute(self.service.users().getProfile(userId="me")).get("historyId") or ""))
+
+    def history_since(self, history_id: str) -> tuple[list[dict], str]:
+        def _call() -> tuple[list[dict], str] | None:
+            records: list[dict] = []
+            latest = history_id
+            page_token: str | None = None
+            while True:
+                request = self.service.users().history().list(
+                    userId="me",
+                    startHistoryId=history_id,
+                    historyTypes=["messageAdded", "messageDeleted", "labelAdded", "labelRemoved"],
+                    pageToken=page_token,
+                    maxResults=500,
+                )
+                try:
+                    response = self._execute(request)
+                except Exception as exc:
+                    if getattr(getattr(exc, "resp", None), "status", None) == 404:
+                        return None
+                    raise
+                records.extend(response.get("history", []))
+                latest = str(response.get("historyId") or latest)
+                page_token = response.get("nextPageToken")
+                if not page_token:
+                    return records, latest
+
+        result = self._guarded(_call)
+        if result is None:
+            raise HistoryExpiredError(history_id)
+        return result
+
     def create_draft(
         self,
         to: list[str],
@@ -99,9 +191,76 @@ class GoogleGmailConnector:
             return fn()
         return self.breaker_manager.wrap("gmail", fn)
 
-    def _normalize_message(self, message_id: str, include_body: bool = False) -> dict:
-        format_kind = "full" if include_body else "metadata"
-        message = self.service.users().messages().get(userId="me", id=message_id, format=format_kind).execute()
+    def _hydrate_messages(self, message_ids: list[str]) -> list[dict]:
+        hydrated: dict[str, dict] = {}
+        if self.cache is not None:
+            for message_id in message_ids:
+                cached = self.cache.get_message(message_id, "metadata")
+                if cached is not None:
+                    hydrated[message_id] = cached
+        missing = [message_id for message_id in dict.fromkeys(message_ids) if message_id not in hydrated]
+        messages = self._execute_batch(
+            [self.service.users().messages().get(userId="me", id=message_id, format="metadata") for message_id in missing]
+        )
+        for message_id, message in zip(missing, messages):
+            hydrated[message_id] = self._normalize_message(message)
+            if self.cache is not None:
+                self.cache.put_message(message_id, "metadata", hydrated[message_id])
+        return [hydrated[message_id] for message_id in message_ids]
+
+    def _execute(self, request):
+        with self._service_lock:
+            return request.execute()
+
+    def _execute_batch(self, requests: list) -> list[dict]:
+        results: dict[str, dict] = {}
+        failed: list[str] = []
+
+        def _collect(request_id: str, response: dict, exception: Exception | None) -> None:
+            if exception is None:
+                results[request_id] = response
+            else:
+                failed.append(request_id)
+
+        for start in range(0, len(requests), self.batch_size):
+            chunk = requests[start : start + self.batch_size]
+            if len(chunk) == 1:
+                results[str(start)] = self._execute(chunk[0])
+                continue
+            batch = self.service.new_batch_http_request(callback=_collect)
+            for offset, request in enumerate(chunk):
+                batch.add(request, request_id=str(start + offset))
+            self._execute(batch)
+
+        for request_id in failed:
+            results[request_id] = self._execute(requests[int(request_id)])
+        return [results[str(index)] for index in range(len(requests))]
+
+    def _summarize_thread(self, thread_id: str, thread: dict, max_messages: int) -> dict:
+        messages = thread.get("messages", [])[:max_messages]
+        participants: set[str] = set()
+        snippets: list[str] = []
+        subject = ""
+        for msg in messages:
+            headers = self._headers_map(msg.get("payload", {}).get("headers", []))
+            if headers.get("From"):
+                participants.add(headers["From"])
+            if headers.get("To"):
+                participants.add(headers["To"])
+            if not subject:
+                subject = headers.get("Subject", "")
+            snippet = msg.get("snippet")
+            if snippet:
+                snippets.append(snippet)
+
+        return {
+            "thread_id": thread_id,
+            "subject": subject,
+            "participants": sorted(participants),
+            "snippets": snippets,
+        }
+
+    def _normalize_message(self, message: dict, include_body: bool = False) -> dict:
         headers = self._headers_map(message.get("payload", {}).get("headers", []))
 
         date_iso = self._to_iso(headers.get("Date"))
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Iterator
 
 from benjamin.core.ledger.schemas import LedgerRecord
+from benjamin.core.scheduler.leader import ensure_fresh_token
 
 
 class ExecutionLedger:
@@ -30,8 +31,12 @@ class ExecutionLedger:
         kind: str,
         correlation_id: str | None = None,
         meta: dict | None = None,
+        fencing_token: int | None = None,
     ) -> bool:
         with self._file_lock():
+            ensure_fresh_token(self.state_dir, fencing_token)
+            if fencing_token is not None:
+                meta = {**(meta or {}), "fencing_token": fencing_token}
             latest = self._latest_record_by_key().get(key)
             if latest is not None and latest.status in {"succeeded", "started"}:
                 return False
@@ -49,9 +54,20 @@ class ExecutionLedger:
             self.trim(self.max_records)
             return True
 
-    def mark(self, key: str, status: str, meta_update: dict | None = None) -> None:
+    def mark(
+        self,
+        key: str,
+        status: str,
+        meta_update: dict | None = None,
+        fencing_token: int | None = None,
+        if_correlation_id: str | None = None,
+    ) -> bool:
+        """Append a status for key; with if_correlation_id, only while that run still owns the key."""
         with self._file_lock():
+            ensure_fresh_token(self.state_dir, fencing_token)
             latest = self._latest_record_by_key().get(key)
+            if if_correlation_id is not None and (latest is None or latest.correlation_id != if_correlation_id):
+                return False
             kind = latest.kind if latest is not None else "job_run"
             correlation_id = latest.correlation_id if latest is not None else None
             merged_meta: dict = dict(latest.meta) if latest is not None else {}
@@ -68,6 +84,7 @@ class ExecutionLedger:
                 )
             )
             self.trim(self.max_records)
+            return True
 
     def list_recent(self, limit: int = 50) -> list[LedgerRecord]:
         records = self._read_all_records()
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+PRIORITIES = ("interactive", "rule", "maintenance")
+
+_priority_var: ContextVar[str] = ContextVar("benjamin_llm_priority", default="interactive")
+
+
+class LLMDispatchRejected(RuntimeError):
+    def __init__(self, priority: str, reason: str) -> None:
+        self.priority = priority
+        self.reason = reason
+        super().__init__(f"llm_dispatch_rejected:{priority}:{reason}")
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+def normalize_priority(priority: str | None) -> str:
+    value = (priority or "").strip().casefold()
+    return value if value in PRIORITIES else "interactive"
+
+
+def current_llm_priority() -> str:
+    return _priority_var.get()
+
+
+@contextmanager
+def llm_priority(priority: str) -> Iterator[None]:
+    token = _priority_var.set(normalize_priority(priority))
+    try:
+        yield
+    finally:
+        _priority_var.reset(token)
+
+
+class LLMDispatcher:
+    def __init__(
+        self,
+        max_in_flight: int = 4,
+        token_budgets: dict[str, int] | None = None,
+        budget_window_s: float = 60.0,
+        queue_timeout_s: float = 30.0,
+    ) -> None:
+        self.max_in_flight = max(1, max_in_flight)
+        self.token_budgets = {name: max(0, value) for name, value in (token_budgets or {}).items()}
+        self.budget_window_s = max(1.0, budget_window_s)
+        self.queue_timeout_s = max(0.1, queue_timeout_s)
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._waiting: dict[str, deque[object]] = {name: deque() for name in PRIORITIES}
+        self._usage: dict[str, deque[tuple[float, int]]] = {name: deque() for name in PRIORITIES}
+
+    @contextmanager
+    def slot(self, priority: str, tokens: int = 0) -> Iterator[int]:
+        wait_ms = self._acquire(normalize_priority(priority), max(0, tokens))
+        try:
+            yield wait_ms
+        finally:
+            self.release()
+
+    def try_acquire(self, priority: str, tokens: int = 0) -> bool:
+        """Take a slot only if one is free and nobody is queued; the caller must release() it."""
+        priority = normalize_priority(priority)
+        with self._cond:
+            now = time.monotonic()
+            budget = self.token_budgets.get(priority, 0)
+            if budget > 0 and self._tokens_used(priority, now) + max(0, tokens) > budget:
+                return False
+            if self._in_flight >= self.max_in_flight or any(self._waiting.values()):
+                return False
+            self._in_flight += 1
+            if budget > 0:
+                self._usage[priority].append((now, max(0, tokens)))
+            return True
+
+    def release(self) -> None:
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._cond.notify_all()
+
+    def snapshot(self) -> dict[str, object]:
+        with self._cond:
+            now = time.monotonic()
+            return {
+                "max_in_flight": self.max_in_flight,
+                "in_flight": self._in_flight,
+                "waiting": {name: len(queue) for name, queue in self._waiting.items()},
+                "tokens_used": {name: self._tokens_used(name, now) for name in PRIORITIES},
+                "token_budgets": dict(self.token_budgets),
+            }
+
+    def _acquire(self, priority: str, tokens: int) -> int:
+        started = time.monotonic()
+        ticket = object()
+        with self._cond:
+            budget = self.token_budgets.get(priority, 0)
+            if budget > 0 and self._tokens_used(priority, started) + tokens > budget:
+                raise LLMDispatchRejected(priority, "token_budget_exhausted")
+
+            queue = self._waiting[priority]
+            queue.append(ticket)
+            deadline = started + self.queue_timeout_s
+            while not self._is_next(priority, ticket):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    queue.remove(ticket)
+                    self._cond.notify_all()
+                    raise LLMDispatchRejected(priority, "queue_timeout")
+                self._cond.wait(timeout=remaining)
+
+            queue.popleft()
+            self._in_flight += 1
+            if budget > 0:
+                self._usage[priority].append((time.monotonic(), tokens))
+            self._cond.notify_all()
+        return int((time.monotonic() - started) * 1000)
+
+    def _is_next(self, priority: str, ticket: object) -> bool:
+        if self._in_flight >= self.max_in_flight:
+            return False
+        for name in PRIORITIES:
+            queue = self._waiting[name]
+            if queue:
+                return name == priority and queue[0] is ticket
+        return False
+
+    def _tokens_used(self, priority: str, now: float) -> int:
+        usage = self._usage[priority]
+        while usage and usage[0][0] <= now - self.budget_window_s:
+            usage.popleft()
+        return sum(tokens for _, tokens in usage)
+
+
+_dispatcher: LLMDispatcher | None = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_llm_dispatcher() -> LLMDispatcher:
+    global _dispatcher
+    if _dispatcher is not None:
+        return _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = LLMDispatcher(
+                max_in_flight=_env_int("BENJAMIN_LLM_MAX_IN_FLIGHT", 4),
+                token_budgets={name: _env_int(f"BENJAMIN_LLM_TOKEN_BUDGET_{name.upper()}", 0) for name in PRIORITIES},
+                budget_window_s=_env_float("BENJAMIN_LLM_TOKEN_BUDGET_WINDOW_S", 60.0),
+                queue_timeout_s=_env_float("BENJAMIN_LLM_QUEUE_TIMEOUT_S", 30.0),
+            )
+    return _dispatcher
@@ -16,6 +16,7 @@ class OpenAICompatClient:
         temperature: float,
         max_tokens: int,
         response_format: dict | None = None,
+        timeout_s: float | None = None,
     ) -> str:
         payload: dict[str, object] = {
             "model": self.model,
@@ -33,7 +34,8 @@ class OpenAICompatClient:
             "POST",
             self.url,
             json=payload,
-            timeout_s=self.timeout_s,
+            timeout_s=timeout_s if timeout_s is not None else self.timeout_s,
+            retries=0,
         )
         choices = data.get("choices") or []
         if not choices:
@@ -1,20 +1,81 @@
 from __future__ import annotations
 
+import contextvars
 import json
 import logging
 import os
+import random
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 import time
 from dataclasses import dataclass
+from typing import Callable
 
+from benjamin.core.cache.singleflight import SingleFlight, singleflight_key
 from benjamin.core.infra.breaker_manager import BreakerManager, ServiceDegradedError
-from benjamin.core.memory.manager import MemoryManager
-from benjamin.core.net.http import HTTPRequestError
+from benjamin.core.infra.ratelimit import get_rate_limiter
+from benjamin.core.infra.services import get_services
+from benjamin.core.net.http import HTTPClientError, HTTPRequestError, HTTPTimeoutError
+from benjamin.core.observability.latency import WindowedLatencyHistogram
 from benjamin.core.observability.trace import Trace
 from benjamin.core.ops.safe_mode import is_safe_mode_enabled, safe_mode_allow_rule_builder, safe_mode_allow_summarizer
 
 from .llm import LLM
+from .llm_dispatch import LLMDispatcher, LLMDispatchRejected, current_llm_priority, get_llm_dispatcher
 from .llm_openai_compat import OpenAICompatClient
+from .prompts import json_system_prompt
+
+
+def _latency_window_s() -> float:
+    try:
+        return max(10.0, float(os.getenv("BENJAMIN_LLM_LATENCY_WINDOW_S", "300")))
+    except ValueError:
+        return 300.0
+
+
+_LLM_FLIGHTS = SingleFlight()
+# Windowed so adaptive timeouts and hedge delays follow the current latency rather than all-time history.
+_LLM_LATENCY = {"json": WindowedLatencyHistogram(_latency_window_s()), "text": WindowedLatencyHistogram(_latency_window_s())}
+_ADAPTIVE_MIN_SAMPLES = 20
+
+_hedge_pool: ThreadPoolExecutor | None = None
+_hedge_pool_lock = threading.Lock()
+_hedges_outstanding = 0
+_hedges_lock = threading.Lock()
+
+
+def _get_hedge_pool() -> ThreadPoolExecutor:
+    global _hedge_pool
+    if _hedge_pool is not None:
+        return _hedge_pool
+    with _hedge_pool_lock:
+        if _hedge_pool is None:
+            _hedge_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="benjamin-llm-hedge")
+    return _hedge_pool
+
+
+def llm_latency_snapshot() -> dict[str, dict[str, float | int | None]]:
+    return {mode: histogram.summary() for mode, histogram in _LLM_LATENCY.items()}
+
+
+def _release_when_both_done(primary: Future, secondary: Future, dispatcher: LLMDispatcher) -> None:
+    """Hold the hedge's dispatcher slot until the losing request finishes too."""
+    remaining = [2]
+    lock = threading.Lock()
+
+    def _done(_: Future) -> None:
+        global _hedges_outstanding
+        with lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        dispatcher.release()
+        with _hedges_lock:
+            _hedges_outstanding = max(0, _hedges_outstanding - 1)
+
+    primary.add_done_callback(_done)
+    secondary.add_done_callback(_done)
 
 
 class LLMUnavailable(RuntimeError):
@@ -34,6 +95,14 @@ class LLMConfig:
     strict_json: bool
     max_tokens_json: int
     max_tokens_text: int
+    batch_concurrency: int
+    max_attempts: int
+    deadline_s: float
+    adaptive_timeout: bool
+    timeout_factor: float
+    timeout_min_s: float
+    hedge: bool
+    hedge_max_outstanding: int
 
 
 class BenjaminLLM:
@@ -47,6 +116,14 @@ class BenjaminLLM:
             strict_json=os.getenv("BENJAMIN_LLM_STRICT_JSON", "on").casefold() == "on",
             max_tokens_json=int(os.getenv("BENJAMIN_LLM_MAX_TOKENS_JSON", "1200")),
             max_tokens_text=int(os.getenv("BENJAMIN_LLM_MAX_TOKENS_TEXT", "800")),
+            batch_concurrency=max(1, int(os.getenv("BENJAMIN_LLM_BATCH_CONCURRENCY", "4"))),
+            max_attempts=max(1, int(os.getenv("BENJAMIN_LLM_MAX_ATTEMPTS", "2"))),
+            deadline_s=float(os.getenv("BENJAMIN_LLM_DEADLINE_S", os.getenv("BENJAMIN_LLM_TIMEOUT_S", "45"))),
+            adaptive_timeout=os.getenv("BENJAMIN_LLM_ADAPTIVE_TIMEOUT", "on").casefold() == "on",
+            timeout_factor=float(os.getenv("BENJAMIN_LLM_TIMEOUT_FACTOR", "3")),
+            timeout_min_s=float(os.getenv("BENJAMIN_LLM_TIMEOUT_MIN_S", "5")),
+            hedge=os.getenv("BENJAMIN_LLM_HEDGE", "off").casefold() == "on",
+            hedge_max_outstanding=max(0, int(os.getenv("BENJAMIN_LLM_HEDGE_MAX_OUTSTANDING", "2"))),
         )
         self._compat = OpenAICompatClient(
             url=os.getenv("BENJAMIN_VLLM_URL", "http://127.0.0.1:8001/v1/chat/completions"),
@@ -55,7 +132,7 @@ class BenjaminLLM:
         )
         self._legacy = LLM()
         self.logger = logging.getLogger("benjamin.llm")
-        self.breaker_manager = breaker_manager or BreakerManager(state_dir=MemoryManager().state_dir)
+        self.breaker_manager = breaker_manager or get_services().breaker_manager()
 
     @staticmethod
     def feature_enabled(name: str) -> bool:
@@ -81,17 +158,37 @@ class BenjaminLLM:
         used_temp = self.config.temperature if temperature is None else temperature
         return self._call(system=system, user=user, max_tokens=used_tokens, temperature=used_temp, mode="text", trace=trace)
 
+    def complete_text_batch(
+        self,
+        prompts: list[tuple[str, str]],
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> list[str | None]:
+        if not prompts:
+            return []
+        if self.config.provider == "off":
+            return [None] * len(prompts)
+
+        def _one(system: str, user: str) -> str | None:
+            try:
+                return self.complete_text(system=system, user=user, max_tokens=max_tokens, temperature=temperature)
+            except LLMUnavailable:
+                return None
+
+        if len(prompts) == 1:
+            return [_one(*prompts[0])]
+
+        workers = min(len(prompts), self.config.batch_concurrency)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="benjamin-llm-batch") as pool:
+            futures = [pool.submit(contextvars.copy_context().run, _one, system, user) for system, user in prompts]
+            return [future.result() for future in futures]
+
     def complete_json(self, system: str, user: str, schema_hint: dict | None = None, max_tokens: int | None = None, trace: Trace | None = None) -> dict:
         used_tokens = max_tokens or self.config.max_tokens_json
-        strict_instruction = (
-            "Return strict JSON only with no markdown fences and no prose."
-            if self.config.strict_json
-            else "Return JSON."
-        )
-        schema_block = f"Schema hint: {json.dumps(schema_hint, ensure_ascii=False)}\n" if schema_hint else ""
+        schema_json = json.dumps(schema_hint, ensure_ascii=False, sort_keys=True) if schema_hint else None
         raw = self._call(
-            system=system,
-            user=f"{strict_instruction}\n{schema_block}{user}",
+            system=json_system_prompt(system, self.config.strict_json, schema_json),
+            user=user,
             max_tokens=used_tokens,
             temperature=0.0,
             response_format={"type": "json_object"} if self.config.provider in {"vllm", "http"} else None,
@@ -118,46 +215,196 @@ class BenjaminLLM:
         if self.config.provider == "off":
             raise LLMUnavailable("LLM provider is off")
 
+        priority = current_llm_priority()
+        key = singleflight_key(
+            "llm",
+            self.config.provider,
+            self._compat.url,
+            self.config.model,
+            system,
+            user,
+            max_tokens,
+            temperature,
+            response_format,
+            mode,
+            priority,
+        )
+        try:
+            return _LLM_FLIGHTS.do(
+                key,
+                lambda: self._call_uncoalesced(
+                    system=system,
+                    user=user,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    response_format=response_format,
+                    mode=mode,
+                    priority=priority,
+                ),
+            )
+        except LLMUnavailable as exc:
+            if trace is not None and isinstance(exc.__cause__, ServiceDegradedError):
+                trace.emit("LLMDegraded", {"service": "llm", "reason": str(exc.__cause__)})
+            raise
+
+    def _call_uncoalesced(
+        self,
+        system: str,
+        user: str,
+        max_tokens: int,
+        temperature: float,
+        response_format: dict | None,
+        mode: str,
+        priority: str,
+    ) -> str:
         start = time.perf_counter()
+        deadline = start + max(0.1, self.config.deadline_s)
+        dispatcher = get_llm_dispatcher()
+        estimated_tokens = (len(system) + len(user)) // 4 + max_tokens
+        queue_wait_ms = 0
+        attempts = 0
         last_error: Exception | None = None
-        for _ in range(2):
+        while attempts < self.config.max_attempts:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            attempts += 1
             try:
-                if self.config.provider in {"vllm", "http"}:
-                    output = self.breaker_manager.wrap(
-                        "llm",
-                        lambda: self._compat.chat_completion(
-                            system=system,
-                            user=user,
-                            temperature=temperature,
-                            max_tokens=max_tokens,
-                            response_format=response_format,
-                        ),
-                    )
-                else:
-                    output = self._legacy.complete(f"{system}\n\n{user}")
-                self.logger.info(
-                    "llm_call",
-                    extra={
-                        "extra_fields": {
-                            "provider": self.config.provider,
-                            "model": self.config.model,
-                            "mode": mode,
-                            "duration_ms": int((time.perf_counter() - start) * 1000),
-                            "ok": True,
-                            "system_len": len(system),
-                            "user_len": len(user),
-                        }
-                    },
-                )
+                with dispatcher.slot(priority, tokens=estimated_tokens) as wait_ms:
+                    queue_wait_ms += wait_ms
+                    if self.config.provider in {"vllm", "http"}:
+                        timeout_s = min(self._attempt_timeout(mode), max(0.1, deadline - time.perf_counter()))
+
+                        def request(timeout_s: float = timeout_s) -> str:
+                            return self._timed_completion(
+                                mode,
+                                timeout_s,
+                                lambda: self._compat.chat_completion(
+                                    system=system,
+                                    user=user,
+                                    temperature=temperature,
+                                    max_tokens=max_tokens,
+                                    response_format=response_format,
+                                    timeout_s=timeout_s,
+                                ),
+                            )
+
+                        hedge_after_s = self._hedge_delay(mode, timeout_s)
+                        if hedge_after_s is not None:
+                            output = self.breaker_manager.wrap(
+                                "llm", lambda: self._hedged(request, hedge_after_s, dispatcher, priority, estimated_tokens)
+                            )
+                        else:
+                            output = self.breaker_manager.wrap("llm", request)
+                    else:
+                        output = self._legacy.complete(f"{system}\n\n{user}")
+                self._log_call(mode, start, True, system, user, priority, queue_wait_ms, attempts)
                 return output
+            except LLMDispatchRejected as exc:
+                self._log_call(mode, start, False, system, user, priority, queue_wait_ms, attempts)
+                raise LLMUnavailable(str(exc)) from exc
             except ServiceDegradedError as exc:
-                if trace is not None:
-                    trace.emit("LLMDegraded", {"service": "llm", "reason": str(exc)})
                 raise LLMUnavailable(str(exc)) from exc
+            except HTTPClientError as exc:
+                last_error = exc
+                break
             except (HTTPRequestError, ValueError, RuntimeError) as exc:
                 last_error = exc
+                if attempts < self.config.max_attempts:
+                    if not get_rate_limiter(self.breaker_manager.state_dir).allow_retry("llm"):
+                        break
+                    self._sleep_before_retry(attempts, deadline)
                 continue
 
+        self._log_call(mode, start, False, system, user, priority, queue_wait_ms, attempts)
+        raise LLMUnavailable(f"LLM request failed: {last_error}")
+
+    def _attempt_timeout(self, mode: str) -> float:
+        ceiling = max(0.1, self.config.timeout_s)
+        histogram = _LLM_LATENCY.get(mode)
+        if not self.config.adaptive_timeout or histogram is None or histogram.count < _ADAPTIVE_MIN_SAMPLES:
+            return ceiling
+        p99_ms = histogram.percentile(99) or 0.0
+        adaptive = (p99_ms / 1000.0) * self.config.timeout_factor
+        return min(ceiling, max(self.config.timeout_min_s, adaptive))
+
+    def _hedge_delay(self, mode: str, timeout_s: float) -> float | None:
+        histogram = _LLM_LATENCY.get(mode)
+        if not self.config.hedge or histogram is None or histogram.count < _ADAPTIVE_MIN_SAMPLES:
+            return None
+        p95_ms = histogram.percentile(95)
+        if p95_ms is None or p95_ms / 1000.0 >= timeout_s:
+            return None
+        return p95_ms / 1000.0
+
+    def _timed_completion(self, mode: str, timeout_s: float, fn: Callable[[], str]) -> str:
+        started = time.perf_counter()
+        histogram = _LLM_LATENCY.get(mode)
+        try:
+            output = fn()
+        except HTTPTimeoutError:
+            if histogram is not None:
+                histogram.observe(timeout_s * 1000.0)
+            raise
+        if histogram is not None:
+            histogram.observe((time.perf_counter() - started) * 1000.0)
+        return output
+
+    def _hedged(self, request: Callable[[], str], hedge_after_s: float, dispatcher: LLMDispatcher, priority: str, tokens: int) -> str:
+        pool = _get_hedge_pool()
+        primary = pool.submit(contextvars.copy_context().run, request)
+        done, _ = wait([primary], timeout=hedge_after_s)
+        if done:
+            return primary.result()
+
+        # The duplicate needs its own dispatcher slot, and a bounded number of hedges may still be running.
+        reason = self._reserve_hedge(dispatcher, priority, tokens)
+        if reason is not None:
+            self.logger.info("llm_hedge_skipped", extra={"extra_fields": {"reason": reason}})
+            return primary.result()
+        self.logger.info("llm_hedge_fired", extra={"extra_fields": {"hedge_after_ms": int(hedge_after_s * 1000)}})
+        secondary = pool.submit(contextvars.copy_context().run, request)
+        _release_when_both_done(primary, secondary, dispatcher)
+        pending: set[Future] = {primary, secondary}
+        errors: list[BaseException] = []
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    for loser in pending:
+                        loser.cancel()
+                    return future.result()
+                errors.append(error)
+        raise errors[-1]
+
+    def _reserve_hedge(self, dispatcher: LLMDispatcher, priority: str, tokens: int) -> str | None:
+        global _hedges_outstanding
+        with _hedges_lock:
+            if _hedges_outstanding >= self.config.hedge_max_outstanding:
+                return "max_outstanding"
+            if not dispatcher.try_acquire(priority, tokens=tokens):
+                return "no_dispatch_slot"
+            _hedges_outstanding += 1
+        return None
+
+    def _sleep_before_retry(self, attempt: int, deadline: float) -> None:
+        backoff_s = min(2.0, 0.25 * (2 ** (attempt - 1))) * (0.5 + random.random())
+        remaining = deadline - time.perf_counter()
+        if remaining > backoff_s:
+            time.sleep(backoff_s)
+
+    def _log_call(
+        self,
+        mode: str,
+        start: float,
+        ok: bool,
+        system: str,
+        user: str,
+        priority: str,
+        queue_wait_ms: int,
+        attempts: int,
+    ) -> None:
         self.logger.info(
             "llm_call",
             extra={
@@ -165,14 +412,16 @@ class BenjaminLLM:
                     "provider": self.config.provider,
                     "model": self.config.model,
                     "mode": mode,
+                    "priority": priority,
+                    "queue_wait_ms": queue_wait_ms,
+                    "attempts": attempts,
                     "duration_ms": int((time.perf_counter() - start) * 1000),
-                    "ok": False,
+                    "ok": ok,
                     "system_len": len(system),
                     "user_len": len(user),
                 }
             },
         )
-        raise LLMUnavailable(f"LLM request failed: {last_error}")
 
     def _parse_json(self, raw: str) -> dict | None:
         cleaned = raw.strip()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import math
+import os
+import re
+from dataclasses import dataclass
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+_TERM_RE = re.compile(r"\W+")
+
+DEFAULT_FEATURE_BUDGETS = {
+    "planner": 384,
+}
+
+
+def estimate_tokens(text: str) -> int:
+    count = 0
+    for piece in _TOKEN_RE.findall(text):
+        count += max(1, math.ceil(len(piece) / 4)) if piece[0].isalnum() or piece[0] == "_" else 1
+    return count
+
+
+def feature_budget(feature: str) -> int:
+    default = DEFAULT_FEATURE_BUDGETS.get(feature, 256)
+    raw = os.getenv(f"BENJAMIN_PROMPT_BUDGET_{feature.upper()}")
+    if raw is None:
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return default
+
+
+def relevance_score(query: str, text: str) -> float:
+    terms = {term for term in _TERM_RE.split(query.casefold()) if len(term) > 2}
+    if not terms:
+        return 0.0
+    haystack = text.casefold()
+    return sum(1.0 for term in terms if term in haystack) / len(terms)
+
+
+@dataclass
+class BudgetItem:
+    text: str
+    section: str
+    score: float = 0.0
+
+
+class PromptBudget:
+    def __init__(self, max_tokens: int) -> None:
+        self.max_tokens = max(0, max_tokens)
+
+    def pack(self, items: list[BudgetItem], reserved_tokens: int = 0) -> list[BudgetItem]:
+        remaining = self.max_tokens - reserved_tokens
+        ranked = sorted(range(len(items)), key=lambda idx: (-items[idx].score, idx))
+        selected: set[int] = set()
+        for idx in ranked:
+            cost = estimate_tokens(items[idx].text)
+            if cost > remaining:
+                continue
+            selected.add(idx)
+            remaining -= cost
+        return [item for idx, item in enumerate(items) if idx in selected]
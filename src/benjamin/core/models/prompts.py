@@ -1,21 +1,25 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 
 SYSTEM_PROMPT = "You are Benjamin, a careful orchestration assistant."
 
+PLANNER_SKILLS: tuple[dict[str, str], ...] = (
+    {"name": "reminders.create", "description": "Create reminder", "args_schema": '{"message":"...","run_at_iso":"..."}'},
+    {"name": "calendar.search", "description": "Search calendar", "args_schema": '{"query":"..."}'},
+    {"name": "calendar.create_event", "description": "Create event (approval)", "args_schema": '{"title":"...","start_iso":"...","end_iso":"..."}'},
+    {"name": "gmail.search", "description": "Search Gmail", "args_schema": '{"query":"..."}'},
+    {"name": "gmail.read_message", "description": "Read Gmail message", "args_schema": '{"message_id":"..."}'},
+    {"name": "gmail.thread_summary", "description": "Summarize one thread, or several with thread_ids", "args_schema": '{"thread_id":"...","thread_ids":["..."]}'},
+    {"name": "gmail.draft_email", "description": "Draft Gmail email (approval)", "args_schema": '{"to":["a@b.com"],"subject":"...","body":"..."}'},
+)
 
-def planner_system_prompt() -> str:
-    return (
-        "You create execution plans as JSON. "
-        "Write actions require approval and will not execute without approval. "
-        "Prefer read-only skills when possible."
-    )
 
-
-def planner_user_prompt(goal: str, memory_block: str, skills: list[dict[str, str]]) -> str:
+@lru_cache(maxsize=1)
+def planner_system_prompt() -> str:
     schema = {
-        "goal": goal,
+        "goal": "the user goal",
         "steps": [
             {
                 "description": "short action description",
@@ -26,13 +30,28 @@ def planner_user_prompt(goal: str, memory_block: str, skills: list[dict[str, str
         ],
     }
     return (
-        f"Goal: {goal}\n\n"
-        f"Available skills: {json.dumps(skills, ensure_ascii=False)}\n\n"
-        f"Retrieved memory:\n{memory_block}\n\n"
+        "You create execution plans as JSON. "
+        "Write actions require approval and will not execute without approval. "
+        "Prefer read-only skills when possible.\n\n"
+        f"Available skills: {json.dumps(list(PLANNER_SKILLS), ensure_ascii=False)}\n\n"
         "Return plan JSON following this shape:\n"
-        f"{json.dumps(schema, ensure_ascii=False)}\n"
+        f"{json.dumps(schema, ensure_ascii=False)}"
+    )
+
+
+def planner_user_prompt(goal: str, memory_block: str) -> str:
+    return (
+        f"Goal: {goal}\n\n"
+        f"Retrieved memory:\n{memory_block}\n"
     )
 
 
+@lru_cache(maxsize=64)
+def json_system_prompt(system: str, strict: bool, schema_hint_json: str | None) -> str:
+    instruction = "Return strict JSON only with no markdown fences and no prose." if strict else "Return JSON."
+    schema_block = f"\nSchema hint: {schema_hint_json}" if schema_hint_json else ""
+    return f"{system}\n\n{instruction}{schema_block}"
+
+
 def task_prompt(task: str) -> str:
     return f"Plan and execute: {task}"
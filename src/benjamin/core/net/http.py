@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import os
-import random
-import threading
-import time
 from typing import Any
 
 import httpx
 
+from benjamin.core.http.transport import get_transport
+from benjamin.core.infra.ratelimit import RateLimitExceeded
+
 
 class HTTPRequestError(RuntimeError):
     pass
@@ -36,10 +36,6 @@ class HTTPClientError(HTTPRequestError):
 _DEFAULT_TIMEOUT_S = 10.0
 _DEFAULT_RETRIES = 2
 _DEFAULT_BACKOFF_BASE_MS = 250
-_DEFAULT_USER_AGENT = "BENJAMIN/1.0"
-
-_client: httpx.Client | None = None
-_client_lock = threading.Lock()
 
 
 def _get_float_env(name: str, default: float) -> float:
@@ -67,13 +63,7 @@ def _timeout(timeout_s: float | None = None) -> float:
 
 
 def get_http_client() -> httpx.Client:
-    global _client
-    if _client is not None:
-        return _client
-    with _client_lock:
-        if _client is None:
-            _client = httpx.Client(timeout=_timeout(), headers={"User-Agent": os.getenv("BENJAMIN_HTTP_USER_AGENT", _DEFAULT_USER_AGENT)})
-    return _client
+    return get_transport().client_for()
 
 
 def request_json(
@@ -85,51 +75,37 @@ def request_json(
     timeout_s: float | None = None,
     retries: int | None = None,
     backoff_base_ms: int | None = None,
+    service: str | None = None,
 ) -> dict[str, Any]:
     max_retries = _get_int_env("BENJAMIN_HTTP_RETRIES", _DEFAULT_RETRIES) if retries is None else max(0, retries)
     base_ms = _get_int_env("BENJAMIN_HTTP_BACKOFF_BASE_MS", _DEFAULT_BACKOFF_BASE_MS) if backoff_base_ms is None else max(1, backoff_base_ms)
 
-    client = get_http_client()
-    attempts = max_retries + 1
-
-    for attempt in range(attempts):
-        try:
-            response = client.request(method=method, url=url, headers=headers, json=json, timeout=_timeout(timeout_s))
-        except httpx.TimeoutException as exc:
-            if attempt >= max_retries:
-                raise HTTPTimeoutError(f"request_timeout:{method}:{url}") from exc
-            _sleep_backoff(attempt, base_ms)
-            continue
-        except (httpx.ConnectError, httpx.NetworkError, httpx.RemoteProtocolError) as exc:
-            if attempt >= max_retries:
-                raise HTTPConnectionError(f"request_connection_error:{method}:{url}") from exc
-            _sleep_backoff(attempt, base_ms)
-            continue
-        except httpx.HTTPError as exc:
-            raise HTTPConnectionError(f"request_http_error:{method}:{url}:{exc.__class__.__name__}") from exc
-
-        if 200 <= response.status_code < 300:
-            payload = response.json()
-            return payload if isinstance(payload, dict) else {"data": payload}
-
-        if response.status_code == 429:
-            if attempt >= max_retries:
-                raise HTTPRateLimitError(f"request_rate_limited:{method}:{url}")
-            _sleep_backoff(attempt, base_ms)
-            continue
-
-        if response.status_code >= 500:
-            if attempt >= max_retries:
-                raise HTTPServerError(f"request_server_error:{response.status_code}:{method}:{url}")
-            _sleep_backoff(attempt, base_ms)
-            continue
-
-        raise HTTPClientError(f"request_client_error:{response.status_code}:{method}:{url}")
-
-    raise HTTPRequestError(f"request_unknown_error:{method}:{url}")
-
-
-def _sleep_backoff(attempt: int, base_ms: int) -> None:
-    jitter_ms = random.randint(0, max(1, base_ms // 4))
-    sleep_ms = (base_ms * (2**attempt)) + jitter_ms
-    time.sleep(sleep_ms / 1000.0)
+    try:
+        response = get_transport().request(
+            method,
+            url,
+            headers=headers,
+            json=json,
+            timeout_s=_timeout(timeout_s),
+            retries=max_retries,
+            backoff_base_s=base_ms / 1000.0,
+            backoff_max_s=max(2.0, base_ms / 1000.0),
+            service=service,
+        )
+    except RateLimitExceeded as exc:
+        raise HTTPRateLimitError(f"request_rate_limited_locally:{method}:{url}") from exc
+    except httpx.TimeoutException as exc:
+        raise HTTPTimeoutError(f"request_timeout:{method}:{url}") from exc
+    except (httpx.ConnectError, httpx.NetworkError, httpx.RemoteProtocolError) as exc:
+        raise HTTPConnectionError(f"request_connection_error:{method}:{url}") from exc
+    except httpx.HTTPError as exc:
+        raise HTTPConnectionError(f"request_http_error:{method}:{url}:{exc.__class__.__name__}") from exc
+
+    if 200 <= response.status_code < 300:
+        payload = response.json()
+        return payload if isinstance(payload, dict) else {"data": payload}
+    if response.status_code == 429:
+        raise HTTPRateLimitError(f"request_rate_limited:{method}:{url}")
+    if response.status_code >= 500:
+        raise HTTPServerError(f"request_server_error:{response.status_code}:{method}:{url}")
+    raise HTTPClientError(f"request_client_error:{response.status_code}:{method}:{url}")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
+from pathlib import Path
 
 from benjamin.core.http.client import request_with_retry
 from benjamin.core.http.errors import BenjaminHTTPError
@@ -10,8 +11,9 @@ logger = logging.getLogger(__name__)
 
 
 class DiscordWebhookNotifier:
-    def __init__(self, webhook_url: str) -> None:
+    def __init__(self, webhook_url: str, state_dir: Path | str | None = None) -> None:
         self.webhook_url = webhook_url
+        self.state_dir = state_dir
 
     def send(self, title: str, body: str, meta: dict | None = None) -> None:
         content = f"**{title}**\n{body}"
@@ -27,6 +29,8 @@ class DiscordWebhookNotifier:
                 timeout_override=5.0,
                 retries=1,
                 redact_url=True,
+                service="discord",
+                state_dir=self.state_dir,
             )
         except BenjaminHTTPError as exc:
             logger.warning("Discord webhook send failed: %s", exc)
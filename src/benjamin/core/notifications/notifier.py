@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from pathlib import Path
 from typing import Protocol
 
 from .channels.console import ConsoleNotifier
@@ -21,7 +22,7 @@ class NotificationRouter:
             channel.send(title=title, body=body, meta=payload_meta)
 
 
-def build_notification_router() -> NotificationRouter:
+def build_notification_router(state_dir: Path | str | None = None) -> NotificationRouter:
     configured = os.getenv("BENJAMIN_NOTIFIER", "console")
     requested = [name.strip().casefold() for name in configured.split(",") if name.strip()]
     channels: list[Notifier] = []
@@ -32,7 +33,7 @@ def build_notification_router() -> NotificationRouter:
     if "discord" in requested:
         webhook = os.getenv("BENJAMIN_DISCORD_WEBHOOK_URL")
         if webhook:
-            channels.append(DiscordWebhookNotifier(webhook_url=webhook))
+            channels.append(DiscordWebhookNotifier(webhook_url=webhook, state_dir=state_dir))
         else:
             print("[notifications] discord notifier requested but BENJAMIN_DISCORD_WEBHOOK_URL is not set; skipping")
 
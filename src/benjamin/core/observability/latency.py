@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+
+_BUCKET_GROWTH = 1.2
+_BUCKET_MAX_MS = 3_600_000.0
+
+
+def _build_bounds() -> tuple[float, ...]:
+    bounds: list[float] = []
+    value = 1.0
+    while value < _BUCKET_MAX_MS:
+        bounds.append(round(value, 3))
+        value *= _BUCKET_GROWTH
+    bounds.append(_BUCKET_MAX_MS)
+    return tuple(bounds)
+
+
+BUCKET_BOUNDS_MS = _build_bounds()
+
+
+class LatencyHistogram:
+    def __init__(self) -> None:
+        self._counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self._count = 0
+        self._sum_ms = 0.0
+        self._max_ms = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def observe(self, duration_ms: float) -> None:
+        value = max(0.0, float(duration_ms))
+        index = bisect.bisect_left(BUCKET_BOUNDS_MS, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum_ms += value
+            self._max_ms = max(self._max_ms, value)
+
+    def percentile(self, pct: float) -> float | None:
+        with self._lock:
+            if self._count == 0:
+                return None
+            rank = max(1, int(round(self._count * min(100.0, max(0.0, pct)) / 100.0)))
+            seen = 0
+            for index, bucket_count in enumerate(self._counts):
+                seen += bucket_count
+                if seen >= rank:
+                    if index >= len(BUCKET_BOUNDS_MS):
+                        return self._max_ms
+                    return min(BUCKET_BOUNDS_MS[index], self._max_ms)
+            return self._max_ms
+
+    def summary(self) -> dict[str, float | int | None]:
+        with self._lock:
+            count = self._count
+            mean = self._sum_ms / count if count else None
+            max_ms = self._max_ms if count else None
+        return {
+            "count": count,
+            "mean_ms": round(mean, 1) if mean is not None else None,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": max_ms,
+        }
+
+    def to_dict(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "counts": {str(index): value for index, value in enumerate(self._counts) if value},
+                "count": self._count,
+                "sum_ms": self._sum_ms,
+                "max_ms": self._max_ms,
+            }
+
+    @classmethod
+    def merged(cls, histograms: list["LatencyHistogram"]) -> "LatencyHistogram":
+        combined = cls()
+        for histogram in histograms:
+            with histogram._lock:
+                for index, value in enumerate(histogram._counts):
+                    combined._counts[index] += value
+                combined._count += histogram._count
+                combined._sum_ms += histogram._sum_ms
+                combined._max_ms = max(combined._max_ms, histogram._max_ms)
+        return combined
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, object]) -> "LatencyHistogram":
+        histogram = cls()
+        counts = payload.get("counts")
+        if isinstance(counts, dict):
+            for key, value in counts.items():
+                try:
+                    index = int(key)
+                    histogram._counts[index] = int(value)
+                except (TypeError, ValueError, IndexError):
+                    continue
+        histogram._count = sum(histogram._counts)
+        histogram._sum_ms = float(payload.get("sum_ms") or 0.0)
+        histogram._max_ms = float(payload.get("max_ms") or 0.0)
+        return histogram
+
+
+class WindowedLatencyHistogram:
+    """Latency histogram over roughly the last window_s seconds, kept as rotating slices."""
+
+    def __init__(self, window_s: float = 300.0, slices: int = 5, clock=time.monotonic) -> None:  # type: ignore[no-untyped-def]
+        self.slice_s = max(0.001, window_s / max(1, slices))
+        self._slices: list[tuple[int, LatencyHistogram]] = []
+        self._max_slices = max(1, slices)
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        return sum(histogram.count for histogram in self._live())
+
+    def observe(self, duration_ms: float) -> None:
+        epoch = int(self._clock() // self.slice_s)
+        with self._lock:
+            if not self._slices or self._slices[-1][0] != epoch:
+                self._slices.append((epoch, LatencyHistogram()))
+            current = self._slices[-1][1]
+            self._expire(epoch)
+        current.observe(duration_ms)
+
+    def percentile(self, pct: float) -> float | None:
+        return LatencyHistogram.merged(self._live()).percentile(pct)
+
+    def summary(self) -> dict[str, float | int | None]:
+        return LatencyHistogram.merged(self._live()).summary()
+
+    def _live(self) -> list[LatencyHistogram]:
+        epoch = int(self._clock() // self.slice_s)
+        with self._lock:
+            self._expire(epoch)
+            return [histogram for _, histogram in self._slices]
+
+    def _expire(self, epoch: int) -> None:
+        while self._slices and self._slices[0][0] <= epoch - self._max_slices:
+            self._slices.pop(0)
@@ -206,3 +206,24 @@ def run_weekly_compact(state_dir: str | Path, notifier: NotificationRouter, memo
         )
 
     return {"ok": True, "summary": summary, "correlation_id": correlation_id}
+
+
+def run_doctor_validate_job(state_dir: str) -> None:
+    """Scheduler entry point; resolves collaborators in the executing process so it can run on a process pool."""
+    from benjamin.core.infra.services import get_services
+    from benjamin.core.notifications.notifier import build_notification_router
+
+    services = get_services(state_dir)
+    run_doctor_validate(
+        state_dir=state_dir,
+        notifier=build_notification_router(state_dir),
+        memory_manager=services.memory_manager(),
+        breaker_manager=services.breaker_manager(),
+    )
+
+
+def run_weekly_compact_job(state_dir: str) -> None:
+    from benjamin.core.infra.services import get_services
+    from benjamin.core.notifications.notifier import build_notification_router
+
+    run_weekly_compact(state_dir=state_dir, notifier=build_notification_router(state_dir), memory_manager=get_services(state_dir).memory_manager())
@@ -5,8 +5,10 @@ from dataclasses import dataclass
 from typing import Any
 
 from benjamin.core.draft.drafter import Drafter
+from benjamin.core.infra.services import get_services
 from benjamin.core.models.llm_provider import BenjaminLLM, LLMOutputError, LLMUnavailable
-from benjamin.core.models.prompts import planner_system_prompt, planner_user_prompt
+from benjamin.core.models.prompt_budget import BudgetItem, PromptBudget, estimate_tokens, feature_budget, relevance_score
+from benjamin.core.models.prompts import PLANNER_SKILLS, planner_system_prompt, planner_user_prompt
 from benjamin.core.orchestration.schemas import PlanStep
 
 
@@ -18,7 +20,7 @@ class Plan:
 
 class Planner:
     def __init__(self, llm_enabled: bool = False, llm: BenjaminLLM | None = None) -> None:
-        self.llm = llm or BenjaminLLM()
+        self.llm = llm or get_services().llm()
         self.llm_enabled = llm_enabled or BenjaminLLM.feature_enabled("BENJAMIN_LLM_PLANNER")
         self.drafter = Drafter(llm=self.llm)
 
@@ -63,17 +65,8 @@ class Planner:
         return None
 
     def _llm_plan(self, goal: str, memory: dict[str, list[Any]]) -> Plan | None:
-        skills = [
-            {"name": "reminders.create", "description": "Create reminder", "args_schema": '{"message":"...","run_at_iso":"..."}'},
-            {"name": "calendar.search", "description": "Search calendar", "args_schema": '{"query":"..."}'},
-            {"name": "calendar.create_event", "description": "Create event (approval)", "args_schema": '{"title":"...","start_iso":"...","end_iso":"..."}'},
-            {"name": "gmail.search", "description": "Search Gmail", "args_schema": '{"query":"..."}'},
-            {"name": "gmail.read_message", "description": "Read Gmail message", "args_schema": '{"message_id":"..."}'},
-            {"name": "gmail.thread_summary", "description": "Summarize thread", "args_schema": '{"thread_id":"..."}'},
-            {"name": "gmail.draft_email", "description": "Draft Gmail email (approval)", "args_schema": '{"to":["a@b.com"],"subject":"...","body":"..."}'},
-        ]
-        valid_skills = {item["name"] for item in skills}
-        prompt = planner_user_prompt(goal=goal, memory_block=self._memory_block(memory), skills=skills)
+        valid_skills = {item["name"] for item in PLANNER_SKILLS}
+        prompt = planner_user_prompt(goal=goal, memory_block=self._memory_block(memory, goal=goal))
         try:
             payload = self.llm.complete_json(
                 system=planner_system_prompt(),
@@ -92,19 +85,25 @@ class Planner:
         except (LLMUnavailable, LLMOutputError, ValueError, TypeError):
             return None
 
-    def _memory_block(self, memory: dict[str, list[Any]]) -> str:
+    def _memory_block(self, memory: dict[str, list[Any]], goal: str = "") -> str:
         semantic = memory.get("semantic", [])
         episodic = memory.get("episodic", [])
 
-        lines: list[str] = ["- Semantic:"]
+        items: list[BudgetItem] = []
         for fact in semantic:
-            lines.append(f"  - {fact.key}: {fact.value}")
-
-        lines.append("- Recent episodes:")
-        for episode in episodic[-3:]:
-            lines.append(f"  - {episode.summary}")
-
-        block = "\n".join(lines)
-        if len(block) <= 1500:
-            return block
-        return block[:1499].rstrip() + "…"
+            text = f"  - {fact.key}: {fact.value}"
+            items.append(BudgetItem(text=text, section="semantic", score=relevance_score(goal, text) + 0.5))
+        for position, episode in enumerate(episodic):
+            text = f"  - {episode.summary}"
+            recency = (position + 1) / max(1, len(episodic))
+            items.append(BudgetItem(text=text, section="episodic", score=relevance_score(goal, text) + 0.25 * recency))
+
+        headers = ["- Semantic:", "- Recent episodes:"]
+        reserved = sum(estimate_tokens(header) for header in headers)
+        packed = PromptBudget(feature_budget("planner")).pack(items, reserved_tokens=reserved)
+
+        lines: list[str] = [headers[0]]
+        lines.extend(item.text for item in packed if item.section == "semantic")
+        lines.append(headers[1])
+        lines.extend(item.text for item in packed if item.section == "episodic")
+        return "\n".join(lines)
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import re
 
+from benjamin.core.infra.services import get_services
 from benjamin.core.models.llm_provider import BenjaminLLM, LLMUnavailable
 
 
 class RetrievalHelper:
     def __init__(self, llm: BenjaminLLM | None = None) -> None:
-        self.llm = llm or BenjaminLLM()
+        self.llm = llm or get_services().llm()
         self.enabled = BenjaminLLM.feature_enabled("BENJAMIN_LLM_RETRIEVAL")
 
     def rewrite_query(self, user_text: str, target: str = "gmail") -> str:
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import contextvars
 import json
 import logging
+import threading
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from uuid import uuid4
-from typing import Any
+from typing import Any, Callable
 
 from benjamin.core.approvals.service import ApprovalService
+from benjamin.core.integrations.calendar_sync import CalendarMirror
+from benjamin.core.integrations.gmail_sync import GmailHistorySync
 from benjamin.core.ledger.keys import rule_action_key
 from benjamin.core.ledger.ledger import ExecutionLedger
 from benjamin.core.logging.context import log_context
@@ -34,6 +39,30 @@ from .schemas import (
 
 logger = logging.getLogger("benjamin.rules.engine")
 
+TriggerSignature = tuple[str, str, int]
+
+_cancel_event: contextvars.ContextVar[threading.Event | None] = contextvars.ContextVar("rule_cancel_event", default=None)
+
+
+def bind_cancel_event(event: threading.Event) -> None:
+    """Attach the caller's timeout flag to rule evaluation in the current context."""
+    _cancel_event.set(event)
+
+
+def rule_cancelled() -> bool:
+    event = _cancel_event.get()
+    return event is not None and event.is_set()
+
+
+def _run_sequential(calls: list[Callable[[], Any]]) -> list[Any]:
+    outcomes: list[Any] = []
+    for call in calls:
+        try:
+            outcomes.append(call())
+        except Exception as exc:
+            outcomes.append(exc)
+    return outcomes
+
 
 class RuleEngine:
     def __init__(
@@ -54,15 +83,30 @@ class RuleEngine:
         self.calendar_connector = calendar_connector
         self.ledger = ledger or ExecutionLedger(memory_manager.state_dir)
         self.permissions_policy = PermissionsPolicy()
+        self._write_lock = threading.Lock()
+        self.gmail_sync: GmailHistorySync | None = None
+        self.calendar_mirror: CalendarMirror | None = None
+        self.fence: Callable[[], object] | None = None
 
     def evaluate_rule(self, rule: Rule, ctx: dict | None = None) -> RuleRunResult:
         correlation_id = str((ctx or {}).get("correlation_id") or uuid4())
         notes: list[str] = []
         with log_context(correlation_id=correlation_id, rule_id=rule.id):
             logger.info("rules_evaluation_started")
-            return self._evaluate_rule(rule=rule, correlation_id=correlation_id, notes=notes)
+            return self._evaluate_rule(
+                rule=rule,
+                correlation_id=correlation_id,
+                notes=notes,
+                shared_triggers=(ctx or {}).get("shared_triggers"),
+            )
 
-    def _evaluate_rule(self, rule: Rule, correlation_id: str, notes: list[str]) -> RuleRunResult:
+    def _evaluate_rule(
+        self,
+        rule: Rule,
+        correlation_id: str,
+        notes: list[str],
+        shared_triggers: dict[TriggerSignature, list[dict[str, Any]] | Exception] | None = None,
+    ) -> RuleRunResult:
         state = rule.state
         now = datetime.now(timezone.utc)
         state.last_run_iso = now.isoformat()
@@ -73,7 +117,7 @@ class RuleEngine:
                 self._sync_legacy_state(rule)
                 return RuleRunResult(rule_id=rule.id, ok=True, matched=False, match_count=0, notes=notes)
 
-            trigger_items, candidate_items, matching_items, match_notes = self.compute_matches(rule)
+            trigger_items, candidate_items, matching_items, match_notes = self.compute_matches(rule, shared_triggers=shared_triggers)
             match_count = len(matching_items)
             matched = match_count > 0
 
@@ -86,6 +130,13 @@ class RuleEngine:
                     if executed_actions >= rule.max_actions_per_run:
                         notes.append("action_cap_reached")
                         break
+                    if rule_cancelled():
+                        # The tick already gave up on this rule; its result is discarded, so act on nothing.
+                        notes.append("cancelled_after_timeout")
+                        logger.warning("rules_action_skipped_after_timeout", extra={"extra_fields": {"rule_id": rule.id}})
+                        break
+                    if self.fence is not None:
+                        self.fence()
                     if isinstance(action, RuleActionNotify):
                         body = self._render_notify(
                             action.body_template,
@@ -97,97 +148,9 @@ class RuleEngine:
                         notes.append("notify_sent")
                         executed_actions += 1
                     elif isinstance(action, RuleActionProposeStep):
-                        if is_safe_mode_enabled(self.memory_manager.state_dir):
-                            notes.extend(["safe_mode_blocked", "propose_step_blocked:safe_mode"])
-                            continue
-
-                        action_signature = {
-                            "skill_name": action.skill_name,
-                            "args": action.args,
-                            "rationale": action.rationale,
-                        }
-                        action_key = rule_action_key(
-                            rule_id=rule.id,
-                            action_index=action_index,
-                            item_id=first_item_id,
-                            signature=action_signature,
-                        )
-                        started = self.ledger.try_start(
-                            action_key,
-                            kind="rule_action",
-                            correlation_id=correlation_id,
-                            meta={"rule_id": rule.id, "item_id": first_item_id},
-                        )
-                        if not started:
-                            notes.append("deduped_by_ledger")
-                            continue
-
-                        step = PlanStep(
-                            description=f"Rule action for {action.skill_name}",
-                            skill_name=action.skill_name,
-                            args=json.dumps(action.args),
-                            requires_approval=True,
-                        )
-                        required_scopes = self._required_scopes_for_skill(action.skill_name)
-                        allowlist_ok, blocked_by_allowlist = self.permissions_policy.check_rules_allowlist(required_scopes)
-                        snapshot = self.permissions_policy.snapshot_model()
-                        if not allowlist_ok:
-                            self.ledger.mark(action_key, "failed", meta_update={"error": "rules_scope_blocked", "blocked_scopes": blocked_by_allowlist})
-                            notes.append("rules_scope_blocked")
-                            log_policy_event(
-                                self.memory_manager,
-                                correlation_id=correlation_id,
-                                source="rule",
-                                decision="denied",
-                                skill_name=action.skill_name,
-                                required_scopes=required_scopes,
-                                snapshot=snapshot,
-                                reason="allowlist_blocked",
-                                extra_meta={"rule_id": rule.id},
-                            )
-                            continue
-                        scopes_ok, disabled_scopes = self.permissions_policy.check_scopes(required_scopes)
-                        if not scopes_ok:
-                            self.ledger.mark(action_key, "failed", meta_update={"error": "policy_denied", "disabled_scopes": disabled_scopes})
-                            notes.append("policy_denied")
-                            log_policy_event(
-                                self.memory_manager,
-                                correlation_id=correlation_id,
-                                source="rule",
-                                decision="denied",
-                                skill_name=action.skill_name,
-                                required_scopes=required_scopes,
-                                snapshot=snapshot,
-                                reason="scope_disabled",
-                                extra_meta={"rule_id": rule.id},
-                            )
-                            continue
-                        log_policy_event(
-                            self.memory_manager,
-                            correlation_id=correlation_id,
-                            source="rule",
-                            decision="allowed",
-                            skill_name=action.skill_name,
-                            required_scopes=required_scopes,
-                            snapshot=snapshot,
-                            reason="allowed",
-                            extra_meta={"rule_id": rule.id},
-                        )
-                        try:
-                            approval = self.approval_service.create_pending(
-                                step=step,
-                                ctx=ContextPack(goal=f"Rule matched: {rule.name}", cwd=None),
-                                requester={"source": "rule", "rule_id": rule.id, "correlation_id": correlation_id},
-                                rationale=action.rationale,
-                                registry=self.registry,
-                                required_scopes=required_scopes,
-                            )
-                            self.ledger.mark(action_key, "succeeded", meta_update={"approval_id": approval.id})
-                            notes.append("approval_created")
-                            executed_actions += 1
-                        except Exception as exc:
-                            self.ledger.mark(action_key, "failed", meta_update={"error": str(exc)})
-                            raise
+                        with self._write_lock:
+                            if self._propose_step(rule, action, action_index, first_item_id, correlation_id, notes):
+                                executed_actions += 1
 
                 state.last_match_iso = now.isoformat()
                 if rule.cooldown_minutes > 0 and executed_actions > 0:
@@ -213,6 +176,107 @@ class RuleEngine:
             logger.exception("rules_evaluation_completed")
             return RuleRunResult(rule_id=rule.id, ok=False, matched=False, match_count=0, notes=notes, error=str(exc))
 
+    def _propose_step(
+        self,
+        rule: Rule,
+        action: RuleActionProposeStep,
+        action_index: int,
+        first_item_id: str | None,
+        correlation_id: str,
+        notes: list[str],
+    ) -> bool:
+        if is_safe_mode_enabled(self.memory_manager.state_dir):
+            notes.extend(["safe_mode_blocked", "propose_step_blocked:safe_mode"])
+            return False
+
+        action_signature = {
+            "skill_name": action.skill_name,
+            "args": action.args,
+            "rationale": action.rationale,
+        }
+        action_key = rule_action_key(
+            rule_id=rule.id,
+            action_index=action_index,
+            item_id=first_item_id,
+            signature=action_signature,
+        )
+        started = self.ledger.try_start(
+            action_key,
+            kind="rule_action",
+            correlation_id=correlation_id,
+            meta={"rule_id": rule.id, "item_id": first_item_id},
+        )
+        if not started:
+            notes.append("deduped_by_ledger")
+            return False
+
+        step = PlanStep(
+            description=f"Rule action for {action.skill_name}",
+            skill_name=action.skill_name,
+            args=json.dumps(action.args),
+            requires_approval=True,
+        )
+        required_scopes = self._required_scopes_for_skill(action.skill_name)
+        allowlist_ok, blocked_by_allowlist = self.permissions_policy.check_rules_allowlist(required_scopes)
+        snapshot = self.permissions_policy.snapshot_model()
+        if not allowlist_ok:
+            self.ledger.mark(action_key, "failed", meta_update={"error": "rules_scope_blocked", "blocked_scopes": blocked_by_allowlist})
+            notes.append("rules_scope_blocked")
+            log_policy_event(
+                self.memory_manager,
+                correlation_id=correlation_id,
+                source="rule",
+                decision="denied",
+                skill_name=action.skill_name,
+                required_scopes=required_scopes,
+                snapshot=snapshot,
+                reason="allowlist_blocked",
+                extra_meta={"rule_id": rule.id},
+            )
+            return False
+        scopes_ok, disabled_scopes = self.permissions_policy.check_scopes(required_scopes)
+        if not scopes_ok:
+            self.ledger.mark(action_key, "failed", meta_update={"error": "policy_denied", "disabled_scopes": disabled_scopes})
+            notes.append("policy_denied")
+            log_policy_event(
+                self.memory_manager,
+                correlation_id=correlation_id,
+                source="rule",
+                decision="denied",
+                skill_name=action.skill_name,
+                required_scopes=required_scopes,
+                snapshot=snapshot,
+                reason="scope_disabled",
+                extra_meta={"rule_id": rule.id},
+            )
+            return False
+        log_policy_event(
+            self.memory_manager,
+            correlation_id=correlation_id,
+            source="rule",
+            decision="allowed",
+            skill_name=action.skill_name,
+            required_scopes=required_scopes,
+            snapshot=snapshot,
+            reason="allowed",
+            extra_meta={"rule_id": rule.id},
+        )
+        try:
+            approval = self.approval_service.create_pending(
+                step=step,
+                ctx=ContextPack(goal=f"Rule matched: {rule.name}", cwd=None),
+                requester={"source": "rule", "rule_id": rule.id, "correlation_id": correlation_id},
+                rationale=action.rationale,
+                registry=self.registry,
+                required_scopes=required_scopes,
+            )
+            self.ledger.mark(action_key, "succeeded", meta_update={"approval_id": approval.id})
+            notes.append("approval_created")
+            return True
+        except Exception as exc:
+            self.ledger.mark(action_key, "failed", meta_update={"error": str(exc)})
+            raise
+
     def evaluate_rule_preview(self, rule: Rule, ctx: dict | None = None, include_seen: bool = False) -> RuleTestPreview:
         del ctx
         now = datetime.now(timezone.utc)
@@ -244,10 +308,15 @@ class RuleEngine:
             notes=notes,
         )
 
-    def compute_matches(self, rule: Rule, include_seen: bool = False) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]], list[str]]:
+    def compute_matches(
+        self,
+        rule: Rule,
+        include_seen: bool = False,
+        shared_triggers: dict[TriggerSignature, list[dict[str, Any]] | Exception] | None = None,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]], list[str]]:
         notes: list[str] = []
         try:
-            trigger_items = self._load_trigger_items(rule)
+            trigger_items = self._trigger_items_for(rule, shared_triggers)
         except ServiceDegradedError as exc:
             service = exc.service
             notes.append(f"service_degraded:{service}")
@@ -333,6 +402,43 @@ class RuleEngine:
         cooldown_until = self._parse_iso(rule.state.cooldown_until_iso)
         return cooldown_until is not None and cooldown_until > now
 
+    @staticmethod
+    def trigger_signature(rule: Rule) -> TriggerSignature:
+        trigger = rule.trigger
+        window = trigger.hours_ahead if trigger.type == "calendar" else 0
+        return trigger.type, trigger.query or "", window
+
+    def load_shared_triggers(
+        self,
+        rules: list[Rule],
+        runner: Callable[[list[Callable[[], Any]]], list[Any]] | None = None,
+    ) -> dict[TriggerSignature, list[dict[str, Any]] | Exception]:
+        now = datetime.now(timezone.utc)
+        groups: dict[TriggerSignature, Rule] = {}
+        for rule in rules:
+            if self._is_cooldown_active(rule, now):
+                continue
+            signature = self.trigger_signature(rule)
+            widest = groups.get(signature)
+            if widest is None or rule.trigger.max_results > widest.trigger.max_results:
+                groups[signature] = rule
+
+        calls = [partial(self._load_trigger_items, rule) for rule in groups.values()]
+        outcomes = (runner or _run_sequential)(calls)
+        return dict(zip(groups, outcomes))
+
+    def _trigger_items_for(
+        self,
+        rule: Rule,
+        shared_triggers: dict[TriggerSignature, list[dict[str, Any]] | Exception] | None,
+    ) -> list[dict[str, Any]]:
+        shared = (shared_triggers or {}).get(self.trigger_signature(rule))
+        if shared is None:
+            return self._load_trigger_items(rule)
+        if isinstance(shared, Exception):
+            raise shared
+        return shared[: rule.trigger.max_results]
+
     def _load_trigger_items(self, rule: Rule) -> list[dict[str, Any]]:
         trigger = rule.trigger
         if trigger.type == "schedule":
@@ -348,7 +454,11 @@ class RuleEngine:
         if trigger.type == "gmail":
             if self.email_connector is None:
                 return []
-            messages = self.email_connector.search_messages(query=trigger.query or "", max_results=trigger.max_results)
+            messages = None
+            if self.gmail_sync is not None:
+                messages = self.gmail_sync.search(trigger.query or "", trigger.max_results)
+            if messages is None:
+                messages = self.email_connector.search_messages(query=trigger.query or "", max_results=trigger.max_results)
             items: list[dict[str, Any]] = []
             for message in messages:
                 item_id = str(message.get("thread_id") or message.get("id") or "")
@@ -375,13 +485,18 @@ class RuleEngine:
             if self.calendar_connector is None:
                 return []
             now = datetime.now(timezone.utc)
-            events = self.calendar_connector.search_events(
-                calendar_id="primary",
-                time_min_iso=now.isoformat(),
-                time_max_iso=(now + timedelta(hours=trigger.hours_ahead)).isoformat(),
-                query=trigger.query,
-                max_results=trigger.max_results,
-            )
+            window = {
+                "calendar_id": "primary",
+                "time_min_iso": now.isoformat(),
+                "time_max_iso": (now + timedelta(hours=trigger.hours_ahead)).isoformat(),
+                "query": trigger.query,
+                "max_results": trigger.max_results,
+            }
+            events = None
+            if self.calendar_mirror is not None:
+                events = self.calendar_mirror.search_events(**window)
+            if events is None:
+                events = self.calendar_connector.search_events(**window)
             items: list[dict[str, Any]] = []
             for event in events:
                 item_id = str(event.get("id") or "")
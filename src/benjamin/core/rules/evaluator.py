@@ -1,22 +1,18 @@
 from __future__ import annotations
 
 import logging
-from pathlib import Path
+import time
 from uuid import uuid4
 
-from benjamin.core.approvals.service import ApprovalService
-from benjamin.core.approvals.store import ApprovalStore
 from benjamin.core.integrations.base import CalendarConnector, EmailConnector
 from benjamin.core.ledger.keys import job_run_key
-from benjamin.core.ledger.ledger import ExecutionLedger
 from benjamin.core.logging.context import log_context
-from benjamin.core.memory.manager import MemoryManager
-from benjamin.core.notifications.notifier import NotificationRouter, build_notification_router
-from benjamin.core.orchestration.orchestrator import Orchestrator
+from benjamin.core.models.llm_dispatch import llm_priority
+from benjamin.core.notifications.notifier import NotificationRouter
+from benjamin.core.scheduler.leader import check_fencing
 
-from .engine import RuleEngine
+from .runtime import get_rules_runtime
 from .schemas import RuleRunResult
-from .store import RuleStore
 
 
 logger = logging.getLogger("benjamin.rules.evaluator")
@@ -30,20 +26,25 @@ def run_rules_evaluation(
     calendar_connector: CalendarConnector | None = None,
     email_connector: EmailConnector | None = None,
 ) -> list[RuleRunResult]:
-    memory_manager = MemoryManager(state_dir=Path(state_dir))
-    ledger = ExecutionLedger(memory_manager.state_dir)
+    started_at = time.perf_counter()
+    runtime = get_rules_runtime(state_dir)
+    memory_manager = runtime.memory_manager
+    ledger = runtime.ledger
     run_correlation_id = str(uuid4())
     effective_job_id = job_id or "rules-evaluator"
     job_key: str | None = None
-    with log_context(correlation_id=run_correlation_id, job_id=effective_job_id):
+    fencing_token: int | None = None
+    with log_context(correlation_id=run_correlation_id, job_id=effective_job_id), llm_priority("rule"):
         logger.info("rules_evaluation_started")
         if job_id is not None:
             job_key = job_run_key(job_id=effective_job_id, scheduled_run_iso=scheduled_run_iso)
+            fencing_token = check_fencing(state_dir)
             started = ledger.try_start(
                 job_key,
                 kind="job_run",
                 correlation_id=run_correlation_id,
                 meta={"job_id": effective_job_id, "scheduled_run_iso": scheduled_run_iso},
+                fencing_token=fencing_token,
             )
             if not started:
                 memory_manager.episodic.append(
@@ -54,37 +55,26 @@ def run_rules_evaluation(
                 logger.info("job_completed", extra={"extra_fields": {"skipped_idempotent": True}})
                 return []
 
-        orchestrator = Orchestrator(
-            memory_manager=memory_manager,
-            calendar_connector=calendar_connector,
-            email_connector=email_connector,
-        )
-        approval_service = ApprovalService(store=ApprovalStore(memory_manager.state_dir), memory_manager=memory_manager, ledger=ledger)
-        rule_store = RuleStore(memory_manager.state_dir)
-        rule_engine = RuleEngine(
-            memory_manager=memory_manager,
-            approval_service=approval_service,
-            registry=orchestrator.registry,
-            notifier=router or build_notification_router(),
-            email_connector=email_connector,
-            calendar_connector=calendar_connector,
-            ledger=ledger,
-        )
-
-        results: list[RuleRunResult] = []
         try:
-            for rule in rule_store.list_all():
-                if not rule.enabled:
-                    continue
-                result = rule_engine.evaluate_rule(rule, ctx={"correlation_id": run_correlation_id})
-                rule_store.upsert(rule)
-                results.append(result)
+            results = runtime.tick(
+                correlation_id=run_correlation_id,
+                router=router,
+                calendar_connector=calendar_connector,
+                email_connector=email_connector,
+                fence=(lambda: check_fencing(state_dir)) if job_id is not None else None,
+            )
             if job_key is not None:
-                ledger.mark(job_key, "succeeded", meta_update={"rule_count": len(results)})
-            logger.info("rules_evaluation_completed", extra={"extra_fields": {"rule_count": len(results)}})
+                ledger.mark(job_key, "succeeded", meta_update={"rule_count": len(results)}, fencing_token=fencing_token)
+            logger.info(
+                "rules_evaluation_completed",
+                extra={"extra_fields": {"rule_count": len(results), "duration_ms": round((time.perf_counter() - started_at) * 1000.0, 3)}},
+            )
             return results
         except Exception as exc:
             if job_key is not None:
-                ledger.mark(job_key, "failed", meta_update={"error": str(exc)})
-            logger.exception("rules_evaluation_completed")
+                ledger.mark(job_key, "failed", meta_update={"error": str(exc)}, fencing_token=fencing_token)
+            logger.exception(
+                "rules_evaluation_completed",
+                extra={"extra_fields": {"duration_ms": round((time.perf_counter() - started_at) * 1000.0, 3)}},
+            )
             raise
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+from benjamin.core.infra.services import get_services
 from benjamin.core.models.llm_provider import BenjaminLLM, LLMOutputError, LLMUnavailable
 from benjamin.core.rules.schemas import RuleActionProposeStep, RuleCreate
 
 
 class RuleNLBuilder:
     def __init__(self, llm: BenjaminLLM | None = None) -> None:
-        self.llm = llm or BenjaminLLM()
+        self.llm = llm or get_services().llm()
         self.enabled = BenjaminLLM.feature_enabled("BENJAMIN_LLM_RULE_BUILDER")
 
     def from_text(self, text: str, known_write_skills: set[str] | None = None) -> RuleCreate:
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import contextvars
+import logging
+import math
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from benjamin.core.approvals.service import ApprovalService
+from benjamin.core.approvals.store import ApprovalStore
+from benjamin.core.infra.services import get_services
+from benjamin.core.integrations.base import CalendarConnector, EmailConnector
+from benjamin.core.integrations.calendar_sync import calendar_sync_enabled
+from benjamin.core.integrations.gmail_sync import GmailHistorySync, gmail_sync_mode
+from benjamin.core.ledger.ledger import ExecutionLedger
+from benjamin.core.memory.manager import MemoryManager
+from benjamin.core.notifications.notifier import NotificationRouter, build_notification_router
+from benjamin.core.observability.latency import LatencyHistogram
+from benjamin.core.orchestration.orchestrator import Orchestrator
+
+from .engine import RuleEngine, bind_cancel_event
+from .schemas import Rule, RuleRunResult
+from .store import RuleStore
+
+
+logger = logging.getLogger("benjamin.rules.runtime")
+
+
+class RuleTimeoutError(TimeoutError):
+    pass
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+class RulesRuntime:
+    def __init__(self, memory_manager: MemoryManager) -> None:
+        self.memory_manager = memory_manager
+        self.state_dir = memory_manager.state_dir
+        self.ledger = ExecutionLedger(self.state_dir)
+        self.orchestrator = Orchestrator(memory_manager=memory_manager, ledger=self.ledger)
+        self.approval_service = ApprovalService(store=ApprovalStore(self.state_dir), memory_manager=memory_manager, ledger=self.ledger)
+        self.rule_store = RuleStore(self.state_dir)
+        self.engine = RuleEngine(
+            memory_manager=memory_manager,
+            approval_service=self.approval_service,
+            registry=self.orchestrator.registry,
+            notifier=None,
+            ledger=self.ledger,
+        )
+        self.tick_latency = LatencyHistogram()
+        self.last_tick: dict[str, object] | None = None
+        self.reload_count = 0
+        self._default_router: NotificationRouter | None = None
+        self._rules: list[Rule] = []
+        self._rules_signature: tuple[int, int] | None = None
+        self._lock = threading.Lock()
+        self.concurrency = max(1, int(_env_number("BENJAMIN_RULES_CONCURRENCY", 4)))
+        self.rule_timeout_s = max(0.1, _env_number("BENJAMIN_RULES_TIMEOUT_S", 60.0))
+        self.last_run_flush_s = max(0.0, _env_number("BENJAMIN_RULES_LAST_RUN_FLUSH_S", 900.0))
+        self._pool: ThreadPoolExecutor | None = None
+        self._runaway_lock = threading.Lock()
+        self.runaway_workers = 0
+        self.runaway_total = 0
+        self.gmail_sync: GmailHistorySync | None = None
+
+    def bind(
+        self,
+        router: NotificationRouter | None = None,
+        calendar_connector: CalendarConnector | None = None,
+        email_connector: EmailConnector | None = None,
+    ) -> None:
+        if router is None:
+            if self._default_router is None:
+                self._default_router = build_notification_router(self.state_dir)
+            router = self._default_router
+        self.engine.notifier = router
+        self.engine.email_connector = email_connector
+        self.engine.calendar_connector = calendar_connector
+
+    def tick(
+        self,
+        correlation_id: str,
+        router: NotificationRouter | None = None,
+        calendar_connector: CalendarConnector | None = None,
+        email_connector: EmailConnector | None = None,
+        fence: Callable[[], object] | None = None,
+    ) -> list[RuleRunResult]:
+        with self._lock:
+            self.bind(router=router, calendar_connector=calendar_connector, email_connector=email_connector)
+            self.engine.fence = fence
+            started_iso = datetime.now(timezone.utc).isoformat()
+            started = time.perf_counter()
+            reloaded = self._refresh_rules()
+            loaded = time.perf_counter()
+
+            enabled = [(index, rule) for index, rule in enumerate(self._rules) if rule.enabled]
+            if any(rule.trigger.type == "gmail" for _, rule in enabled):
+                self._sync_gmail()
+            if any(rule.trigger.type == "calendar" for _, rule in enabled):
+                self._sync_calendar()
+            synced = time.perf_counter()
+            shared_triggers = self.engine.load_shared_triggers([rule for _, rule in enabled], runner=self._run_bounded)
+            fetched = time.perf_counter()
+
+            ctx = {"correlation_id": correlation_id, "shared_triggers": shared_triggers}
+            working = [rule.model_copy(deep=True) for _, rule in enabled]
+            outcomes = self._run_bounded([self._evaluate_call(rule, ctx) for rule in working])
+            evaluated: list[tuple[int, Rule, RuleRunResult]] = []
+            timed_out = 0
+            for (index, _), rule, outcome in zip(enabled, working, outcomes):
+                if isinstance(outcome, RuleRunResult):
+                    evaluated.append((index, rule, outcome))
+                    continue
+                timed_out += isinstance(outcome, RuleTimeoutError)
+                logger.warning("rules_rule_failed", extra={"extra_fields": {"rule_id": rule.id, "error": str(outcome)}})
+                evaluated.append((index, self._rules[index], self._failed_result(rule, outcome)))
+            finished_eval = time.perf_counter()
+
+            if fence is not None:
+                fence()
+            externally_changed = self._signature() != self._rules_signature
+            # last_run_iso alone changes on every evaluation; it is only written with other changes or once it is stale.
+            dirty: list[tuple[int, Rule]] = []
+            for index, rule, _ in evaluated:
+                if rule.state.dirty or rule.state.run_marker_stale(self.last_run_flush_s):
+                    dirty.append((index, rule))
+                elif rule is not self._rules[index]:
+                    self._rules[index] = rule
+            stored = {rule.id: rule for rule in self.rule_store.upsert_many(rule for _, rule in dirty)}
+            for index, rule in dirty:
+                if rule.id in stored:
+                    self._rules[index] = stored[rule.id]
+                else:
+                    externally_changed = True
+            self._rules_signature = None if externally_changed else self._signature()
+            finished = time.perf_counter()
+
+            results = [result for _, _, result in evaluated]
+            total_ms = (finished - started) * 1000.0
+            self.tick_latency.observe(total_ms)
+            self.last_tick = {
+                "started_iso": started_iso,
+                "rule_count": len(results),
+                "timed_out": timed_out,
+                "runaway_workers": self.runaway_workers,
+                "persisted": len(dirty),
+                "concurrency": self.concurrency,
+                "reloaded": reloaded,
+                "trigger_fetches": len(shared_triggers),
+                "load_ms": round((loaded - started) * 1000.0, 3),
+                "sync_ms": round((synced - loaded) * 1000.0, 3),
+                "fetch_ms": round((fetched - synced) * 1000.0, 3),
+                "evaluate_ms": round((finished_eval - fetched) * 1000.0, 3),
+                "persist_ms": round((finished - finished_eval) * 1000.0, 3),
+                "total_ms": round(total_ms, 3),
+            }
+            logger.info("rules_tick_timings", extra={"extra_fields": dict(self.last_tick)})
+            return results
+
+    def close(self) -> None:
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "rules_cached": len(self._rules),
+            "reload_count": self.reload_count,
+            "last_tick": self.last_tick,
+            "tick_latency": self.tick_latency.summary(),
+            "runaway_workers": self.runaway_workers,
+            "runaway_total": self.runaway_total,
+            "gmail_sync": self.gmail_sync.snapshot() if self.gmail_sync is not None else None,
+            "calendar_mirror": get_services(self.state_dir).calendar_mirror().snapshot(),
+        }
+
+    def _sync_gmail(self) -> None:
+        connector = self.engine.email_connector
+        self.engine.gmail_sync = None
+        if gmail_sync_mode() != "history" or not hasattr(connector, "history_since"):
+            return
+        if self.gmail_sync is None:
+            self.gmail_sync = GmailHistorySync(connector, self.state_dir)
+        self.gmail_sync.connector = connector
+        try:
+            self.gmail_sync.sync()
+        except Exception as exc:
+            logger.warning("gmail_history_sync_failed", extra={"extra_fields": {"error": str(exc)}})
+            return
+        self.engine.gmail_sync = self.gmail_sync
+
+    def _sync_calendar(self) -> None:
+        connector = self.engine.calendar_connector
+        self.engine.calendar_mirror = None
+        if not calendar_sync_enabled() or not hasattr(connector, "list_event_changes"):
+            return
+        mirror = get_services(self.state_dir).calendar_mirror()
+        try:
+            mirror.sync(connector, "primary")
+        except Exception as exc:
+            logger.warning("calendar_sync_failed", extra={"extra_fields": {"error": str(exc)}})
+            return
+        self.engine.calendar_mirror = mirror
+
+    def _evaluate_call(self, rule: Rule, ctx: dict[str, Any]) -> Callable[[], RuleRunResult]:
+        return lambda: self.engine.evaluate_rule(rule, ctx=ctx)
+
+    @staticmethod
+    def _failed_result(rule: Rule, exc: BaseException) -> RuleRunResult:
+        note = "rule_timeout" if isinstance(exc, RuleTimeoutError) else "rule_failed"
+        return RuleRunResult(rule_id=rule.id, ok=False, matched=False, match_count=0, notes=[note], error=str(exc))
+
+    def _run_bounded(self, calls: list[Callable[[], Any]]) -> list[Any]:
+        if self.concurrency <= 1 or len(calls) <= 1:
+            outcomes: list[Any] = []
+            for call in calls:
+                try:
+                    outcomes.append(call())
+                except Exception as exc:
+                    outcomes.append(exc)
+            return outcomes
+
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="benjamin-rules")
+        started_at: dict[int, float] = {}
+        cancel_events = [threading.Event() for _ in calls]
+
+        def run(position: int, call: Callable[[], Any]) -> Any:
+            started_at[position] = time.monotonic()
+            bind_cancel_event(cancel_events[position])
+            return call()
+
+        futures: dict[Future, int] = {
+            self._pool.submit(contextvars.copy_context().run, run, position, call): position
+            for position, call in enumerate(calls)
+        }
+        results: list[Any] = [None] * len(calls)
+        deadline = time.monotonic() + self.rule_timeout_s * (math.ceil(len(calls) / self.concurrency) + 1)
+        pending = set(futures)
+        while pending:
+            now = time.monotonic()
+            for future in list(pending):
+                position = futures[future]
+                began = started_at.get(position)
+                expired = began is not None and now - began >= self.rule_timeout_s
+                if (expired or now >= deadline) and not future.done():
+                    cancel_events[position].set()
+                    if not future.cancel():
+                        self._track_runaway(future)
+                    pending.discard(future)
+                    results[position] = RuleTimeoutError(f"timed out after {self.rule_timeout_s:g}s")
+            if not pending:
+                break
+            waits = [started_at[futures[future]] + self.rule_timeout_s - now for future in pending if futures[future] in started_at]
+            timeout = min([deadline - now, *waits])
+            done, pending = wait(pending, timeout=max(0.005, timeout), return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as exc:
+                    results[futures[future]] = exc
+        return results
+
+    def _track_runaway(self, future: Future) -> None:
+        """Threads cannot be interrupted: a timed-out call keeps its pool worker until it returns."""
+        with self._runaway_lock:
+            self.runaway_workers += 1
+            self.runaway_total += 1
+            running = self.runaway_workers
+        logger.warning("rules_worker_runaway", extra={"extra_fields": {"runaway_workers": running, "pool_size": self.concurrency}})
+
+        def _finished(_: Future) -> None:
+            with self._runaway_lock:
+                self.runaway_workers -= 1
+
+        future.add_done_callback(_finished)
+
+    def _refresh_rules(self) -> bool:
+        signature = self._signature()
+        if signature is not None and signature == self._rules_signature:
+            return False
+        self._rules = self.rule_store.list_all()
+        self._rules_signature = signature
+        self.reload_count += 1
+        return True
+
+    def _signature(self) -> tuple[int, int] | None:
+        try:
+            stat = self.rule_store.file_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+
+def get_rules_runtime(state_dir: Path | str | None = None) -> RulesRuntime:
+    return get_services(state_dir).rules_runtime()
@@ -4,13 +4,22 @@ from datetime import datetime, timezone
 from typing import Any, Literal
 from uuid import uuid4
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 
 def now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _parse_iso(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
 class RuleActionNotify(BaseModel):
     type: Literal["notify"]
     title: str
@@ -86,6 +95,27 @@ class RuleState(BaseModel):
     seen_ids_max: int = 200
     last_cursor_iso: str | None = None
 
+    _clean_snapshot: dict[str, Any] | None = PrivateAttr(default=None)
+
+    def mark_clean(self) -> None:
+        self._clean_snapshot = self.model_dump()
+
+    @property
+    def dirty(self) -> bool:
+        """State other than the last_run_iso marker changed since the rule was loaded or stored."""
+        if self._clean_snapshot is None:
+            return True
+        clean = {key: value for key, value in self._clean_snapshot.items() if key != "last_run_iso"}
+        return self.model_dump(exclude={"last_run_iso"}) != clean
+
+    def run_marker_stale(self, max_age_s: float) -> bool:
+        """last_run_iso has moved at least max_age_s past the value last stored."""
+        current = _parse_iso(self.last_run_iso)
+        if current is None:
+            return False
+        stored = _parse_iso(self._clean_snapshot.get("last_run_iso")) if self._clean_snapshot is not None else None
+        return stored is None or (current - stored).total_seconds() >= max_age_s
+
 
 class Rule(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid4()))
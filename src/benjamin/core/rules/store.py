@@ -1,15 +1,44 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms only serialize within the process
+    fcntl = None  # type: ignore[assignment]
 
 from .schemas import Rule, RuleState, now_iso
 
+_path_locks: dict[Path, threading.RLock] = {}
+_path_locks_guard = threading.Lock()
+
 
 class RuleStore:
     def __init__(self, state_dir: Path) -> None:
         self.file_path = state_dir / "rules.jsonl"
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock_path = state_dir / "rules.lock"
+        with _path_locks_guard:
+            self._lock = _path_locks.setdefault(self.file_path.resolve(), threading.RLock())
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Serialize read-modify-write cycles across threads and processes sharing rules.jsonl."""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                os.close(fd)
 
     def _load_all(self) -> list[Rule]:
         if not self.file_path.exists():
@@ -21,13 +50,13 @@ class RuleStore:
                 if not line:
                     continue
                 try:
-                    records.append(self._migrate_rule(Rule.model_validate(json.loads(line))))
+                    rule = self._migrate_rule(Rule.model_validate(json.loads(line)))
                 except (json.JSONDecodeError, ValueError):
                     continue
+                rule.state.mark_clean()
+                records.append(rule)
         return records
 
-
-
     def _migrate_rule(self, rule: Rule) -> Rule:
         state = rule.state
         updates: dict[str, object] = {}
@@ -46,10 +75,13 @@ class RuleStore:
 
     def _write_all(self, rules: list[Rule]) -> None:
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
-        with self.file_path.open("w", encoding="utf-8") as handle:
+        tmp_path = self.file_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
             for rule in rules:
-                normalized = self._migrate_rule(rule)
-                handle.write(json.dumps(normalized.model_dump(), ensure_ascii=False) + "\n")
+                handle.write(json.dumps(rule.model_dump(), ensure_ascii=False) + "\n")
+        tmp_path.replace(self.file_path)
+        for rule in rules:
+            rule.state.mark_clean()
 
     def list_all(self) -> list[Rule]:
         return list(reversed(self._load_all()))
@@ -61,24 +93,45 @@ class RuleStore:
         return None
 
     def upsert(self, rule: Rule) -> Rule:
-        rules = self._load_all()
         normalized = self._migrate_rule(rule)
         updated = normalized.model_copy(update={"updated_at_iso": now_iso()})
-        for idx, current in enumerate(rules):
-            if current.id == updated.id:
-                rules[idx] = updated
-                self._write_all(rules)
-                return updated
-        rules.append(updated)
-        self._write_all(rules)
+        with self._locked():
+            rules = self._load_all()
+            for idx, current in enumerate(rules):
+                if current.id == updated.id:
+                    rules[idx] = updated
+                    self._write_all(rules)
+                    return updated
+            rules.append(updated)
+            self._write_all(rules)
         return updated
 
+    def upsert_many(self, rules: Iterable[Rule]) -> list[Rule]:
+        """Persist evaluation state for rules that still exist; definitions on disk win over the caller's copies."""
+        states = {rule.id: rule.state for rule in rules}
+        if not states:
+            return []
+        stored: list[Rule] = []
+        with self._locked():
+            records = self._load_all()
+            for idx, current in enumerate(records):
+                state = states.get(current.id)
+                if state is None:
+                    continue
+                merged = self._migrate_rule(current.model_copy(update={"state": state}))
+                records[idx] = merged.model_copy(update={"updated_at_iso": now_iso()})
+                stored.append(records[idx])
+            if stored:
+                self._write_all(records)
+        return stored
+
     def delete(self, rule_id: str) -> bool:
-        rules = self._load_all()
-        filtered = [rule for rule in rules if rule.id != rule_id]
-        if len(filtered) == len(rules):
-            return False
-        self._write_all(filtered)
+        with self._locked():
+            rules = self._load_all()
+            filtered = [rule for rule in rules if rule.id != rule_id]
+            if len(filtered) == len(rules):
+                return False
+            self._write_all(filtered)
         return True
 
     def set_enabled(self, rule_id: str, enabled: bool) -> Rule | None:
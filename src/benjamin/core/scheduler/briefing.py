@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import contextvars
+import json
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from benjamin.core.infra.breaker_manager import ServiceDegradedError
+from benjamin.core.infra.services import get_services
+from benjamin.core.integrations.base import CalendarConnector, EmailConnector
+from benjamin.core.memory.manager import MemoryManager
+from benjamin.core.models.llm_dispatch import llm_priority
+from benjamin.core.summarize.summarizer import Summarizer
+
+
+logger = logging.getLogger("benjamin.scheduler.briefing")
+
+_SECTION_SERVICES = {"schedule": "calendar", "email": "gmail", "threads": "gmail"}
+
+
+def _section_timeout_s() -> float:
+    try:
+        return max(0.1, float(os.getenv("BENJAMIN_BRIEFING_SECTION_TIMEOUT_S", "20")))
+    except ValueError:
+        return 20.0
+
+
+def thread_bullets_enabled() -> bool:
+    return os.getenv("BENJAMIN_BRIEFING_THREAD_BULLETS", "off").strip().casefold() == "on"
+
+
+def briefing_prefetch_minutes() -> int:
+    try:
+        return max(0, int(os.getenv("BENJAMIN_BRIEFING_PREFETCH_MINUTES", "0")))
+    except ValueError:
+        return 0
+
+
+@dataclass
+class BriefingSections:
+    schedule: list[dict] = field(default_factory=list)
+    messages: list[dict] = field(default_factory=list)
+    thread_snippets: list[list[str]] = field(default_factory=list)
+    thread_bullets: list[list[str]] = field(default_factory=list)
+    recent_events: list[str] = field(default_factory=list)
+    preferences: list[tuple[str, str]] = field(default_factory=list)
+    degraded_services: list[str] = field(default_factory=list)
+    late_sections: list[str] = field(default_factory=list)
+    section_timings_ms: dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> BriefingSections:
+        known = {name: payload[name] for name in cls.__dataclass_fields__ if name in payload}
+        known["preferences"] = [tuple(item) for item in known.get("preferences", [])]
+        return cls(**known)
+
+    def section_map(self) -> dict[str, str]:
+        section_map: dict[str, str] = {}
+        if self.schedule:
+            section_map["schedule"] = "\n".join(self._schedule_lines())
+        if self.messages:
+            section_map["email"] = "\n".join(self._email_lines())
+        section_map["recent_episodes"] = "\n".join(self._event_lines())
+        section_map["preferences"] = "\n".join(self._preference_lines())
+        return section_map
+
+    def render(self) -> str:
+        sections: list[str] = []
+        if self.schedule:
+            sections.extend(["Today's schedule:", *self._schedule_lines(), ""])
+        if self.messages:
+            sections.extend(["Important emails:", *self._email_lines(), ""])
+        sections.extend(["Recent episodes:", *self._event_lines(), "", "Top preferences:", *self._preference_lines()])
+        if self.late_sections:
+            sections.insert(0, f"Still loading: {', '.join(self.late_sections)}; showing partial briefing")
+            sections.insert(1, "")
+        if self.degraded_services:
+            sections.insert(0, "Email/Calendar currently degraded; showing memory-only sections")
+            sections.insert(1, "")
+        return "\n".join(sections)
+
+    def _schedule_lines(self) -> list[str]:
+        return [f"- {event.get('start_iso')} | {event.get('title', '(untitled)')}" for event in self.schedule[:5]]
+
+    def _email_lines(self) -> list[str]:
+        lines: list[str] = []
+        for index, msg in enumerate(self.messages[:5]):
+            bullets = self.thread_bullets[index] if index < len(self.thread_bullets) else []
+            snippets = self.thread_snippets[index] if index < len(self.thread_snippets) else []
+            if bullets:
+                snippet = bullets[0]
+            else:
+                snippet = snippets[0] if snippets else msg.get("snippet", "")
+            lines.append(f"- {msg.get('subject', '(no subject)')} — {snippet}")
+        return lines
+
+    def _event_lines(self) -> list[str]:
+        return [f"- {summary}" for summary in self.recent_events] or ["- No recent events"]
+
+    def _preference_lines(self) -> list[str]:
+        return [f"- {key}: {value}" for key, value in self.preferences] or ["- No saved preferences"]
+
+
+def fetch_schedule(state_dir: str, calendar_connector: CalendarConnector, now: datetime) -> list[dict]:
+    window = {
+        "calendar_id": os.getenv("BENJAMIN_CALENDAR_ID", "primary"),
+        "time_min_iso": now.isoformat(),
+        "time_max_iso": (now + timedelta(hours=12)).isoformat(),
+        "query": None,
+        "max_results": 5,
+    }
+    schedule = get_services(state_dir).calendar_mirror().events(calendar_connector, **window)
+    if schedule is None:
+        schedule = calendar_connector.search_events(**window)
+    return schedule
+
+
+def _fetch_messages(email_connector: EmailConnector) -> list[dict]:
+    query = os.getenv("BENJAMIN_GMAIL_QUERY_IMPORTANT", "newer_than:1d -category:social -category:promotions")
+    return email_connector.search_messages(query=query, max_results=5)[:5]
+
+
+def _summarize_threads(email_connector: EmailConnector, messages: list[dict], summarizer: Summarizer) -> tuple[list[list[str]], list[list[str]]]:
+    thread_ids = [msg.get("thread_id", "") for msg in messages]
+    thread_summaries = getattr(email_connector, "thread_summaries", None)
+    if thread_summaries is not None:
+        summaries = thread_summaries(thread_ids, max_messages=3)
+    else:
+        summaries = [email_connector.thread_summary(thread_id, max_messages=3) for thread_id in thread_ids]
+    snippets: list[list[str]] = [summary.get("snippets", []) for summary in summaries]
+    bullets: list[list[str]] = [[] for _ in snippets]
+    # Thread bullets cost an extra LLM round-trip per briefing; by default the first snippet is used.
+    if summarizer.enabled and thread_bullets_enabled():
+        with llm_priority("maintenance"):
+            bullets = summarizer.summarize_bullets_batch(["\n".join(items) for items in snippets], max_bullets=1)
+    return snippets, bullets
+
+
+def _read_memory(memory: MemoryManager) -> tuple[list[str], list[tuple[str, str]]]:
+    recent_events = [event.summary for event in memory.episodic.list_recent(limit=3)]
+    preferences = [
+        (fact.key, str(fact.value)) for fact in memory.semantic.list_all(scope="global") if fact.key.startswith("preference:")
+    ][:5]
+    return recent_events, preferences
+
+
+def gather_briefing_sections(
+    state_dir: str,
+    memory: MemoryManager,
+    calendar_connector: CalendarConnector | None,
+    email_connector: EmailConnector | None,
+    now: datetime,
+    summarizer: Summarizer | None = None,
+    timeout_s: float | None = None,
+) -> BriefingSections:
+    """Fetch briefing sections concurrently; sections that miss their deadline are left out."""
+    active_summarizer = summarizer or Summarizer()
+    section_timeout = timeout_s if timeout_s is not None else _section_timeout_s()
+    result = BriefingSections()
+    stages: dict[str, Callable[[], Any]] = {"memory": lambda: _read_memory(memory)}
+    if calendar_connector is not None:
+        stages["schedule"] = lambda: fetch_schedule(state_dir, calendar_connector, now)
+    if email_connector is not None:
+        stages["email"] = lambda: _fetch_messages(email_connector)
+
+    pool = ThreadPoolExecutor(max_workers=len(stages) + 1, thread_name_prefix="briefing")
+    pending: dict[Future, tuple[str, float]] = {}
+
+    def _submit(name: str, fn: Callable[[], Any]) -> None:
+        context = contextvars.copy_context()
+        pending[pool.submit(context.run, fn)] = (name, time.perf_counter())
+
+    try:
+        for name, fn in stages.items():
+            _submit(name, fn)
+        while pending:
+            now_mono = time.perf_counter()
+            next_deadline = min(started + section_timeout for _, started in pending.values())
+            done, _ = wait(list(pending), timeout=max(0.0, next_deadline - now_mono), return_when=FIRST_COMPLETED)
+            finished_at = time.perf_counter()
+            for future in done:
+                name, started = pending.pop(future)
+                result.section_timings_ms[name] = round((finished_at - started) * 1000.0, 3)
+                try:
+                    value = future.result()
+                except ServiceDegradedError:
+                    result.degraded_services.append(_SECTION_SERVICES[name])
+                    continue
+                except Exception as exc:
+                    logger.warning("briefing_section_failed", extra={"extra_fields": {"section": name, "error": str(exc)}})
+                    if name == "memory":
+                        raise
+                    result.degraded_services.append(_SECTION_SERVICES[name])
+                    continue
+                if name == "memory":
+                    result.recent_events, result.preferences = value
+                elif name == "schedule":
+                    result.schedule = value
+                elif name == "email":
+                    result.messages = value
+                    if value:
+                        _submit("threads", lambda messages=value: _summarize_threads(email_connector, messages, active_summarizer))
+                elif name == "threads":
+                    result.thread_snippets, result.thread_bullets = value
+            for future, (name, started) in list(pending.items()):
+                if finished_at - started >= section_timeout:
+                    pending.pop(future)
+                    future.cancel()
+                    result.section_timings_ms[name] = round((finished_at - started) * 1000.0, 3)
+                    result.late_sections.append(name)
+                    logger.warning("briefing_section_timed_out", extra={"extra_fields": {"section": name, "timeout_s": section_timeout}})
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    result.degraded_services = sorted(set(result.degraded_services))
+    return result
+
+
+@dataclass
+class BriefingDraft:
+    prepared_iso: str
+    sections: BriefingSections
+    compressed: str | None = None
+
+    def refresh(self, fresh: BriefingSections) -> tuple[BriefingSections, str]:
+        """Overlay a delivery-time delta (schedule + memory) on the prefetched sections."""
+        schedule = self.sections.schedule
+        if "schedule" in fresh.section_timings_ms and "schedule" not in fresh.late_sections and "calendar" not in fresh.degraded_services:
+            schedule = fresh.schedule
+        merged = replace(
+            self.sections,
+            schedule=schedule,
+            recent_events=fresh.recent_events,
+            preferences=fresh.preferences,
+            degraded_services=sorted(set(self.sections.degraded_services) | set(fresh.degraded_services)),
+            late_sections=fresh.late_sections,
+            section_timings_ms=fresh.section_timings_ms,
+        )
+        if self.compressed and schedule == self.sections.schedule:
+            return merged, self.compressed
+        return merged, merged.render()
+
+
+def _draft_path(state_dir: str | Path) -> Path:
+    return Path(state_dir) / "briefing_draft.json"
+
+
+def save_briefing_draft(state_dir: str | Path, sections: BriefingSections, compressed: str | None) -> BriefingDraft:
+    draft = BriefingDraft(prepared_iso=datetime.now(timezone.utc).isoformat(), sections=sections, compressed=compressed)
+    path = _draft_path(state_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(asdict(draft), ensure_ascii=False), encoding="utf-8")
+    tmp_path.replace(path)
+    return draft
+
+
+def load_briefing_draft(state_dir: str | Path, max_age_s: float | None = None) -> BriefingDraft | None:
+    try:
+        payload = json.loads(_draft_path(state_dir).read_text(encoding="utf-8"))
+        prepared = datetime.fromisoformat(payload["prepared_iso"])
+        sections = BriefingSections.from_dict(payload["sections"])
+    except (FileNotFoundError, OSError, ValueError, KeyError, TypeError):
+        return None
+    limit = max_age_s if max_age_s is not None else max(2 * briefing_prefetch_minutes(), 30) * 60.0
+    if (datetime.now(timezone.utc) - prepared).total_seconds() > limit:
+        return None
+    return BriefingDraft(prepared_iso=payload["prepared_iso"], sections=sections, compressed=payload.get("compressed"))
+
+
+def discard_briefing_draft(state_dir: str | Path) -> None:
+    _draft_path(state_dir).unlink(missing_ok=True)
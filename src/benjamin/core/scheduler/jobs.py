@@ -2,30 +2,49 @@ from __future__ import annotations
 
 import logging
 import os
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from pathlib import Path
+from typing import Any, Callable
 from uuid import uuid4
 from zoneinfo import ZoneInfo
 
 from benjamin.core.integrations.base import CalendarConnector, EmailConnector
-from benjamin.core.infra.breaker_manager import ServiceDegradedError
+from benjamin.core.integrations.fake import build_fake_connectors
+from benjamin.core.integrations.google_auth import google_mode
+from benjamin.core.infra.services import get_services
 from benjamin.core.ledger.keys import job_run_key
 from benjamin.core.ledger.ledger import ExecutionLedger
 from benjamin.core.logging.context import log_context
 from benjamin.core.memory.manager import MemoryManager
+from benjamin.core.models.llm_dispatch import llm_priority
 from benjamin.core.notifications.notifier import NotificationRouter, build_notification_router
 from benjamin.core.summarize.summarizer import Summarizer
 
+from .briefing import (
+    BriefingSections,
+    discard_briefing_draft,
+    gather_briefing_sections,
+    load_briefing_draft,
+    save_briefing_draft,
+)
+from .leader import LeadershipLostError, StaleFencingTokenError, check_fencing, lease_ttl_s
+from .scheduler import requeue_job
+
 
 logger = logging.getLogger("benjamin.scheduler.jobs")
 
 
 def _memory_manager_for_state(state_dir: str) -> MemoryManager:
-    return MemoryManager(state_dir=Path(state_dir))
+    return get_services(state_dir).memory_manager()
 
 
 def _build_default_connectors(state_dir: str) -> tuple[CalendarConnector | None, EmailConnector | None]:
-    if os.getenv("BENJAMIN_GOOGLE_ENABLED", "off").casefold() != "on":
+    mode = google_mode()
+    if mode == "fake":
+        services = get_services(state_dir)
+        return build_fake_connectors(state_dir, breaker_manager=services.breaker_manager(), cache=services.gmail_cache())
+    if mode != "on":
         return None, None
 
     token_path = os.getenv("BENJAMIN_GOOGLE_TOKEN_PATH", str(Path(state_dir) / "google_token.json"))
@@ -33,11 +52,46 @@ def _build_default_connectors(state_dir: str) -> tuple[CalendarConnector | None,
         from benjamin.core.integrations.google_calendar import GoogleCalendarConnector
         from benjamin.core.integrations.google_gmail import GoogleGmailConnector
 
-        return GoogleCalendarConnector(token_path=token_path), GoogleGmailConnector(token_path=token_path)
+        services = get_services(state_dir)
+        breaker_manager = services.breaker_manager()
+        return (
+            GoogleCalendarConnector(token_path=token_path, breaker_manager=breaker_manager),
+            GoogleGmailConnector(token_path=token_path, breaker_manager=breaker_manager, cache=services.gmail_cache()),
+        )
     except Exception:
         return None, None
 
 
+def _elapsed_ms(started_at: float) -> float:
+    return round((time.perf_counter() - started_at) * 1000.0, 3)
+
+
+def _fence(state_dir: str, job_id: str | None) -> int | None:
+    """Scheduled runs (with a job_id) must still hold the scheduler lease; manual runs are not fenced."""
+    return check_fencing(state_dir) if job_id is not None else None
+
+
+_LEASE_ERRORS = (LeadershipLostError, StaleFencingTokenError)
+
+
+def _requeue_after_lost_lease(state_dir: str, scheduler_job_id: str, func: Callable[..., Any], kwargs: dict, error: Exception) -> None:
+    """The run was already taken off the job store; hand it back so the current leader delivers it."""
+    requeued = requeue_job(state_dir, scheduler_job_id, func, kwargs, delay_s=lease_ttl_s())
+    logger.warning(
+        "job_lease_lost",
+        extra={"extra_fields": {"requeued_as": scheduler_job_id if requeued else None, "error": str(error)}},
+    )
+
+
+def _release_run(ledger: ExecutionLedger, key: str, correlation_id: str, error: Exception, sent: bool = False) -> None:
+    """Close a started run without a fencing token (it may be the stale one) unless a newer run owns the key.
+
+    A run that already delivered is recorded as succeeded so a retry cannot send it twice.
+    """
+    meta_update = {"record_error": str(error)} if sent else {"error": str(error)}
+    ledger.mark(key, "succeeded" if sent else "failed", meta_update=meta_update, if_correlation_id=correlation_id)
+
+
 def _ledger_for_state(state_dir: str) -> ExecutionLedger:
     return ExecutionLedger(state_dir=Path(state_dir))
 
@@ -49,18 +103,26 @@ def run_reminder(
     scheduled_run_iso: str | None = None,
     router: NotificationRouter | None = None,
 ) -> None:
+    started_at = time.perf_counter()
     correlation_id = str(uuid4())
     effective_job_id = job_id or "reminder"
     with log_context(correlation_id=correlation_id, job_id=effective_job_id):
         logger.info("job_started")
         ledger = _ledger_for_state(state_dir)
         key = job_run_key(job_id=effective_job_id, scheduled_run_iso=scheduled_run_iso, extra={"message": message})
-        started = ledger.try_start(
-            key,
-            kind="job_run",
-            correlation_id=correlation_id,
-            meta={"job_id": effective_job_id, "scheduled_run_iso": scheduled_run_iso},
-        )
+        retry_kwargs = {"message": message, "state_dir": state_dir, "job_id": job_id, "scheduled_run_iso": scheduled_run_iso}
+        try:
+            fencing_token = _fence(state_dir, job_id)
+            started = ledger.try_start(
+                key,
+                kind="job_run",
+                correlation_id=correlation_id,
+                meta={"job_id": effective_job_id, "scheduled_run_iso": scheduled_run_iso},
+                fencing_token=fencing_token,
+            )
+        except _LEASE_ERRORS as exc:
+            _requeue_after_lost_lease(state_dir, effective_job_id, run_reminder, retry_kwargs, exc)
+            raise
 
         memory = _memory_manager_for_state(state_dir)
         if not started:
@@ -72,25 +134,65 @@ def run_reminder(
             logger.info("job_completed", extra={"extra_fields": {"skipped_idempotent": True}})
             return
 
-        active_router = router or build_notification_router()
+        active_router = router or build_notification_router(state_dir)
         notify_meta = {"correlation_id": correlation_id}
         if job_id:
             notify_meta["job_id"] = job_id
+        try:
+            _fence(state_dir, job_id)
+        except _LEASE_ERRORS as exc:
+            _release_run(ledger, key, correlation_id, exc)
+            _requeue_after_lost_lease(state_dir, effective_job_id, run_reminder, retry_kwargs, exc)
+            raise
+        sent = False
         try:
             active_router.send(title="Reminder", body=message, meta=notify_meta)
+            sent = True
             memory.episodic.append(
                 kind="notification",
                 summary=f"Sent reminder: {message}",
                 meta=notify_meta,
             )
-            ledger.mark(key, "succeeded")
-            logger.info("job_completed")
+            ledger.mark(key, "succeeded", fencing_token=fencing_token)
+            logger.info("job_completed", extra={"extra_fields": {"duration_ms": _elapsed_ms(started_at)}})
         except Exception as exc:
-            ledger.mark(key, "failed", meta_update={"error": str(exc)})
-            logger.exception("job_completed")
+            _release_run(ledger, key, correlation_id, exc, sent=sent)
+            logger.exception("job_completed", extra={"extra_fields": {"duration_ms": _elapsed_ms(started_at)}})
             raise
 
 
+
+def _compress_briefing(briefing: BriefingSections, summarizer: Summarizer) -> str | None:
+    if not summarizer.enabled:
+        return None
+    compress_started = time.perf_counter()
+    with llm_priority("maintenance"):
+        compressed = summarizer.compress_briefing(briefing.section_map())
+    briefing.section_timings_ms["compress"] = round((time.perf_counter() - compress_started) * 1000.0, 3)
+    return compressed if compressed.strip() else None
+
+
+def run_briefing_prefetch(
+    state_dir: str,
+    job_id: str | None = None,
+    calendar_connector: CalendarConnector | None = None,
+    email_connector: EmailConnector | None = None,
+) -> None:
+    correlation_id = str(uuid4())
+    with log_context(correlation_id=correlation_id, job_id=job_id or "daily-briefing-prefetch"):
+        logger.info("job_started")
+        memory = _memory_manager_for_state(state_dir)
+        if calendar_connector is None and email_connector is None:
+            calendar_connector, email_connector = _build_default_connectors(state_dir)
+        now = datetime.now(ZoneInfo(os.getenv("BENJAMIN_TIMEZONE", "America/New_York")))
+        summarizer = Summarizer()
+        briefing = gather_briefing_sections(state_dir, memory, calendar_connector, email_connector, now, summarizer=summarizer)
+        compressed = _compress_briefing(briefing, summarizer)
+        _fence(state_dir, job_id)
+        save_briefing_draft(state_dir, briefing, compressed)
+        logger.info("job_completed", extra={"extra_fields": {"section_timings_ms": briefing.section_timings_ms}})
+
+
 def run_daily_briefing(
     state_dir: str,
     job_id: str | None = None,
@@ -99,106 +201,42 @@ def run_daily_briefing(
     calendar_connector: CalendarConnector | None = None,
     email_connector: EmailConnector | None = None,
 ) -> None:
+    started_at = time.perf_counter()
     memory = _memory_manager_for_state(state_dir)
     if calendar_connector is None and email_connector is None:
         calendar_connector, email_connector = _build_default_connectors(state_dir)
-    recent_events = memory.episodic.list_recent(limit=3)
-    preferences = [
-        fact for fact in memory.semantic.list_all(scope="global") if fact.key.startswith("preference:")
-    ][:5]
-
     timezone = ZoneInfo(os.getenv("BENJAMIN_TIMEZONE", "America/New_York"))
     now = datetime.now(timezone)
-
-    sections: list[str] = []
-    section_map: dict[str, str] = {}
-    degraded_services: list[str] = []
-
-    if calendar_connector is not None:
-        try:
-            schedule = calendar_connector.search_events(
-                calendar_id=os.getenv("BENJAMIN_CALENDAR_ID", "primary"),
-                time_min_iso=now.isoformat(),
-                time_max_iso=(now + timedelta(hours=12)).isoformat(),
-                query=None,
-                max_results=5,
-            )
-        except ServiceDegradedError:
-            degraded_services.append("calendar")
-            schedule = []
-        if schedule:
-            sections.extend(["Today's schedule:"])
-            schedule_lines = []
-            for event in schedule[:5]:
-                line = f"- {event.get('start_iso')} | {event.get('title', '(untitled)')}"
-                schedule_lines.append(line)
-                sections.append(line)
-            section_map["schedule"] = "\n".join(schedule_lines)
-            sections.append("")
-
-    if email_connector is not None:
-        query = os.getenv(
-            "BENJAMIN_GMAIL_QUERY_IMPORTANT",
-            "newer_than:1d -category:social -category:promotions",
-        )
-        try:
-            messages = email_connector.search_messages(query=query, max_results=5)
-        except ServiceDegradedError:
-            degraded_services.append("gmail")
-            messages = []
-        if messages:
-            sections.extend(["Important emails:"])
-            email_lines = []
-            for msg in messages[:5]:
-                try:
-                    summary = email_connector.thread_summary(msg.get("thread_id", ""), max_messages=3)
-                except ServiceDegradedError:
-                    degraded_services.append("gmail")
-                    summary = {"snippets": []}
-                snippets = summary.get("snippets", [])
-                snippet = snippets[0] if snippets else msg.get("snippet", "")
-                line = f"- {msg.get('subject', '(no subject)')} — {snippet}"
-                email_lines.append(line)
-                sections.append(line)
-            section_map["email"] = "\n".join(email_lines)
-            sections.append("")
-
-    event_lines = [f"- {event.summary}" for event in recent_events] or ["- No recent events"]
-    preference_lines = [f"- {fact.key}: {fact.value}" for fact in preferences] or ["- No saved preferences"]
-    sections.extend(
-        [
-            "Recent episodes:",
-            *event_lines,
-            "",
-            "Top preferences:",
-            *preference_lines,
-        ]
-    )
-    section_map["recent_episodes"] = "\n".join(event_lines)
-    section_map["preferences"] = "\n".join(preference_lines)
-    if degraded_services:
-        sections.insert(0, "Email/Calendar currently degraded; showing memory-only sections")
-        sections.insert(1, "")
-    body = "\n".join(sections)
-
     summarizer = Summarizer()
-    if summarizer.enabled:
-        compressed = summarizer.compress_briefing(section_map)
-        if compressed.strip():
-            body = compressed
+    draft = load_briefing_draft(state_dir)
+    if draft is not None:
+        fresh = gather_briefing_sections(state_dir, memory, calendar_connector, None, now, summarizer=summarizer)
+        briefing, body = draft.refresh(fresh)
+    else:
+        briefing = gather_briefing_sections(state_dir, memory, calendar_connector, email_connector, now, summarizer=summarizer)
+        body = _compress_briefing(briefing, summarizer) or briefing.render()
 
     correlation_id = str(uuid4())
     effective_job_id = job_id or "daily-briefing"
     with log_context(correlation_id=correlation_id, job_id=effective_job_id):
         logger.info("job_started")
         ledger = _ledger_for_state(state_dir)
-        key = job_run_key(job_id=effective_job_id, scheduled_run_iso=scheduled_run_iso)
-        started = ledger.try_start(
-            key,
-            kind="job_run",
-            correlation_id=correlation_id,
-            meta={"job_id": effective_job_id, "scheduled_run_iso": scheduled_run_iso},
-        )
+        # Pin the run's minute so a requeued retry maps to the same ledger key.
+        run_iso = scheduled_run_iso or datetime.now(ZoneInfo("UTC")).replace(second=0, microsecond=0).isoformat()
+        key = job_run_key(job_id=effective_job_id, scheduled_run_iso=run_iso)
+        retry_kwargs = {"state_dir": state_dir, "job_id": job_id, "scheduled_run_iso": run_iso}
+        try:
+            fencing_token = _fence(state_dir, job_id)
+            started = ledger.try_start(
+                key,
+                kind="job_run",
+                correlation_id=correlation_id,
+                meta={"job_id": effective_job_id, "scheduled_run_iso": run_iso},
+                fencing_token=fencing_token,
+            )
+        except _LEASE_ERRORS as exc:
+            _requeue_after_lost_lease(state_dir, f"{effective_job_id}:retry", run_daily_briefing, retry_kwargs, exc)
+            raise
         if not started:
             memory.episodic.append(
                 kind="briefing",
@@ -208,12 +246,20 @@ def run_daily_briefing(
             logger.info("job_completed", extra={"extra_fields": {"skipped_idempotent": True}})
             return
 
-        active_router = router or build_notification_router()
+        active_router = router or build_notification_router(state_dir)
         notify_meta = {"correlation_id": correlation_id}
         if job_id:
             notify_meta["job_id"] = job_id
+        try:
+            _fence(state_dir, job_id)
+        except _LEASE_ERRORS as exc:
+            _release_run(ledger, key, correlation_id, exc)
+            _requeue_after_lost_lease(state_dir, f"{effective_job_id}:retry", run_daily_briefing, retry_kwargs, exc)
+            raise
+        sent = False
         try:
             active_router.send(title="Daily Briefing", body=body, meta=notify_meta)
+            sent = True
 
             memory.episodic.append(
                 kind="briefing",
@@ -222,17 +268,22 @@ def run_daily_briefing(
                     "job_id": job_id,
                     "correlation_id": correlation_id,
                     "items": {
-                        "recent_events": [event.summary for event in recent_events],
-                        "preferences": [f"{fact.key}:{fact.value}" for fact in preferences],
+                        "recent_events": briefing.recent_events,
+                        "preferences": [f"{key}:{value}" for key, value in briefing.preferences],
                     },
                     "calendar_included": calendar_connector is not None,
                     "gmail_included": email_connector is not None,
-                    "degraded_services": sorted(set(degraded_services)),
+                    "degraded_services": briefing.degraded_services,
+                    "late_sections": briefing.late_sections,
+                    "section_timings_ms": briefing.section_timings_ms,
+                    "prefetched_iso": draft.prepared_iso if draft is not None else None,
                 },
             )
-            ledger.mark(key, "succeeded")
-            logger.info("job_completed")
+            if draft is not None:
+                discard_briefing_draft(state_dir)
+            ledger.mark(key, "succeeded", fencing_token=fencing_token)
+            logger.info("job_completed", extra={"extra_fields": {"duration_ms": _elapsed_ms(started_at)}})
         except Exception as exc:
-            ledger.mark(key, "failed", meta_update={"error": str(exc)})
-            logger.exception("job_completed")
+            _release_run(ledger, key, correlation_id, exc, sent=sent)
+            logger.exception("job_completed", extra={"extra_fields": {"duration_ms": _elapsed_ms(started_at)}})
             raise
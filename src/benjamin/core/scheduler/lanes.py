@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+import threading
+from datetime import datetime, timezone
+
+from apscheduler.events import (
+    EVENT_JOB_ERROR,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_MAX_INSTANCES,
+    EVENT_JOB_MISSED,
+    EVENT_JOB_SUBMITTED,
+    JobEvent,
+)
+from apscheduler.executors.pool import ProcessPoolExecutor, ThreadPoolExecutor
+
+from benjamin.core.observability.latency import LatencyHistogram
+
+LANE_DEFAULT_WORKERS = {
+    "reminders": 4,
+    "briefings": 2,
+    "rules": 1,
+    "maintenance": 1,
+    "default": 4,
+}
+_LANE_PREFIXES = (
+    ("reminder:", "reminders"),
+    ("daily-briefing", "briefings"),
+    ("rules-evaluator", "rules"),
+    ("maintenance:", "maintenance"),
+)
+LANE_EVENTS = EVENT_JOB_SUBMITTED | EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES
+
+
+def lane_for_job(job_id: str) -> str:
+    for prefix, lane in _LANE_PREFIXES:
+        if job_id.startswith(prefix):
+            return lane
+    return "default"
+
+
+def lane_workers(lane: str) -> int:
+    default = LANE_DEFAULT_WORKERS.get(lane, LANE_DEFAULT_WORKERS["default"])
+    try:
+        return max(1, int(os.getenv(f"BENJAMIN_JOBS_{lane.upper()}_WORKERS", str(default))))
+    except ValueError:
+        return default
+
+
+def _maintenance_uses_processes(test_mode: bool) -> bool:
+    return not test_mode and os.getenv("BENJAMIN_JOBS_MAINTENANCE_EXECUTOR", "process").strip().casefold() == "process"
+
+
+def build_executors(test_mode: bool = False) -> dict[str, object]:
+    executors: dict[str, object] = {}
+    for lane in LANE_DEFAULT_WORKERS:
+        if lane == "maintenance" and _maintenance_uses_processes(test_mode):
+            executors[lane] = ProcessPoolExecutor(max_workers=lane_workers(lane))
+        else:
+            executors[lane] = ThreadPoolExecutor(max_workers=lane_workers(lane))
+    return executors
+
+
+class LaneMetrics:
+    """Per-lane queue depth and dispatch lag, fed by APScheduler job events."""
+
+    def __init__(self, executors: dict[str, object]) -> None:
+        self.process_lanes = {lane for lane, executor in executors.items() if isinstance(executor, ProcessPoolExecutor)}
+        self.workers = {lane: lane_workers(lane) for lane in LANE_DEFAULT_WORKERS}
+        self._lock = threading.Lock()
+        self._lanes = {lane: self._empty() for lane in LANE_DEFAULT_WORKERS}
+        self._dispatch_lag = {lane: LatencyHistogram() for lane in LANE_DEFAULT_WORKERS}
+
+    @staticmethod
+    def _empty() -> dict[str, int]:
+        return {"submitted": 0, "completed": 0, "failed": 0, "missed": 0, "skipped_max_instances": 0}
+
+    def listener(self, event: JobEvent) -> None:
+        lane = lane_for_job(event.job_id)
+        with self._lock:
+            counts = self._lanes[lane]
+            if event.code == EVENT_JOB_SUBMITTED:
+                counts["submitted"] += 1
+            elif event.code == EVENT_JOB_EXECUTED:
+                counts["completed"] += 1
+            elif event.code == EVENT_JOB_ERROR:
+                counts["failed"] += 1
+            elif event.code == EVENT_JOB_MISSED:
+                counts["missed"] += 1
+            elif event.code == EVENT_JOB_MAX_INSTANCES:
+                counts["skipped_max_instances"] += 1
+        if event.code == EVENT_JOB_SUBMITTED:
+            scheduled = getattr(event, "scheduled_run_times", None) or []
+            if scheduled:
+                lag_s = (datetime.now(timezone.utc) - scheduled[-1]).total_seconds()
+                self._dispatch_lag[lane].observe(max(0.0, lag_s) * 1000.0)
+
+    def snapshot(self) -> dict[str, dict[str, object]]:
+        with self._lock:
+            lanes = {lane: dict(counts) for lane, counts in self._lanes.items()}
+        snapshot: dict[str, dict[str, object]] = {}
+        for lane, counts in lanes.items():
+            workers = self.workers[lane]
+            # Fast jobs can report EXECUTED before SUBMITTED is dispatched, so derive in-flight from totals.
+            in_flight = max(0, counts["submitted"] - counts["completed"] - counts["failed"])
+            snapshot[lane] = {
+                "executor": "process" if lane in self.process_lanes else "thread",
+                "max_workers": workers,
+                **counts,
+                "in_flight": in_flight,
+                "queued": max(0, in_flight - workers),
+                "dispatch_lag_ms": self._dispatch_lag[lane].summary(),
+            }
+        return snapshot
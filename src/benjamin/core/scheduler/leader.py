@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+from uuid import uuid4
+
+
+logger = logging.getLogger("benjamin.scheduler.leader")
+
+_ACTIVE_LEASES: dict[str, LeaderLease] = {}
+_ACTIVE_LOCK = threading.Lock()
+
+
+class LeadershipLostError(RuntimeError):
+    def __init__(self, holder_id: str, token: int | None) -> None:
+        super().__init__(f"scheduler lease no longer held by {holder_id} (fencing token {token})")
+        self.holder_id = holder_id
+        self.token = token
+
+
+class StaleFencingTokenError(RuntimeError):
+    def __init__(self, token: int, current: int) -> None:
+        super().__init__(f"fencing token {token} is older than current token {current}")
+        self.token = token
+        self.current = current
+
+
+def leader_election_enabled() -> bool:
+    return os.getenv("BENJAMIN_SCHEDULER_LEADER_ELECTION", "on").strip().casefold() == "on"
+
+
+def lease_ttl_s() -> float:
+    try:
+        return max(0.2, float(os.getenv("BENJAMIN_SCHEDULER_LEASE_TTL_S", "15")))
+    except ValueError:
+        return 15.0
+
+
+def _default_holder_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+
+class LeaderLease:
+    """Scheduler ownership lease in SQLite; the fencing token increases on every change of holder."""
+
+    def __init__(self, state_dir: Path, holder_id: str | None = None, ttl_s: float | None = None, name: str = "scheduler") -> None:
+        self.path = Path(state_dir) / "scheduler_lease.sqlite"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.name = name
+        self.holder_id = holder_id or _default_holder_id()
+        self.ttl_s = ttl_s if ttl_s is not None else lease_ttl_s()
+        self.token: int | None = None
+        self.expires_at = 0.0
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS leases (name TEXT PRIMARY KEY, holder TEXT NOT NULL, token INTEGER NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def try_acquire(self) -> bool:
+        """Acquire or renew the lease; returns True while this holder owns it."""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT holder, token, expires_at FROM leases WHERE name = ?", (self.name,)).fetchone()
+            if row is None:
+                token = 1
+                conn.execute(
+                    "INSERT INTO leases (name, holder, token, expires_at) VALUES (?, ?, ?, ?)",
+                    (self.name, self.holder_id, token, now + self.ttl_s),
+                )
+            else:
+                holder, token, expires_at = row
+                if holder != self.holder_id and expires_at > now:
+                    conn.execute("COMMIT")
+                    self.token = None
+                    return False
+                if holder != self.holder_id or token != self.token:
+                    token += 1
+                conn.execute(
+                    "UPDATE leases SET holder = ?, token = ?, expires_at = ? WHERE name = ?",
+                    (self.holder_id, token, now + self.ttl_s, self.name),
+                )
+            conn.execute("COMMIT")
+        self.token = token
+        self.expires_at = now + self.ttl_s
+        return True
+
+    def release(self) -> None:
+        if self.token is None:
+            return
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE leases SET expires_at = 0 WHERE name = ? AND holder = ? AND token = ?",
+                (self.name, self.holder_id, self.token),
+            )
+        self.token = None
+        self.expires_at = 0.0
+
+    def is_current(self) -> bool:
+        if self.token is None:
+            return False
+        with self._connect() as conn:
+            row = conn.execute("SELECT holder, token, expires_at FROM leases WHERE name = ?", (self.name,)).fetchone()
+        return row is not None and row[0] == self.holder_id and row[1] == self.token and row[2] > time.time()
+
+    def snapshot(self) -> dict[str, object]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT holder, token, expires_at FROM leases WHERE name = ?", (self.name,)).fetchone()
+        holder, token, expires_at = row if row is not None else (None, None, 0.0)
+        return {
+            "holder_id": self.holder_id,
+            "is_leader": self.token is not None and holder == self.holder_id and expires_at > time.time(),
+            "fencing_token": self.token,
+            "lease_holder": holder,
+            "lease_token": token,
+            "lease_expires_iso": datetime.fromtimestamp(expires_at, tz=timezone.utc).isoformat() if expires_at else None,
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), timeout=max(1.0, self.ttl_s), isolation_level=None)
+        return _closing(conn)
+
+
+class _closing:
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
+        if exc_type is not None and self.conn.in_transaction:
+            self.conn.execute("ROLLBACK")
+        self.conn.close()
+
+
+class LeaderElector:
+    """Heartbeats a lease and flips between leader and follower callbacks."""
+
+    def __init__(
+        self,
+        lease: LeaderLease,
+        on_elected: Callable[[int], None],
+        on_demoted: Callable[[], None],
+        on_heartbeat: Callable[[], None] | None = None,
+        heartbeat_s: float | None = None,
+    ) -> None:
+        self.lease = lease
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.on_heartbeat = on_heartbeat
+        self.heartbeat_s = heartbeat_s if heartbeat_s is not None else lease.ttl_s / 3
+        self.is_leader = False
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self.beat()
+        self._thread = threading.Thread(target=self._run, name="scheduler-leader", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.heartbeat_s + 1.0)
+        if self.is_leader:
+            self._demote()
+        try:
+            self.lease.release()
+        except sqlite3.Error as exc:
+            logger.warning("scheduler_lease_release_failed", extra={"extra_fields": {"error": str(exc)}})
+
+    def beat(self) -> None:
+        try:
+            held = self.lease.try_acquire()
+        except sqlite3.Error as exc:
+            logger.warning("scheduler_lease_heartbeat_failed", extra={"extra_fields": {"error": str(exc)}})
+            held = self.is_leader and time.time() < self.lease.expires_at
+        if held and not self.is_leader:
+            self.is_leader = True
+            logger.info("scheduler_leader_elected", extra={"extra_fields": {"holder_id": self.lease.holder_id, "fencing_token": self.lease.token}})
+            self.on_elected(self.lease.token or 0)
+        elif not held and self.is_leader:
+            self._demote()
+        if self.is_leader and self.on_heartbeat is not None:
+            self.on_heartbeat()
+
+    def _demote(self) -> None:
+        self.is_leader = False
+        logger.warning("scheduler_leader_demoted", extra={"extra_fields": {"holder_id": self.lease.holder_id}})
+        self.on_demoted()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.heartbeat_s):
+            self.beat()
+
+
+def register_lease(state_dir: Path | str, lease: LeaderLease | None) -> None:
+    key = str(Path(state_dir).expanduser().resolve())
+    with _ACTIVE_LOCK:
+        if lease is None:
+            _ACTIVE_LEASES.pop(key, None)
+        else:
+            _ACTIVE_LEASES[key] = lease
+
+
+def check_fencing(state_dir: Path | str) -> int | None:
+    """Return this process's fencing token for state_dir, raising if its lease was lost.
+
+    Processes without an elected scheduler (test mode, election disabled, one-off callers) get None.
+    """
+    with _ACTIVE_LOCK:
+        lease = _ACTIVE_LEASES.get(str(Path(state_dir).expanduser().resolve()))
+    if lease is None:
+        return None
+    if not lease.is_current():
+        raise LeadershipLostError(lease.holder_id, lease.token)
+    return lease.token
+
+
+def highest_fencing_token(state_dir: Path | str) -> int | None:
+    path = Path(state_dir) / "scheduler_lease.sqlite"
+    if not path.exists():
+        return None
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, timeout=5.0)
+    try:
+        row = conn.execute("SELECT MAX(token) FROM leases").fetchone()
+    except sqlite3.OperationalError:
+        return None
+    finally:
+        conn.close()
+    return row[0] if row is not None else None
+
+
+def ensure_fresh_token(state_dir: Path | str, token: int | None) -> None:
+    """Reject writes stamped with a token older than the newest one the lease table has issued."""
+    if token is None:
+        return
+    current = highest_fencing_token(state_dir)
+    if current is not None and token < current:
+        raise StaleFencingTokenError(token, current)
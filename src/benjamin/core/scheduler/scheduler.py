@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import math
 import os
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Callable
 from zoneinfo import ZoneInfo
@@ -10,7 +12,27 @@ from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.background import BackgroundScheduler
 
+from .lanes import LANE_EVENTS, LaneMetrics, build_executors, lane_for_job
+from .leader import LeaderElector, LeaderLease, leader_election_enabled, lease_ttl_s, register_lease
 from .schemas import JobInfo
+from .telemetry import TELEMETRY_EVENTS, JobTelemetry
+
+_ACTIVE_SERVICES: dict[str, SchedulerService] = {}
+_ACTIVE_LOCK = threading.Lock()
+
+
+def _service_key(state_dir: Path | str) -> str:
+    return str(Path(state_dir).expanduser().resolve())
+
+
+def requeue_job(state_dir: Path | str, job_id: str, func: Callable[..., Any], kwargs: dict[str, Any], delay_s: float) -> bool:
+    """Put a run back into the shared job store so whichever instance leads next fires it."""
+    with _ACTIVE_LOCK:
+        service = _ACTIVE_SERVICES.get(_service_key(state_dir))
+    if service is None:
+        return False
+    service.add_one_off(job_id, datetime.now(service.timezone) + timedelta(seconds=max(0.0, delay_s)), func, kwargs)
+    return True
 
 
 class SchedulerService:
@@ -19,10 +41,22 @@ class SchedulerService:
         self.state_dir.mkdir(parents=True, exist_ok=True)
         self.test_mode = os.getenv("BENJAMIN_TEST_MODE", "").casefold() in {"1", "true", "yes", "on"}
         self.timezone = ZoneInfo(os.getenv("BENJAMIN_TIMEZONE", "America/New_York"))
+        executors = build_executors(test_mode=self.test_mode)
+        job_defaults: dict[str, object] = {}
+        if leader_election_enabled():
+            # Runs that come due during a leader handover are still fired by the new leader.
+            job_defaults["misfire_grace_time"] = max(1, math.ceil(2 * lease_ttl_s()))
         self.scheduler = BackgroundScheduler(
             jobstores={"default": self._build_job_store()},
+            executors=executors,
+            job_defaults=job_defaults,
             timezone=self.timezone,
         )
+        self.lane_metrics = LaneMetrics(executors)
+        self.scheduler.add_listener(self.lane_metrics.listener, LANE_EVENTS)
+        self.job_telemetry = JobTelemetry(self.state_dir)
+        self.scheduler.add_listener(self.job_telemetry.listener, TELEMETRY_EVENTS)
+        self.elector: LeaderElector | None = None
         self._started = False
 
     def _default_state_dir(self) -> Path:
@@ -40,14 +74,50 @@ class SchedulerService:
     def start(self) -> None:
         if self.test_mode or self._started:
             return
-        self.scheduler.start()
+        with _ACTIVE_LOCK:
+            _ACTIVE_SERVICES[_service_key(self.state_dir)] = self
+        # Start paused so persisted jobs are on their lanes before anything fires.
+        self.scheduler.start(paused=True)
         self._started = True
+        self._assign_lanes()
+        if not leader_election_enabled():
+            self.scheduler.resume()
+            return
+        # Every instance keeps a paused scheduler; only the lease holder resumes it and runs jobs.
+        lease = LeaderLease(self.state_dir)
+        register_lease(self.state_dir, lease)
+        self.elector = LeaderElector(
+            lease,
+            on_elected=lambda token: self.scheduler.resume(),
+            on_demoted=self.scheduler.pause,
+            on_heartbeat=self.scheduler.wakeup,
+        )
+        self.elector.start()
+
+    def _assign_lanes(self) -> None:
+        """Move jobs persisted before lanes existed (or under another mapping) onto their lane's executor."""
+        for job in self.scheduler.get_jobs():
+            lane = lane_for_job(job.id)
+            if job.executor != lane:
+                self.scheduler.modify_job(job.id, executor=lane)
 
     def shutdown(self) -> None:
+        with _ACTIVE_LOCK:
+            if _ACTIVE_SERVICES.get(_service_key(self.state_dir)) is self:
+                del _ACTIVE_SERVICES[_service_key(self.state_dir)]
         if self._started:
+            if self.elector is not None:
+                self.elector.stop()
+                register_lease(self.state_dir, None)
+                self.elector = None
             self.scheduler.shutdown(wait=False)
             self._started = False
 
+    def leader_status(self) -> dict[str, object]:
+        if self.elector is None:
+            return {"enabled": leader_election_enabled() and not self.test_mode, "is_leader": self._started}
+        return {"enabled": True, **self.elector.lease.snapshot()}
+
     def list_jobs(self) -> list[JobInfo]:
         jobs: list[JobInfo] = []
         for job in self.scheduler.get_jobs():
@@ -71,6 +141,7 @@ class SchedulerService:
             trigger="date",
             id=job_id,
             run_date=run_at_dt,
+            executor=lane_for_job(job_id),
             kwargs=kwargs,
             replace_existing=True,
         )
@@ -91,9 +162,16 @@ class SchedulerService:
             hour=hour,
             minute=minute,
             timezone=timezone,
+            executor=lane_for_job(job_id),
             kwargs=kwargs,
             replace_existing=True,
         )
 
+    def lane_stats(self) -> dict[str, dict[str, object]]:
+        return self.lane_metrics.snapshot()
+
+    def job_stats(self, recent: int = 20) -> dict[str, object]:
+        return self.job_telemetry.stats(recent=recent)
+
     def remove_job(self, job_id: str) -> None:
         self.scheduler.remove_job(job_id)
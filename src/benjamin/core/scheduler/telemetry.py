@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from apscheduler.events import (
+    EVENT_JOB_ERROR,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_MAX_INSTANCES,
+    EVENT_JOB_MISSED,
+    EVENT_JOB_SUBMITTED,
+    JobEvent,
+)
+
+from benjamin.core.observability.latency import LatencyHistogram
+
+TELEMETRY_EVENTS = EVENT_JOB_SUBMITTED | EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES
+RECORD_FIELDS = ("job_id", "scheduled_ts", "submitted_ts", "finished_ts", "outcome")
+# Completions whose SUBMITTED event never arrives are recorded without a dispatch time after this long.
+_EARLY_FINISH_TTL_S = 60.0
+
+
+def job_type(job_id: str) -> str:
+    """Group per-instance ids (reminder:<uuid>) under one job type."""
+    return "reminder" if job_id.startswith("reminder:") else job_id
+
+
+def _telemetry_capacity() -> int:
+    try:
+        return max(10, int(os.getenv("BENJAMIN_JOB_TELEMETRY_MAX", "1000")))
+    except ValueError:
+        return 1000
+
+
+def _iso(ts: float | None) -> str | None:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat() if ts else None
+
+
+class JobTelemetry:
+    """Per-run job timings from APScheduler events, kept as a capped SQLite table shared by all processes."""
+
+    def __init__(self, state_dir: Path, capacity: int | None = None) -> None:
+        self.path = Path(state_dir) / "job_telemetry.sqlite"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.capacity = capacity if capacity is not None else _telemetry_capacity()
+        self._lock = threading.Lock()
+        self._submitted: dict[tuple[str, float], float] = {}
+        self._finished_early: dict[tuple[str, float], tuple[float, str]] = {}
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS runs (seq INTEGER PRIMARY KEY AUTOINCREMENT, job_id TEXT NOT NULL, "
+                "scheduled_ts REAL NOT NULL, submitted_ts REAL, finished_ts REAL, outcome TEXT NOT NULL)"
+            )
+
+    def listener(self, event: JobEvent) -> None:
+        now = time.time()
+        if event.code == EVENT_JOB_SUBMITTED:
+            for run_time in getattr(event, "scheduled_run_times", None) or []:
+                key = (event.job_id, run_time.timestamp())
+                with self._lock:
+                    early = self._finished_early.pop(key, None)
+                    if early is None:
+                        self._submitted[key] = now
+                        continue
+                # Fast jobs can report completion before SUBMITTED is dispatched.
+                self.record(event.job_id, key[1], now, max(now, early[0]), early[1])
+            return
+
+        scheduled = getattr(event, "scheduled_run_time", None)
+        scheduled_ts = scheduled.timestamp() if scheduled is not None else now
+        if event.code in (EVENT_JOB_EXECUTED, EVENT_JOB_ERROR):
+            outcome = "succeeded" if event.code == EVENT_JOB_EXECUTED else "failed"
+            key = (event.job_id, scheduled_ts)
+            with self._lock:
+                submitted_ts = self._submitted.pop(key, None)
+                if submitted_ts is None:
+                    self._finished_early[key] = (now, outcome)
+                    expired = self._expire_finished_early(now)
+                else:
+                    expired = []
+            for (job_id, expired_scheduled_ts), (finished_ts, expired_outcome) in expired:
+                self.record(job_id, expired_scheduled_ts, None, finished_ts, expired_outcome)
+            if submitted_ts is not None:
+                self.record(event.job_id, scheduled_ts, submitted_ts, now, outcome)
+        elif event.code == EVENT_JOB_MISSED:
+            self.record(event.job_id, scheduled_ts, None, None, "missed")
+        elif event.code == EVENT_JOB_MAX_INSTANCES:
+            self.record(event.job_id, scheduled_ts, None, None, "skipped_max_instances")
+
+    def record(self, job_id: str, scheduled_ts: float, submitted_ts: float | None, finished_ts: float | None, outcome: str) -> None:
+        row = (
+            job_id,
+            round(scheduled_ts, 3),
+            round(submitted_ts, 3) if submitted_ts is not None else None,
+            round(finished_ts, 3) if finished_ts is not None else None,
+            outcome,
+        )
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            seq = conn.execute(
+                "INSERT INTO runs (job_id, scheduled_ts, submitted_ts, finished_ts, outcome) VALUES (?, ?, ?, ?, ?)", row
+            ).lastrowid
+            conn.execute("DELETE FROM runs WHERE seq <= ?", (seq - self.capacity,))
+            conn.execute("COMMIT")
+
+    def records(self) -> list[dict[str, Any]]:
+        """Stored runs, oldest first."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT job_id, scheduled_ts, submitted_ts, finished_ts, outcome FROM runs ORDER BY seq DESC LIMIT ?",
+                (self.capacity,),
+            ).fetchall()
+        return [dict(zip(RECORD_FIELDS, row)) for row in reversed(rows)]
+
+    def stats(self, recent: int = 20) -> dict[str, object]:
+        records = self.records()
+        jobs: dict[str, dict[str, Any]] = {}
+        durations: dict[str, LatencyHistogram] = {}
+        lateness: dict[str, LatencyHistogram] = {}
+        for record in records:
+            kind = job_type(record["job_id"])
+            entry = jobs.setdefault(kind, {"runs": 0, "succeeded": 0, "failed": 0, "missed": 0, "skipped_max_instances": 0})
+            entry["runs"] += 1
+            entry[record["outcome"]] = entry.get(record["outcome"], 0) + 1
+            entry["last_outcome"] = record["outcome"]
+            entry["last_scheduled_iso"] = _iso(record["scheduled_ts"])
+            if record["submitted_ts"] is not None:
+                lateness.setdefault(kind, LatencyHistogram()).observe((record["submitted_ts"] - record["scheduled_ts"]) * 1000.0)
+                if record["finished_ts"] is not None:
+                    durations.setdefault(kind, LatencyHistogram()).observe((record["finished_ts"] - record["submitted_ts"]) * 1000.0)
+        empty = LatencyHistogram().summary()
+        for kind, entry in jobs.items():
+            entry["duration_ms"] = durations[kind].summary() if kind in durations else empty
+            entry["lateness_ms"] = lateness[kind].summary() if kind in lateness else empty
+        return {
+            "capacity": self.capacity,
+            "stored": len(records),
+            "jobs": dict(sorted(jobs.items())),
+            "recent": [
+                {
+                    "job_id": record["job_id"],
+                    "job_type": job_type(record["job_id"]),
+                    "outcome": record["outcome"],
+                    "scheduled_iso": _iso(record["scheduled_ts"]),
+                    "lateness_ms": round((record["submitted_ts"] - record["scheduled_ts"]) * 1000.0, 3) if record["submitted_ts"] is not None else None,
+                    "duration_ms": (
+                        round((record["finished_ts"] - record["submitted_ts"]) * 1000.0, 3)
+                        if record["submitted_ts"] is not None and record["finished_ts"] is not None
+                        else None
+                    ),
+                }
+                for record in reversed(records[-recent:] if recent > 0 else [])
+            ],
+        }
+
+    def _expire_finished_early(self, now: float) -> list[tuple[tuple[str, float], tuple[float, str]]]:
+        expired = [(key, value) for key, value in self._finished_early.items() if now - value[0] > _EARLY_FINISH_TTL_S]
+        for key, _ in expired:
+            del self._finished_early[key]
+        return expired
+
+    def _connect(self) -> _closing:
+        return _closing(sqlite3.connect(str(self.path), timeout=5.0, isolation_level=None))
+
+
+class _closing:
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
+        if exc_type is not None and self.conn.in_transaction:
+            self.conn.execute("ROLLBACK")
+        self.conn.close()
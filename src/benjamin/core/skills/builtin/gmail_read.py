@@ -22,7 +22,8 @@ class GmailReadMessageInput(BaseModel):
 
 
 class GmailThreadSummaryInput(BaseModel):
-    thread_id: str
+    thread_id: str = ""
+    thread_ids: list[str] = []
     max_messages: int = 10
 
 
@@ -99,33 +100,38 @@ class GmailThreadSummarySkill:
 
     def run(self, query: str) -> SkillResult:
         payload = GmailThreadSummaryInput.model_validate_json(query)
+        thread_ids = payload.thread_ids or [payload.thread_id]
         if self.connector is None:
-            return SkillResult(
-                content=json.dumps(
-                    {
-                        "thread_id": payload.thread_id,
-                        "subject": "",
-                        "participants": [],
-                        "snippets": [],
-                        "reason": "gmail_integration_unavailable",
-                    }
-                )
-            )
+            return self._unavailable(payload, thread_ids, "gmail_integration_unavailable")
 
         try:
-            summary = self.connector.thread_summary(payload.thread_id, max_messages=payload.max_messages)
+            thread_summaries = getattr(self.connector, "thread_summaries", None)
+            if thread_summaries is not None:
+                summaries = thread_summaries(thread_ids, max_messages=payload.max_messages)
+            else:
+                summaries = [self.connector.thread_summary(thread_id, max_messages=payload.max_messages) for thread_id in thread_ids]
         except ServiceDegradedError:
-            return SkillResult(content=json.dumps({"thread_id": payload.thread_id, "subject": "", "participants": [], "snippets": [], "reason": "service_degraded:gmail"}))
-        snippets = summary.get("snippets", [])
-        bullets = self.summarizer.summarize_bullets("\n".join(snippets), max_bullets=6) if snippets else snippets
-        return SkillResult(
-            content=json.dumps(
-                {
-                    "thread_id": summary.get("thread_id", payload.thread_id),
-                    "subject": summary.get("subject", ""),
-                    "participants": summary.get("participants", []),
-                    "snippets": snippets,
-                    "bullets": bullets,
-                }
-            )
-        )
+            return self._unavailable(payload, thread_ids, "service_degraded:gmail")
+        snippets = [summary.get("snippets", []) for summary in summaries]
+        # One batched LLM round-trip for every requested thread.
+        bullets = self.summarizer.summarize_bullets_batch(["\n".join(items) for items in snippets], max_bullets=6)
+        threads = [
+            {
+                "thread_id": summary.get("thread_id", thread_id),
+                "subject": summary.get("subject", ""),
+                "participants": summary.get("participants", []),
+                "snippets": items,
+                "bullets": thread_bullets,
+            }
+            for thread_id, summary, items, thread_bullets in zip(thread_ids, summaries, snippets, bullets)
+        ]
+        if not payload.thread_ids:
+            return SkillResult(content=json.dumps(threads[0]))
+        return SkillResult(content=json.dumps({"threads": threads}))
+
+    @staticmethod
+    def _unavailable(payload: GmailThreadSummaryInput, thread_ids: list[str], reason: str) -> SkillResult:
+        threads = [{"thread_id": thread_id, "subject": "", "participants": [], "snippets": [], "reason": reason} for thread_id in thread_ids]
+        if not payload.thread_ids:
+            return SkillResult(content=json.dumps(threads[0]))
+        return SkillResult(content=json.dumps({"threads": threads, "reason": reason}))
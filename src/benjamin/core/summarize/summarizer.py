@@ -2,29 +2,38 @@ from __future__ import annotations
 
 import re
 
+from benjamin.core.infra.services import get_services
 from benjamin.core.models.llm_provider import BenjaminLLM, LLMUnavailable
 
 
 class Summarizer:
     def __init__(self, llm: BenjaminLLM | None = None) -> None:
-        self.llm = llm or BenjaminLLM()
+        self.llm = llm or get_services().llm()
         self.enabled = BenjaminLLM.feature_enabled("BENJAMIN_LLM_SUMMARIZER")
 
     def summarize_bullets(self, text: str, max_bullets: int = 6) -> list[str]:
-        if not text.strip():
-            return []
-        if self.enabled:
-            try:
-                response = self.llm.complete_text(
-                    system="Summarize email threads into concise bullet points.",
-                    user=f"Return up to {max_bullets} bullet points for:\n{text}",
-                )
-                bullets = [line.strip("-• \t") for line in response.splitlines() if line.strip()]
-                if bullets:
-                    return bullets[:max_bullets]
-            except LLMUnavailable:
-                pass
-        return self._fallback_bullets(text, max_bullets=max_bullets)
+        return self.summarize_bullets_batch([text], max_bullets=max_bullets)[0]
+
+    def summarize_bullets_batch(self, texts: list[str], max_bullets: int = 6) -> list[list[str]]:
+        results: list[list[str]] = [[] for _ in texts]
+        pending = [idx for idx, text in enumerate(texts) if text.strip()]
+        if self.enabled and pending:
+            responses = self.llm.complete_text_batch(
+                [
+                    (
+                        "Summarize email threads into concise bullet points.",
+                        f"Return up to {max_bullets} bullet points for:\n{texts[idx]}",
+                    )
+                    for idx in pending
+                ]
+            )
+            for idx, response in zip(pending, responses):
+                bullets = [line.strip("-• \t") for line in (response or "").splitlines() if line.strip()]
+                results[idx] = bullets[:max_bullets]
+        for idx in pending:
+            if not results[idx]:
+                results[idx] = self._fallback_bullets(texts[idx], max_bullets=max_bullets)
+        return results
 
     def compress_briefing(self, sections: dict[str, str]) -> str:
         non_empty = {k: v for k, v in sections.items() if v.strip()}
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+import time
+
+from benjamin.core.infra.breaker_manager import BreakerManager
+from benjamin.core.infra.services import get_services, reset_services
+
+
+def _fail() -> None:
+    raise RuntimeError("boom")
+
+
+def test_breaker_persistence_is_debounced_and_flushed(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("BENJAMIN_BREAKER_FAILURE_THRESHOLD", "10")
+    monkeypatch.setenv("BENJAMIN_BREAKER_PERSIST_INTERVAL_S", "60")
+    manager = BreakerManager(state_dir=tmp_path)
+    path = tmp_path / "breakers.json"
+
+    for _ in range(3):
+        assert manager.wrap("gmail", lambda: "ok") == "ok"
+    assert not path.exists()
+
+    for _ in range(3):
+        try:
+            manager.wrap("gmail", _fail)
+        except RuntimeError:
+            pass
+
+    assert json.loads(path.read_text(encoding="utf-8"))["gmail"]["failure_count"] == 1
+    assert manager.snapshot()["gmail"]["failure_count"] == 3
+
+    manager.flush()
+    assert json.loads(path.read_text(encoding="utf-8"))["gmail"]["failure_count"] == 3
+
+
+def test_transitions_persist_immediately_and_increment_episodes_are_aggregated(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("BENJAMIN_BREAKER_FAILURE_THRESHOLD", "4")
+    monkeypatch.setenv("BENJAMIN_BREAKER_PERSIST_INTERVAL_S", "60")
+    manager = BreakerManager(state_dir=tmp_path)
+
+    for _ in range(4):
+        try:
+            manager.wrap("calendar", _fail)
+        except RuntimeError:
+            pass
+
+    persisted = json.loads((tmp_path / "breakers.json").read_text(encoding="utf-8"))
+    assert persisted["calendar"]["state"] == "open"
+
+    summaries = [episode.summary for episode in manager.memory_manager.episodic.list_recent(limit=20)]
+    assert summaries.count("Breaker failure recorded for calendar") == 1
+    assert "Circuit breaker calendar transitioned closed->open" in summaries
+
+
+def test_deferred_breaker_state_is_flushed_when_idle(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("BENJAMIN_BREAKER_FAILURE_THRESHOLD", "10")
+    monkeypatch.setenv("BENJAMIN_BREAKER_PERSIST_INTERVAL_S", "0.3")
+    manager = BreakerManager(state_dir=tmp_path)
+    path = tmp_path / "breakers.json"
+
+    for _ in range(3):
+        try:
+            manager.wrap("gmail", _fail)
+        except RuntimeError:
+            pass
+    assert json.loads(path.read_text(encoding="utf-8"))["gmail"]["failure_count"] == 1
+
+    deadline = time.monotonic() + 3.0
+    while time.monotonic() < deadline and json.loads(path.read_text(encoding="utf-8"))["gmail"]["failure_count"] != 3:
+        time.sleep(0.05)
+    assert json.loads(path.read_text(encoding="utf-8"))["gmail"]["failure_count"] == 3
+
+
+def test_reset_services_flushes_deferred_breaker_state(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("BENJAMIN_BREAKER_FAILURE_THRESHOLD", "10")
+    monkeypatch.setenv("BENJAMIN_BREAKER_PERSIST_INTERVAL_S", "60")
+    manager = get_services(tmp_path).breaker_manager()
+    for _ in range(2):
+        try:
+            manager.wrap("calendar", _fail)
+        except RuntimeError:
+            pass
+
+    reset_services()
+
+    assert json.loads((tmp_path / "breakers.json").read_text(encoding="utf-8"))["calendar"]["failure_count"] == 2
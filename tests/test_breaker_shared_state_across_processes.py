@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from benjamin.core.infra.breaker_manager import BreakerManager, ServiceDegradedError
+from benjamin.core.infra.breaker_shm import shared_state_supported
+
+pytestmark = pytest.mark.skipif(not shared_state_supported(), reason="shared breaker state requires fcntl")
+
+
+def test_trip_in_other_process_is_visible_without_reload(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("BENJAMIN_BREAKER_FAILURE_THRESHOLD", "2")
+    monkeypatch.setenv("BENJAMIN_BREAKER_PERSIST_INTERVAL_S", "60")
+    api_manager = BreakerManager(state_dir=tmp_path)
+    assert api_manager.snapshot()["gmail"]["state"] == "closed"
+
+    script = textwrap.dedent(
+        f"""
+        from pathlib import Path
+        from benjamin.core.infra.breaker_manager import BreakerManager
+
+        manager = BreakerManager(state_dir=Path({str(tmp_path)!r}))
+        for _ in range(2):
+            try:
+                manager.wrap("gmail", lambda: (_ for _ in ()).throw(RuntimeError("backend down")))
+            except RuntimeError:
+                pass
+        """
+    )
+    env = dict(os.environ, BENJAMIN_STATE_DIR=str(tmp_path))
+    subprocess.run([sys.executable, "-c", script], check=True, env=env, timeout=30)
+
+    calls: list[int] = []
+    with pytest.raises(ServiceDegradedError):
+        api_manager.wrap("gmail", lambda: calls.append(1))
+    assert calls == []
+    assert api_manager.snapshot()["gmail"]["state"] == "open"
+    assert api_manager.snapshot()["gmail"]["last_error"] == "backend down"
+
+
+def test_success_in_one_manager_resets_counts_seen_by_another(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("BENJAMIN_BREAKER_FAILURE_THRESHOLD", "3")
+    first = BreakerManager(state_dir=tmp_path)
+    second = BreakerManager(state_dir=tmp_path)
+
+    for manager in (first, second):
+        try:
+            manager.wrap("calendar", lambda: (_ for _ in ()).throw(RuntimeError("flaky")))
+        except RuntimeError:
+            pass
+    assert first.snapshot()["calendar"]["failure_count"] == 2
+
+    second.wrap("calendar", lambda: "ok")
+    assert first.snapshot()["calendar"]["failure_count"] == 0
+
+
+def test_nested_lock_keeps_cross_process_lock_until_outermost_exit(tmp_path) -> None:
+    import fcntl
+
+    from benjamin.core.infra.breaker_shm import open_shared_table
+
+    table = open_shared_table(tmp_path)
+    other_fd = os.open(table.path, os.O_RDWR)
+    try:
+        with table.locked():
+            with table.locked():
+                pass
+            with pytest.raises(BlockingIOError):
+                fcntl.flock(other_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        fcntl.flock(other_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        fcntl.flock(other_fd, fcntl.LOCK_UN)
+    finally:
+        os.close(other_fd)
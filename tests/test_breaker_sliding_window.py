@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from benjamin.core.infra.breaker import CircuitBreaker
+from benjamin.core.infra.breaker_manager import BreakerManager
+
+
+def _window_breaker() -> CircuitBreaker:
+    return CircuitBreaker(
+        service="gmail",
+        open_seconds=10,
+        mode="window",
+        window_s=60,
+        min_calls=10,
+        failure_rate_threshold=0.5,
+        slow_call_ms=2000,
+        slow_call_rate_threshold=0.3,
+        max_open_seconds=40,
+    )
+
+
+def test_window_breaker_trips_on_slow_call_rate_and_backs_off_exponentially() -> None:
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    breaker = _window_breaker()
+
+    for index in range(9):
+        slow = index % 3 == 0
+        assert breaker.record_success(now=now + timedelta(seconds=index), duration_ms=20000 if slow else 50) is None
+    assert breaker.state == "closed"
+    assert breaker.record_success(now=now + timedelta(seconds=9), duration_ms=20000) == ("closed", "open")
+    assert breaker.window_stats(now=now + timedelta(seconds=9))["slow_call_rate"] == 0.4
+
+    assert breaker.allow_request(now=now + timedelta(seconds=20)) is True
+    assert breaker.record_failure("still slow", now=now + timedelta(seconds=20), duration_ms=20000) == ("half_open", "open")
+    assert breaker.open_interval_s() == 20
+    assert breaker.allow_request(now=now + timedelta(seconds=35)) is False
+    assert breaker.allow_request(now=now + timedelta(seconds=41)) is True
+    assert breaker.record_failure("down", now=now + timedelta(seconds=41)) == ("half_open", "open")
+    assert breaker.open_interval_s() == 40
+
+    assert breaker.allow_request(now=now + timedelta(seconds=82)) is True
+    assert breaker.record_success(now=now + timedelta(seconds=82), duration_ms=30) == ("half_open", "closed")
+    assert breaker.open_interval_s() == 10
+
+
+def test_window_breaker_ignores_old_failures_and_single_success_does_not_reset() -> None:
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    breaker = _window_breaker()
+
+    for index in range(8):
+        breaker.record_failure("old", now=now + timedelta(seconds=index))
+    for index in range(10):
+        breaker.record_success(now=now + timedelta(seconds=120 + index), duration_ms=10)
+    assert breaker.state == "closed"
+
+    for index in range(12):
+        breaker.record_failure("boom", now=now + timedelta(seconds=131 + index))
+        if index % 6 == 0:
+            breaker.record_success(now=now + timedelta(seconds=131 + index), duration_ms=10)
+            assert breaker.failure_count == 0
+    assert breaker.state == "open"
+
+
+def test_manager_snapshot_reports_window_stats(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("BENJAMIN_BREAKER_MODE_GMAIL", "window")
+    monkeypatch.setenv("BENJAMIN_BREAKER_MIN_CALLS", "4")
+    manager = BreakerManager(state_dir=tmp_path)
+
+    manager.wrap("gmail", lambda: "ok")
+    try:
+        manager.wrap("gmail", lambda: (_ for _ in ()).throw(RuntimeError("boom")))
+    except RuntimeError:
+        pass
+
+    snapshot = manager.snapshot()
+    assert snapshot["gmail"]["mode"] == "window"
+    assert snapshot["gmail"]["window"]["calls"] == 2
+    assert snapshot["gmail"]["window"]["failures"] == 1
+    assert "window" not in snapshot["llm"]
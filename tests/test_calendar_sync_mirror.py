@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from benjamin.core.integrations import google_calendar
+from benjamin.core.integrations.google_calendar import GoogleCalendarConnector
+from benjamin.core.notifications.notifier import NotificationRouter
+from benjamin.core.rules.evaluator import run_rules_evaluation
+from benjamin.core.rules.schemas import Rule, RuleActionNotify, RuleCondition, RuleTrigger
+from benjamin.core.rules.store import RuleStore
+from benjamin.core.scheduler.jobs import run_daily_briefing
+
+
+class GoneError(Exception):
+    class resp:
+        status = 410
+
+
+class FakeRequest:
+    def __init__(self, payload: dict | None, error: Exception | None = None) -> None:
+        self.payload = payload
+        self.error = error
+
+    def execute(self) -> dict:
+        if self.error is not None:
+            raise self.error
+        return self.payload or {}
+
+
+class FakeCalendarService:
+    def __init__(self) -> None:
+        self.items: dict[str, dict] = {}
+        self.changes: list[dict] = []
+        self.version = 0
+        self.calls: list[dict] = []
+        self.expire_next = False
+
+    def put(self, event_id: str, summary: str, hours_from_now: float, status: str = "confirmed") -> None:
+        start = datetime.now(timezone.utc) + timedelta(hours=hours_from_now)
+        item = {
+            "id": event_id,
+            "status": status,
+            "summary": summary,
+            "start": {"dateTime": start.isoformat()},
+            "end": {"dateTime": (start + timedelta(minutes=30)).isoformat()},
+        }
+        self.items[event_id] = item
+        self.version += 1
+        self.changes.append({"version": self.version, "item": item})
+
+    def events(self) -> "FakeCalendarService":
+        return self
+
+    def list(self, **params) -> FakeRequest:
+        self.calls.append(params)
+        token = params.get("syncToken")
+        if token is None:
+            items = [item for item in self.items.values() if item["status"] != "cancelled"]
+            return FakeRequest({"items": items, "nextSyncToken": str(self.version)})
+        if self.expire_next:
+            self.expire_next = False
+            return FakeRequest(None, GoneError("sync token expired"))
+        items = [change["item"] for change in self.changes if change["version"] > int(token)]
+        return FakeRequest({"items": items, "nextSyncToken": str(self.version)})
+
+
+class RecorderNotifier:
+    def __init__(self) -> None:
+        self.messages: list[dict] = []
+
+    def send(self, title: str, body: str, meta: dict | None = None) -> None:
+        self.messages.append({"title": title, "body": body, "meta": meta or {}})
+
+
+def _connector(monkeypatch, service: FakeCalendarService) -> GoogleCalendarConnector:
+    monkeypatch.setattr(google_calendar, "build_google_service", lambda *args: service)
+    return GoogleCalendarConnector(token_path="unused")
+
+
+def test_rules_read_calendar_from_mirror_with_incremental_sync(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_CALENDAR_SYNC", "on")
+    service = FakeCalendarService()
+    service.put("e1", "Design review", 2)
+    service.put("e2", "Dentist", 3)
+    connector = _connector(monkeypatch, service)
+    RuleStore(tmp_path).upsert(
+        Rule(
+            name="reviews",
+            trigger=RuleTrigger(type="calendar", query="review", hours_ahead=24, max_results=5),
+            condition=RuleCondition(contains="review"),
+            actions=[RuleActionNotify(type="notify", title="Reviews", body_template="{{count}}")],
+        )
+    )
+    router = NotificationRouter(channels=[RecorderNotifier()])
+
+    def tick() -> int:
+        results = run_rules_evaluation(state_dir=str(tmp_path), router=router, calendar_connector=connector)
+        return results[0].match_count
+
+    assert tick() == 1
+    service.put("e3", "Code review", 4)
+    service.put("e1", "Design review", 2, status="cancelled")
+    assert tick() == 1
+    service.expire_next = True
+    assert tick() == 0
+
+    full_lists = [call for call in service.calls if "syncToken" not in call]
+    assert len(full_lists) == 2
+    assert all("q" not in call for call in service.calls)
+    assert all("timeMin" not in call for call in service.calls if "syncToken" in call)
+
+
+def test_briefing_schedule_comes_from_mirror(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_CALENDAR_SYNC", "on")
+    service = FakeCalendarService()
+    service.put("e1", "Standup", 1)
+    service.put("e2", "Offsite", 72)
+    connector = _connector(monkeypatch, service)
+    recorder = RecorderNotifier()
+
+    for _ in range(2):
+        run_daily_briefing(state_dir=str(tmp_path), router=NotificationRouter(channels=[recorder]), calendar_connector=connector)
+
+    body = recorder.messages[-1]["body"]
+    assert "Standup" in body and "Offsite" not in body
+    assert [("syncToken" in call) for call in service.calls] == [False, True]
+    assert (tmp_path / "calendar_mirror.json").exists()
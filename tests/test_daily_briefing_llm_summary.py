@@ -43,3 +43,45 @@ def test_daily_briefing_uses_summarizer(monkeypatch, tmp_path) -> None:
 
     assert channel.messages
     assert "Prioritized briefing output" in channel.messages[0][1]
+
+
+def _run_counting_batches(monkeypatch, tmp_path) -> tuple[CaptureChannel, list[int]]:
+    monkeypatch.setenv("BENJAMIN_LLM_PROVIDER", "vllm")
+    monkeypatch.setenv("BENJAMIN_LLM_SUMMARIZER", "on")
+    batches: list[int] = []
+
+    def fake_batch(self, prompts, max_tokens=None, temperature=None):
+        batches.append(len(prompts))
+        return ["- Condensed thread"] * len(prompts)
+
+    def fake_complete_text(self, system: str, user: str, max_tokens=None, temperature=None) -> str:
+        return ""
+
+    monkeypatch.setattr("benjamin.core.models.llm_provider.BenjaminLLM.complete_text_batch", fake_batch)
+    monkeypatch.setattr("benjamin.core.models.llm_provider.BenjaminLLM.complete_text", fake_complete_text)
+    channel = CaptureChannel()
+    from benjamin.core.notifications.notifier import NotificationRouter
+
+    run_daily_briefing(
+        state_dir=str(tmp_path),
+        router=NotificationRouter(channels=[channel]),
+        calendar_connector=MockCalendarConnector(),
+        email_connector=MockEmailConnector(),
+    )
+    return channel, batches
+
+
+def test_thread_bullets_are_off_by_default(monkeypatch, tmp_path) -> None:
+    monkeypatch.delenv("BENJAMIN_BRIEFING_THREAD_BULLETS", raising=False)
+    channel, batches = _run_counting_batches(monkeypatch, tmp_path)
+
+    assert batches == []
+    assert "Status — Thread summary" in channel.messages[0][1]
+
+
+def test_thread_bullets_flag_adds_one_batched_round_trip(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_BRIEFING_THREAD_BULLETS", "on")
+    channel, batches = _run_counting_batches(monkeypatch, tmp_path)
+
+    assert batches == [1]
+    assert "Status — Condensed thread" in channel.messages[0][1]
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from benjamin.core.memory.manager import MemoryManager
+from benjamin.core.notifications.notifier import NotificationRouter
+from benjamin.core.scheduler.jobs import run_daily_briefing
+
+
+class RecorderNotifier:
+    def __init__(self) -> None:
+        self.messages: list[dict] = []
+
+    def send(self, title: str, body: str, meta: dict | None = None) -> None:
+        self.messages.append({"title": title, "body": body, "meta": meta or {}})
+
+
+class SlowCalendarConnector:
+    def __init__(self, delay_s: float) -> None:
+        self.delay_s = delay_s
+
+    def search_events(self, calendar_id: str, time_min_iso: str, time_max_iso: str, query: str | None, max_results: int) -> list[dict]:
+        time.sleep(self.delay_s)
+        return [{"title": "Standup", "start_iso": "2026-02-21T09:00:00-05:00"}]
+
+
+class SlowEmailConnector:
+    def __init__(self, search_delay_s: float, thread_delay_s: float) -> None:
+        self.search_delay_s = search_delay_s
+        self.thread_delay_s = thread_delay_s
+        self.release = threading.Event()
+
+    def search_messages(self, query: str, max_results: int) -> list[dict]:
+        time.sleep(self.search_delay_s)
+        return [{"thread_id": "t1", "subject": "Ship it", "snippet": "Inbox snippet"}]
+
+    def thread_summaries(self, thread_ids: list[str], max_messages: int = 10) -> list[dict]:
+        self.release.wait(self.thread_delay_s)
+        return [{"snippets": ["Thread snippet"]} for _ in thread_ids]
+
+
+def _latest_briefing(tmp_path) -> dict:
+    episodes = MemoryManager(state_dir=tmp_path).episodic.list_recent(limit=5)
+    return next(episode.meta for episode in episodes if episode.kind == "briefing")
+
+
+def test_sections_are_fetched_concurrently(tmp_path) -> None:
+    recorder = RecorderNotifier()
+    started = time.perf_counter()
+    run_daily_briefing(
+        state_dir=str(tmp_path),
+        router=NotificationRouter(channels=[recorder]),
+        calendar_connector=SlowCalendarConnector(0.3),
+        email_connector=SlowEmailConnector(search_delay_s=0.3, thread_delay_s=0.0),
+    )
+    elapsed = time.perf_counter() - started
+
+    body = recorder.messages[-1]["body"]
+    assert "Standup" in body and "Ship it — Thread snippet" in body
+    assert elapsed < 0.55
+    timings = _latest_briefing(tmp_path)["section_timings_ms"]
+    assert {"schedule", "email", "threads", "memory"} <= set(timings)
+    assert timings["schedule"] >= 300
+
+
+def test_late_sections_degrade_to_partial_output(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_BRIEFING_SECTION_TIMEOUT_S", "0.2")
+    recorder = RecorderNotifier()
+    email = SlowEmailConnector(search_delay_s=0.0, thread_delay_s=5.0)
+    started = time.perf_counter()
+    try:
+        run_daily_briefing(
+            state_dir=str(tmp_path),
+            router=NotificationRouter(channels=[recorder]),
+            calendar_connector=SlowCalendarConnector(2.0),
+            email_connector=email,
+        )
+    finally:
+        email.release.set()
+    elapsed = time.perf_counter() - started
+
+    body = recorder.messages[-1]["body"]
+    assert elapsed < 1.0
+    assert "Today's schedule:" not in body
+    assert "Ship it — Inbox snippet" in body
+    assert body.startswith("Still loading: ")
+    meta = _latest_briefing(tmp_path)
+    assert sorted(meta["late_sections"]) == ["schedule", "threads"]
+    assert meta["degraded_services"] == []
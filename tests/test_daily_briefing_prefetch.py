@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from benjamin.apps.api import deps
+from benjamin.apps.api.main import app
+from benjamin.core.memory.manager import MemoryManager
+from benjamin.core.notifications.notifier import NotificationRouter
+from benjamin.core.scheduler.briefing import load_briefing_draft
+from benjamin.core.scheduler.jobs import run_briefing_prefetch, run_daily_briefing
+
+
+class RecorderNotifier:
+    def __init__(self) -> None:
+        self.messages: list[dict] = []
+
+    def send(self, title: str, body: str, meta: dict | None = None) -> None:
+        self.messages.append({"title": title, "body": body, "meta": meta or {}})
+
+
+class MutableCalendarConnector:
+    def __init__(self) -> None:
+        self.events = [{"title": "Standup", "start_iso": "2026-02-21T09:00:00-05:00"}]
+
+    def search_events(self, calendar_id: str, time_min_iso: str, time_max_iso: str, query: str | None, max_results: int) -> list[dict]:
+        return list(self.events)
+
+
+class CountingEmailConnector:
+    def __init__(self) -> None:
+        self.searches = 0
+
+    def search_messages(self, query: str, max_results: int) -> list[dict]:
+        self.searches += 1
+        return [{"thread_id": "t1", "subject": "Ship it", "snippet": "Looks good"}]
+
+    def thread_summary(self, thread_id: str, max_messages: int = 10) -> dict:
+        return {"snippets": ["Merged"]}
+
+
+def test_delivery_uses_prefetched_draft_with_calendar_delta(tmp_path) -> None:
+    calendar = MutableCalendarConnector()
+    email = CountingEmailConnector()
+    recorder = RecorderNotifier()
+
+    run_briefing_prefetch(state_dir=str(tmp_path), calendar_connector=calendar, email_connector=email)
+    assert load_briefing_draft(tmp_path) is not None
+
+    calendar.events.append({"title": "Incident review", "start_iso": "2026-02-21T11:00:00-05:00"})
+    run_daily_briefing(
+        state_dir=str(tmp_path),
+        router=NotificationRouter(channels=[recorder]),
+        calendar_connector=calendar,
+        email_connector=email,
+    )
+
+    body = recorder.messages[-1]["body"]
+    assert "Incident review" in body and "Ship it — Merged" in body
+    assert email.searches == 1
+    assert load_briefing_draft(tmp_path) is None
+    episode = MemoryManager(state_dir=tmp_path).episodic.list_recent(limit=1)[0]
+    assert episode.meta["prefetched_iso"]
+    assert "email" not in episode.meta["section_timings_ms"]
+
+
+def test_compressed_draft_is_reused_when_schedule_unchanged(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_LLM_PROVIDER", "vllm")
+    monkeypatch.setenv("BENJAMIN_LLM_SUMMARIZER", "on")
+    calls: list[str] = []
+
+    def fake_complete_text(self, system: str, user: str, max_tokens=None, temperature=None) -> str:
+        calls.append(user)
+        return "Prefetched briefing"
+
+    monkeypatch.setattr("benjamin.core.models.llm_provider.BenjaminLLM.complete_text", fake_complete_text)
+    calendar = MutableCalendarConnector()
+    email = CountingEmailConnector()
+    recorder = RecorderNotifier()
+
+    run_briefing_prefetch(state_dir=str(tmp_path), calendar_connector=calendar, email_connector=email)
+    prefetch_calls = len(calls)
+    run_daily_briefing(
+        state_dir=str(tmp_path),
+        router=NotificationRouter(channels=[recorder]),
+        calendar_connector=calendar,
+        email_connector=email,
+    )
+
+    assert "Prefetched briefing" in recorder.messages[-1]["body"]
+    assert len(calls) == prefetch_calls
+
+
+def test_daily_briefing_schedules_prefetch_ahead(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("BENJAMIN_TEST_MODE", "1")
+    monkeypatch.setenv("BENJAMIN_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("BENJAMIN_BRIEFING_PREFETCH_MINUTES", "15")
+    deps.get_memory_manager.cache_clear()
+    deps.get_scheduler_service.cache_clear()
+
+    with TestClient(app) as client:
+        assert client.post("/jobs/daily-briefing", json={"time_hhmm": "00:10"}).status_code == 200
+        jobs = {job["id"]: job for job in client.get("/jobs").json()}
+        assert "hour='23', minute='55'" in jobs["daily-briefing-prefetch"]["trigger"]
+
+        monkeypatch.setenv("BENJAMIN_BRIEFING_PREFETCH_MINUTES", "0")
+        client.post("/jobs/daily-briefing", json={"time_hhmm": "00:10"})
+        assert all(job["id"] != "daily-briefing-prefetch" for job in client.get("/jobs").json())
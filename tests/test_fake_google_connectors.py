@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import pytest
+
+from benjamin.core.infra.breaker_manager import BreakerManager, ServiceDegradedError
+from benjamin.core.integrations.fake import (
+    FakeCalendarConnector,
+    FakeEmailConnector,
+    FaultInjector,
+    SyntheticCalendar,
+    SyntheticMailbox,
+)
+from benjamin.core.integrations.gmail_sync import GmailHistorySync
+from benjamin.core.notifications.notifier import NotificationRouter
+from benjamin.core.scheduler.jobs import run_daily_briefing
+
+
+class RecorderNotifier:
+    def __init__(self) -> None:
+        self.messages: list[dict] = []
+
+    def send(self, title: str, body: str, meta: dict | None = None) -> None:
+        self.messages.append({"title": title, "body": body, "meta": meta or {}})
+
+
+def test_fake_email_connector_serves_synthetic_mailbox(tmp_path) -> None:
+    mailbox = SyntheticMailbox(message_count=60, seed=3)
+    connector = FakeEmailConnector(mailbox=mailbox)
+
+    invoices = connector.search_messages("subject:invoice", max_results=5)
+    assert invoices and all("invoice" in message["subject"].casefold() for message in invoices)
+    assert connector.read_message(invoices[0]["id"])["body"].startswith(invoices[0]["subject"])
+    summary = connector.thread_summary(invoices[0]["thread_id"], max_messages=3)
+    assert summary["participants"] and summary["snippets"]
+
+    sync = GmailHistorySync(connector, tmp_path, bootstrap_query="in:inbox")
+    sync.sync()
+    delivered = mailbox.deliver(2)
+    assert sync.sync() == 2
+    assert {message["id"] for message in sync.search("in:inbox", 2)} == set(delivered)
+
+    mailbox.trim_history()
+    sync.sync()
+    assert sync.bootstraps == 2
+
+
+def test_fake_calendar_connector_supports_windows_and_sync_tokens() -> None:
+    calendar = SyntheticCalendar(event_count=40, seed=1)
+    connector = FakeCalendarConnector(calendar=calendar)
+
+    events, token = connector.list_event_changes("primary", time_min_iso="2000-01-01T00:00:00+00:00", time_max_iso="2100-01-01T00:00:00+00:00")
+    assert len(events) == 40
+    created = connector.create_event("primary", "Launch", "2030-01-01T10:00:00+00:00", "2030-01-01T11:00:00+00:00", "UTC", None, None, None)
+    changes, _ = connector.list_event_changes("primary", sync_token=token)
+    assert [event["id"] for event in changes] == [created["id"]]
+    found = connector.search_events("primary", "2029-12-31T00:00:00+00:00", "2030-01-02T00:00:00+00:00", "launch", 5)
+    assert [event["title"] for event in found] == ["Launch"]
+
+
+def test_fault_injection_trips_breaker(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_BREAKER_FAILURE_THRESHOLD", "2")
+    connector = FakeEmailConnector(
+        mailbox=SyntheticMailbox(message_count=5),
+        faults=FaultInjector(error_rate=1.0),
+        breaker_manager=BreakerManager(state_dir=tmp_path),
+    )
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            connector.search_messages("in:inbox", max_results=3)
+    with pytest.raises(ServiceDegradedError):
+        connector.search_messages("in:inbox", max_results=3)
+    assert connector.faults.errors == 2
+
+
+def test_google_enabled_fake_feeds_daily_briefing(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_GOOGLE_ENABLED", "fake")
+    monkeypatch.setenv("BENJAMIN_FAKE_GOOGLE_MESSAGES", "50")
+    monkeypatch.setenv("BENJAMIN_GMAIL_QUERY_IMPORTANT", "in:inbox")
+    recorder = RecorderNotifier()
+
+    run_daily_briefing(state_dir=str(tmp_path), router=NotificationRouter(channels=[recorder]))
+
+    body = recorder.messages[-1]["body"]
+    assert "Important emails:" in body
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from benjamin.core.cache.gmail import GmailMessageCache
+from benjamin.core.integrations import google_gmail
+from benjamin.core.integrations.google_gmail import GoogleGmailConnector
+
+
+class FakeRequest:
+    def __init__(self, service: "FakeGmailService", payload: dict, fail_once: bool = False) -> None:
+        self.service = service
+        self.payload = payload
+        self.fail_once = fail_once
+
+    def execute(self) -> dict:
+        self.service.round_trips += 1
+        return self.payload
+
+
+class FakeBatch:
+    def __init__(self, service: "FakeGmailService", callback) -> None:
+        self.service = service
+        self.callback = callback
+        self.requests: list[tuple[str, FakeRequest]] = []
+
+    def add(self, request: FakeRequest, request_id: str) -> None:
+        self.requests.append((request_id, request))
+
+    def execute(self) -> None:
+        self.service.round_trips += 1
+        self.service.batch_sizes.append(len(self.requests))
+        for request_id, request in self.requests:
+            if request.fail_once:
+                request.fail_once = False
+                self.callback(request_id, None, RuntimeError("rateLimitExceeded"))
+            else:
+                self.callback(request_id, request.payload, None)
+
+
+class FakeGmailService:
+    def __init__(self, message_count: int) -> None:
+        self.message_count = message_count
+        self.round_trips = 0
+        self.batch_sizes: list[int] = []
+        self.thread_history: dict[str, str] = {}
+
+    def users(self) -> "FakeGmailService":
+        return self
+
+    def messages(self) -> "FakeGmailService":
+        self._kind = "messages"
+        return self
+
+    def threads(self) -> "FakeGmailService":
+        self._kind = "threads"
+        return self
+
+    def list(self, userId: str, q: str, maxResults: int) -> FakeRequest:
+        del userId, q
+        ids = [{"id": f"m{index}"} for index in range(min(maxResults, self.message_count))]
+        return FakeRequest(self, {"messages": ids})
+
+    def get(self, userId: str, id: str, format: str, fields: str | None = None) -> FakeRequest:
+        del userId, fields
+        headers = [{"name": "From", "value": "a@example.com"}, {"name": "Subject", "value": f"subject {id}"}]
+        if self._kind == "threads":
+            history_id = self.thread_history.get(id, "1")
+            if format == "minimal":
+                return FakeRequest(self, {"id": id, "historyId": history_id})
+            message = {"snippet": f"snippet {id}@{history_id}", "payload": {"headers": headers}}
+            return FakeRequest(self, {"id": id, "historyId": history_id, "messages": [message]})
+        return FakeRequest(self, {"id": id, "threadId": f"t-{id}", "snippet": "", "payload": {"headers": headers}}, fail_once=id == "m3")
+
+    def new_batch_http_request(self, callback) -> FakeBatch:
+        return FakeBatch(self, callback)
+
+
+def _connector(monkeypatch, service: FakeGmailService, cache: GmailMessageCache | None = None) -> GoogleGmailConnector:
+    monkeypatch.setattr(google_gmail, "build_google_service", lambda *args: service)
+    return GoogleGmailConnector(token_path="unused", cache=cache)
+
+
+def test_search_messages_hydrates_in_batches(monkeypatch) -> None:
+    monkeypatch.setenv("BENJAMIN_GMAIL_BATCH_SIZE", "4")
+    service = FakeGmailService(message_count=10)
+    connector = _connector(monkeypatch, service)
+
+    messages = connector.search_messages("label:inbox", max_results=10)
+
+    assert [message["id"] for message in messages] == [f"m{index}" for index in range(10)]
+    assert messages[3]["subject"] == "subject m3"
+    assert service.batch_sizes == [4, 4, 2]
+    assert service.round_trips == 1 + 3 + 1
+
+
+def test_thread_summaries_use_one_batch(monkeypatch) -> None:
+    service = FakeGmailService(message_count=0)
+    connector = _connector(monkeypatch, service)
+
+    summaries = connector.thread_summaries(["t1", "t2", "t3"], max_messages=3)
+
+    assert [summary["snippets"] for summary in summaries] == [["snippet t1@1"], ["snippet t2@1"], ["snippet t3@1"]]
+    assert service.round_trips == 1
+
+
+def test_message_cache_serves_repeat_searches_after_list(monkeypatch, tmp_path) -> None:
+    service = FakeGmailService(message_count=5)
+    connector = _connector(monkeypatch, service, cache=GmailMessageCache(tmp_path))
+
+    first = connector.search_messages("label:inbox", max_results=5)
+    trips_after_first = service.round_trips
+    second = connector.search_messages("label:inbox", max_results=5)
+
+    assert first == second
+    assert service.round_trips - trips_after_first == 1
+
+    restarted = _connector(monkeypatch, service, cache=GmailMessageCache(tmp_path))
+    restarted.search_messages("label:inbox", max_results=5)
+    stats = restarted.cache.stats()
+    assert stats["disk_hits"] == 5
+    assert stats["hit_rate"] == 1.0
+
+
+def test_thread_cache_is_validated_by_history_id(monkeypatch, tmp_path) -> None:
+    service = FakeGmailService(message_count=0)
+    connector = _connector(monkeypatch, service, cache=GmailMessageCache(tmp_path))
+
+    connector.thread_summaries(["t1", "t2"], max_messages=3)
+    service.thread_history["t2"] = "9"
+    summaries = connector.thread_summaries(["t1", "t2"], max_messages=3)
+
+    assert [summary["snippets"] for summary in summaries] == [["snippet t1@1"], ["snippet t2@9"]]
+    assert connector.cache.stats()["stale"] == 1
+
+
+def test_message_cache_evicts_least_recently_used(tmp_path) -> None:
+    cache = GmailMessageCache(tmp_path, memory_entries=2, disk_entries=0)
+    for index in range(3):
+        cache.put_message(f"m{index}", "metadata", {"id": f"m{index}"})
+
+    assert cache.get_message("m0", "metadata") is None
+    assert cache.get_message("m2", "metadata") == {"id": "m2"}
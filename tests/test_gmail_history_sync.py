@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from benjamin.core.integrations.gmail_query import parse_gmail_query
+from benjamin.core.integrations.gmail_sync import GmailHistorySync, HistoryExpiredError
+from benjamin.core.notifications.notifier import NotificationRouter
+from benjamin.core.rules.evaluator import run_rules_evaluation
+from benjamin.core.rules.schemas import Rule, RuleActionNotify, RuleCondition, RuleTrigger
+from benjamin.core.rules.store import RuleStore
+
+
+def _message(message_id: str, subject: str, sender: str = "boss@example.com", hours_ago: int = 1) -> dict:
+    sent = datetime.now(timezone.utc) - timedelta(hours=hours_ago)
+    return {"id": message_id, "thread_id": f"t-{message_id}", "from": sender, "subject": subject, "snippet": "", "date_iso": sent.isoformat()}
+
+
+class HistoryEmailConnector:
+    def __init__(self) -> None:
+        self.mailbox = {"m1": (_message("m1", "Invoice 1"), ["INBOX", "UNREAD"])}
+        self.history: list[dict] = []
+        self.history_id = 10
+        self.expired = False
+        self.calls: dict[str, int] = {}
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def deliver(self, message: dict, labels: list[str]) -> None:
+        self.mailbox[message["id"]] = (message, labels)
+        self.history_id += 1
+        self.history.append({"id": str(self.history_id), "messagesAdded": [{"message": {"id": message["id"], "labelIds": labels}}]})
+
+    def current_history_id(self) -> str:
+        self._count("profile")
+        return str(self.history_id)
+
+    def list_message_refs(self, query: str, max_results: int) -> list[dict]:
+        self._count("list")
+        return [{"id": message_id, "labelIds": labels} for message_id, (_, labels) in self.mailbox.items()][:max_results]
+
+    def messages_metadata(self, message_ids: list[str]) -> list[dict]:
+        self._count("metadata")
+        return [dict(self.mailbox[message_id][0]) for message_id in message_ids]
+
+    def history_since(self, history_id: str) -> tuple[list[dict], str]:
+        self._count("history")
+        if self.expired:
+            self.expired = False
+            raise HistoryExpiredError(history_id)
+        records = [record for record in self.history if int(record["id"]) > int(history_id)]
+        return records, str(self.history_id)
+
+    def search_messages(self, query: str, max_results: int) -> list[dict]:
+        self._count("search")
+        return []
+
+
+def test_gmail_query_subset_matches_locally() -> None:
+    now = datetime.now(timezone.utc)
+    message = {**_message("m1", "Quarterly invoice", hours_ago=2), "label_ids": ["INBOX", "CATEGORY_UPDATES"]}
+
+    assert parse_gmail_query('in:inbox from:boss subject:"quarterly invoice" newer_than:1d -category:social').matches(message, now)
+    assert not parse_gmail_query("is:unread").matches(message, now)
+    assert not parse_gmail_query("older_than:1d").matches(message, now)
+    assert not parse_gmail_query("subject:invoice").matches({**message, "label_ids": ["SPAM"]}, now)
+    assert not parse_gmail_query("subject:invoi").matches(message, now)
+    assert parse_gmail_query("has:attachment") is None
+    assert parse_gmail_query("from:a OR from:b") is None
+    assert parse_gmail_query("label:my-project") is None
+    # Bare words also match message bodies on Gmail, so they always go to a live search.
+    assert parse_gmail_query("invoice") is None
+    assert parse_gmail_query('in:inbox "quarterly invoice"') is None
+    assert parse_gmail_query("newer_than:1m") is None
+
+
+def test_history_sync_applies_deltas_and_rebootstraps(tmp_path) -> None:
+    connector = HistoryEmailConnector()
+    sync = GmailHistorySync(connector, tmp_path)
+
+    assert sync.sync() == 1
+    connector.deliver(_message("m2", "Invoice 2"), ["INBOX"])
+    assert sync.sync() == 1
+    assert sync.sync() == 0
+    assert sorted(item["id"] for item in sync.search("in:inbox subject:invoice", 10)) == ["m1", "m2"]
+    assert sync.search("is:unread", 10)[0]["id"] == "m1"
+    assert sync.search("has:attachment", 10) is None
+    assert sync.search("in:inbox invoice", 10) is None
+
+    connector.expired = True
+    sync.sync()
+    assert sync.bootstraps == 2
+    assert GmailHistorySync(connector, tmp_path).history_id == str(connector.history_id)
+
+
+def test_rules_match_new_mail_from_history_without_search(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_GMAIL_SYNC_MODE", "history")
+    store = RuleStore(tmp_path)
+    store.upsert(
+        Rule(
+            name="invoices",
+            trigger=RuleTrigger(type="gmail", query="in:inbox subject:invoice", max_results=5),
+            condition=RuleCondition(contains="invoice"),
+            actions=[RuleActionNotify(type="notify", title="Invoices", body_template="{{count}}")],
+        )
+    )
+    connector = HistoryEmailConnector()
+    router = NotificationRouter(channels=[])
+
+    first = run_rules_evaluation(state_dir=str(tmp_path), router=router, email_connector=connector)
+    connector.deliver(_message("m2", "Invoice 2"), ["INBOX"])
+    second = run_rules_evaluation(state_dir=str(tmp_path), router=router, email_connector=connector)
+    third = run_rules_evaluation(state_dir=str(tmp_path), router=router, email_connector=connector)
+
+    assert [result.match_count for result in first + second + third] == [1, 1, 0]
+    assert "search" not in connector.calls
+    assert connector.calls["history"] == 2
+    assert connector.calls["metadata"] == 2
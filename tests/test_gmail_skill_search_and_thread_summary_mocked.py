@@ -42,3 +42,26 @@ def test_gmail_search_and_thread_summary_skills_with_mock() -> None:
     summary_payload = json.loads(summary_skill.run(json.dumps({"thread_id": "thread-1", "max_messages": 3})).content)
     assert summary_payload["participants"] == ["alice@example.com", "me@example.com"]
     assert summary_payload["snippets"][0] == "Agenda draft"
+
+
+class BatchEmailConnector(MockEmailConnector):
+    def thread_summaries(self, thread_ids: list[str], max_messages: int = 10) -> list[dict]:
+        return [{"thread_id": thread_id, "subject": thread_id, "snippets": [f"{thread_id} update"]} for thread_id in thread_ids]
+
+
+def test_thread_summary_skill_summarizes_many_threads_in_one_batch(monkeypatch) -> None:
+    monkeypatch.setenv("BENJAMIN_LLM_PROVIDER", "vllm")
+    monkeypatch.setenv("BENJAMIN_LLM_SUMMARIZER", "on")
+    calls: list[list[tuple[str, str]]] = []
+
+    def fake_batch(self, prompts, max_tokens=None, temperature=None):
+        calls.append(prompts)
+        return [f"- point {index}" for index in range(len(prompts))]
+
+    monkeypatch.setattr("benjamin.core.models.llm_provider.BenjaminLLM.complete_text_batch", fake_batch)
+    skill = GmailThreadSummarySkill(connector=BatchEmailConnector())
+
+    payload = json.loads(skill.run(json.dumps({"thread_ids": ["t1", "t2", "t3"]})).content)
+
+    assert len(calls) == 1 and len(calls[0]) == 3
+    assert [thread["bullets"] for thread in payload["threads"]] == [["point 0"], ["point 1"], ["point 2"]]
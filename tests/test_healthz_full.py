@@ -45,12 +45,14 @@ def test_healthz_full_defaults(tmp_path, monkeypatch) -> None:
     }
     assert payload["google"] == {
         "enabled": False,
+        "mode": "off",
         "token_present": False,
         "calendar_ready": False,
         "gmail_ready": False,
     }
     assert "rules_enabled" in payload["scheduler"]
     assert "daily_briefing_enabled" in payload["scheduler"]
+    assert payload["gmail_cache"]["hit_rate"] is None
 
 
 def test_healthz_full_creates_state_dir_when_missing(tmp_path, monkeypatch) -> None:
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+
 import httpx
 
 from benjamin.core.http.client import request_with_retry
+from benjamin.core.http.transport import HTTPTransport, TransportConfig
+from benjamin.core.infra.ratelimit import get_rate_limiter, reset_rate_limiters
+from benjamin.core.net.http import request_json
 
 
 def test_request_with_retry_retries_transient_http_status(monkeypatch) -> None:
@@ -14,14 +19,105 @@ def test_request_with_retry_retries_transient_http_status(monkeypatch) -> None:
             return httpx.Response(503, request=request)
         return httpx.Response(200, request=request, json={"ok": True})
 
-    transport = httpx.MockTransport(handler)
-    client = httpx.Client(transport=transport)
+    transport = HTTPTransport(TransportConfig(), transport=httpx.MockTransport(handler))
 
-    monkeypatch.setattr("benjamin.core.http.client.get_http_client", lambda: client)
-    monkeypatch.setattr("benjamin.core.http.client.time.sleep", lambda _: None)
-    monkeypatch.setattr("benjamin.core.http.client.random.random", lambda: 0.5)
+    monkeypatch.setattr("benjamin.core.http.transport._transport", transport)
+    monkeypatch.setattr("benjamin.core.http.transport.time.sleep", lambda _: None)
+    monkeypatch.setattr("benjamin.core.http.transport.random.random", lambda: 0.5)
 
     response = request_with_retry("GET", "http://service.local/test", retries=2)
 
     assert response.status_code == 200
     assert calls["count"] == 3
+
+
+def test_transport_shares_retry_budget_and_records_host_metrics(monkeypatch) -> None:
+    calls = {"count": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        return httpx.Response(503, request=request)
+
+    config = TransportConfig(retry_budget_ratio=0.0, retry_budget_min=1)
+    transport = HTTPTransport(config, transport=httpx.MockTransport(handler))
+    monkeypatch.setattr("benjamin.core.http.transport._transport", transport)
+    monkeypatch.setattr("benjamin.core.http.transport.time.sleep", lambda _: None)
+
+    for _ in range(2):
+        try:
+            request_json("POST", "http://llm.local/v1/chat", json={}, retries=3)
+        except RuntimeError:
+            pass
+
+    assert calls["count"] == 3
+    snapshot = transport.snapshot()
+    host = snapshot["hosts"]["llm.local"]
+    assert host["requests"] == 3
+    assert host["retries"] == 1
+    assert host["statuses"] == {"5xx": 3}
+    assert snapshot["retry_budget"]["rejected_total"] == 2
+
+
+def test_service_requests_spend_only_the_rate_limiter_retry_budget(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("BENJAMIN_RETRY_BUDGET_RATIO", "0")
+    monkeypatch.setenv("BENJAMIN_RETRY_BUDGET_MIN", "1")
+    reset_rate_limiters()
+    calls = {"count": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        return httpx.Response(503, request=request)
+
+    transport = HTTPTransport(TransportConfig(retry_budget_ratio=0.0, retry_budget_min=0), transport=httpx.MockTransport(handler))
+    monkeypatch.setattr("benjamin.core.http.transport.time.sleep", lambda _: None)
+    try:
+        for _ in range(2):
+            assert transport.request("GET", "http://gmail.local/x", retries=3, service="gmail").status_code == 503
+
+        limiter_budget = get_rate_limiter().retry_budgets["gmail"].snapshot()
+    finally:
+        reset_rate_limiters()
+    assert calls["count"] == 3
+    assert limiter_budget["requests"] == 3 and limiter_budget["retries"] == 1
+    assert transport.retry_budget.snapshot()["requests"] == 0
+
+
+
+def test_service_requests_use_the_limiter_of_the_configured_state_dir(monkeypatch, tmp_path) -> None:
+    configured = tmp_path / "configured"
+    monkeypatch.setenv("BENJAMIN_STATE_DIR", str(tmp_path / "env-default"))
+    reset_rate_limiters()
+
+    transport = HTTPTransport(TransportConfig(), transport=httpx.MockTransport(lambda request: httpx.Response(204, request=request)))
+    try:
+        transport.request("POST", "http://discord.local/hook", service="discord", state_dir=configured)
+        asyncio.run(transport.arequest("POST", "http://discord.local/hook", service="discord", state_dir=configured))
+
+        configured_budget = get_rate_limiter(configured).retry_budgets["discord"].snapshot()
+        default_budget = get_rate_limiter().retry_budgets["discord"].snapshot()
+    finally:
+        reset_rate_limiters()
+    assert configured_budget["requests"] == 2
+    assert default_budget["requests"] == 0
+
+
+def test_async_clients_use_injected_transport_per_event_loop() -> None:
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.host)
+        return httpx.Response(200, request=request, json={"ok": True})
+
+    transport = HTTPTransport(TransportConfig(), transport=httpx.MockTransport(handler))
+    for _ in range(2):
+        response = asyncio.run(transport.arequest("GET", "http://async.local/ping"))
+        assert response.json() == {"ok": True}
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(transport.arequest("GET", "http://async.local/ping"))
+        transport.close()
+    finally:
+        loop.close()
+    assert seen == ["async.local"] * 3
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import textwrap
+import time
+from datetime import datetime, timezone
+
+from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_SUBMITTED, JobExecutionEvent, JobSubmissionEvent
+from fastapi.testclient import TestClient
+
+from benjamin.apps.api import deps
+from benjamin.apps.api.main import app
+from benjamin.core.scheduler.telemetry import JobTelemetry
+
+
+def test_ring_buffer_keeps_newest_runs_and_aggregates_per_job_type(tmp_path) -> None:
+    telemetry = JobTelemetry(tmp_path, capacity=3)
+    base = 1_700_000_000.0
+    for index in range(5):
+        telemetry.record(f"reminder:{index}", base + index, base + index + 0.5, base + index + 2.5, "succeeded")
+
+    assert [record["job_id"] for record in telemetry.records()] == ["reminder:2", "reminder:3", "reminder:4"]
+
+    stats = telemetry.stats(recent=2)
+    reminder = stats["jobs"]["reminder"]
+    assert stats["stored"] == 3
+    assert reminder["runs"] == 3 and reminder["succeeded"] == 3
+    assert reminder["duration_ms"]["max_ms"] == 2000.0
+    assert reminder["lateness_ms"]["max_ms"] == 500.0
+    assert [run["job_id"] for run in stats["recent"]] == ["reminder:4", "reminder:3"]
+
+    assert [record["job_id"] for record in JobTelemetry(tmp_path, capacity=2).records()] == ["reminder:3", "reminder:4"]
+
+
+def test_listener_records_runs_finishing_before_submission_event(tmp_path) -> None:
+    telemetry = JobTelemetry(tmp_path)
+    scheduled = datetime.fromtimestamp(time.time() - 1.0, tz=timezone.utc)
+
+    telemetry.listener(JobExecutionEvent(EVENT_JOB_EXECUTED, "daily-briefing", "default", scheduled))
+    assert telemetry.records() == []
+    telemetry.listener(JobSubmissionEvent(EVENT_JOB_SUBMITTED, "daily-briefing", "default", [scheduled]))
+
+    stats = telemetry.stats()
+    assert stats["jobs"]["daily-briefing"]["succeeded"] == 1
+    assert stats["recent"][0]["lateness_ms"] >= 1000.0
+
+
+def test_concurrent_processes_do_not_lose_runs(tmp_path) -> None:
+    script = textwrap.dedent(
+        f"""
+        import sys
+        from pathlib import Path
+        from benjamin.core.scheduler.telemetry import JobTelemetry
+
+        telemetry = JobTelemetry(Path({str(tmp_path)!r}), capacity=500)
+        for index in range(50):
+            telemetry.record(f"{{sys.argv[1]}}:{{index}}", 1.0, 1.0, 2.0, "succeeded")
+        """
+    )
+    env = dict(os.environ, BENJAMIN_STATE_DIR=str(tmp_path))
+    workers = [subprocess.Popen([sys.executable, "-c", script, f"worker-{index}"], env=env) for index in range(3)]
+    assert all(worker.wait(timeout=60) == 0 for worker in workers)
+
+    assert len(JobTelemetry(tmp_path, capacity=500).records()) == 150
+    assert [record["job_id"] for record in JobTelemetry(tmp_path, capacity=3).records()] == [
+        record["job_id"] for record in JobTelemetry(tmp_path, capacity=500).records()[-3:]
+    ]
+
+
+def test_unmatched_early_completions_age_out(tmp_path, monkeypatch) -> None:
+    telemetry = JobTelemetry(tmp_path)
+    scheduled = datetime.fromtimestamp(time.time() - 1.0, tz=timezone.utc)
+    telemetry.listener(JobExecutionEvent(EVENT_JOB_EXECUTED, "rules-evaluator", "default", scheduled))
+    assert len(telemetry._finished_early) == 1
+
+    later = time.time() + 120.0
+    monkeypatch.setattr("benjamin.core.scheduler.telemetry.time.time", lambda: later)
+    telemetry.listener(JobExecutionEvent(EVENT_JOB_EXECUTED, "daily-briefing", "default", scheduled))
+
+    assert set(telemetry._finished_early) == {("daily-briefing", scheduled.timestamp())}
+    assert [(record["job_id"], record["submitted_ts"]) for record in telemetry.records()] == [("rules-evaluator", None)]
+
+
+def test_ops_job_stats_endpoint(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("BENJAMIN_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("BENJAMIN_TEST_MODE", "on")
+    deps.get_memory_manager.cache_clear()
+    deps.get_scheduler_service.cache_clear()
+
+    with TestClient(app) as client:
+        now = time.time()
+        app.state.scheduler_service.job_telemetry.record("rules-evaluator", now - 2.0, now - 1.5, now - 1.0, "failed")
+        response = client.get("/v1/ops/jobs/stats")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["jobs"]["rules-evaluator"]["failed"] == 1
+    assert payload["recent"][0]["duration_ms"] == 500.0
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import time
+
+from benjamin.core.infra.breaker_manager import BreakerManager
+from benjamin.core.models.llm_dispatch import LLMDispatcher
+from benjamin.core.models.llm_provider import BenjaminLLM, LLMUnavailable
+from benjamin.core.net.http import HTTPClientError
+from benjamin.core.observability.latency import LatencyHistogram, WindowedLatencyHistogram
+
+
+def _fresh_latency(monkeypatch) -> dict[str, LatencyHistogram]:
+    latency = {"json": LatencyHistogram(), "text": LatencyHistogram()}
+    monkeypatch.setattr("benjamin.core.models.llm_provider._LLM_LATENCY", latency)
+    return latency
+
+
+def test_latency_histogram_percentiles_and_round_trip() -> None:
+    histogram = LatencyHistogram()
+    for value in range(1, 101):
+        histogram.observe(value * 10)
+
+    p50 = histogram.percentile(50)
+    p99 = histogram.percentile(99)
+    assert p50 is not None and 450 <= p50 <= 600
+    assert p99 is not None and 950 <= p99 <= 1000
+    assert LatencyHistogram.from_dict(histogram.to_dict()).summary() == histogram.summary()
+
+
+def test_windowed_histogram_forgets_old_latency() -> None:
+    now = [0.0]
+    histogram = WindowedLatencyHistogram(window_s=60.0, slices=3, clock=lambda: now[0])
+    for _ in range(30):
+        histogram.observe(5000)
+
+    now[0] = 45.0
+    for _ in range(30):
+        histogram.observe(100)
+    assert histogram.count == 60
+    assert histogram.percentile(99) == 5000
+
+    now[0] = 75.0
+    assert histogram.count == 30
+    assert (histogram.percentile(99) or 0) <= 100
+
+
+def test_attempt_timeout_adapts_to_observed_latency(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_LLM_PROVIDER", "vllm")
+    monkeypatch.setenv("BENJAMIN_LLM_TIMEOUT_S", "45")
+    monkeypatch.setenv("BENJAMIN_LLM_TIMEOUT_MIN_S", "1")
+    latency = _fresh_latency(monkeypatch)
+    llm = BenjaminLLM(breaker_manager=BreakerManager(state_dir=tmp_path))
+
+    assert llm._attempt_timeout("text") == 45
+    for _ in range(30):
+        latency["text"].observe(500)
+
+    assert 1.0 <= llm._attempt_timeout("text") <= 2.0
+
+
+def test_hedged_request_returns_faster_secondary(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_LLM_PROVIDER", "vllm")
+    monkeypatch.setenv("BENJAMIN_LLM_HEDGE", "on")
+    latency = _fresh_latency(monkeypatch)
+    for _ in range(30):
+        latency["text"].observe(50)
+    llm = BenjaminLLM(breaker_manager=BreakerManager(state_dir=tmp_path))
+    calls: list[float] = []
+
+    def fake_chat_completion(system: str, user: str, **kwargs) -> str:
+        calls.append(kwargs["timeout_s"])
+        if len(calls) == 1:
+            time.sleep(1.0)
+            return "slow"
+        return "fast"
+
+    monkeypatch.setattr(llm._compat, "chat_completion", fake_chat_completion)
+
+    started = time.perf_counter()
+    output = llm.complete_text("s", "hedge me")
+
+    assert output == "fast"
+    assert len(calls) == 2
+    assert time.perf_counter() - started < 0.8
+
+
+def test_client_errors_are_not_retried(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_LLM_PROVIDER", "vllm")
+    monkeypatch.setenv("BENJAMIN_LLM_MAX_ATTEMPTS", "3")
+    _fresh_latency(monkeypatch)
+    llm = BenjaminLLM(breaker_manager=BreakerManager(state_dir=tmp_path))
+    calls: list[str] = []
+
+    def bad_request(system: str, user: str, **kwargs) -> str:
+        calls.append(user)
+        raise HTTPClientError("400 bad request")
+
+    monkeypatch.setattr(llm._compat, "chat_completion", bad_request)
+
+    try:
+        llm.complete_text("s", "invalid")
+    except LLMUnavailable:
+        pass
+    else:
+        raise AssertionError("expected LLMUnavailable")
+    assert calls == ["invalid"]
+
+
+def _slow_then_fast(calls: list[str], slow_s: float):  # type: ignore[no-untyped-def]
+    def fake_chat_completion(system: str, user: str, **kwargs) -> str:
+        calls.append(user)
+        if len(calls) == 1:
+            time.sleep(slow_s)
+            return "slow"
+        return "fast"
+
+    return fake_chat_completion
+
+
+def test_hedge_holds_a_dispatch_slot_until_the_loser_finishes(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_LLM_PROVIDER", "vllm")
+    monkeypatch.setenv("BENJAMIN_LLM_HEDGE", "on")
+    latency = _fresh_latency(monkeypatch)
+    for _ in range(30):
+        latency["text"].observe(50)
+    dispatcher = LLMDispatcher(max_in_flight=2)
+    monkeypatch.setattr("benjamin.core.models.llm_provider.get_llm_dispatcher", lambda: dispatcher)
+    llm = BenjaminLLM(breaker_manager=BreakerManager(state_dir=tmp_path))
+    calls: list[str] = []
+    monkeypatch.setattr(llm._compat, "chat_completion", _slow_then_fast(calls, 0.6))
+
+    assert llm.complete_text("s", "hedge me") == "fast"
+    assert dispatcher.snapshot()["in_flight"] == 1
+    time.sleep(0.8)
+    assert dispatcher.snapshot()["in_flight"] == 0
+
+
+def test_hedge_is_skipped_when_no_dispatch_slot_is_free(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_LLM_PROVIDER", "vllm")
+    monkeypatch.setenv("BENJAMIN_LLM_HEDGE", "on")
+    latency = _fresh_latency(monkeypatch)
+    for _ in range(30):
+        latency["text"].observe(50)
+    monkeypatch.setattr("benjamin.core.models.llm_provider.get_llm_dispatcher", lambda: LLMDispatcher(max_in_flight=1))
+    llm = BenjaminLLM(breaker_manager=BreakerManager(state_dir=tmp_path))
+    calls: list[str] = []
+    monkeypatch.setattr(llm._compat, "chat_completion", _slow_then_fast(calls, 0.3))
+
+    assert llm.complete_text("s", "hedge me") == "slow"
+    assert calls == ["hedge me"]
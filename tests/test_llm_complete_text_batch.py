@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import time
+
+from benjamin.core.infra.breaker_manager import BreakerManager
+from benjamin.core.models.llm_provider import BenjaminLLM
+from benjamin.core.summarize.summarizer import Summarizer
+
+
+def test_complete_text_batch_fans_out_concurrently_and_keeps_order(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_LLM_PROVIDER", "vllm")
+    monkeypatch.setenv("BENJAMIN_LLM_BATCH_CONCURRENCY", "4")
+    llm = BenjaminLLM(breaker_manager=BreakerManager(state_dir=tmp_path))
+
+    def fake_chat_completion(system: str, user: str, **kwargs) -> str:
+        time.sleep(0.2)
+        if user == "fail":
+            raise RuntimeError("bad prompt")
+        return f"echo:{user}"
+
+    monkeypatch.setattr(llm._compat, "chat_completion", fake_chat_completion)
+
+    started = time.perf_counter()
+    results = llm.complete_text_batch([("s", "a"), ("s", "fail"), ("s", "c"), ("s", "d")])
+    elapsed = time.perf_counter() - started
+
+    assert results == ["echo:a", None, "echo:c", "echo:d"]
+    assert elapsed < 0.8
+
+
+def test_summarizer_batch_uses_single_round_and_falls_back_per_item(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("BENJAMIN_LLM_PROVIDER", "vllm")
+    monkeypatch.setenv("BENJAMIN_LLM_SUMMARIZER", "on")
+    calls: list[list[tuple[str, str]]] = []
+
+    def fake_batch(self, prompts, max_tokens=None, temperature=None):
+        calls.append(prompts)
+        return ["- first point\n- second point", None]
+
+    monkeypatch.setattr("benjamin.core.models.llm_provider.BenjaminLLM.complete_text_batch", fake_batch)
+
+    summarizer = Summarizer()
+    bullets = summarizer.summarize_bullets_batch(["thread one", "", "Line A\nLine B"], max_bullets=1)
+
+    assert len(calls) == 1
+    assert len(calls[0]) == 2
+    assert bullets == [["first point"], [], ["Line A"]]
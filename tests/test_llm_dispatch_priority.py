@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+import pytest
+
+from benjamin.core.infra.breaker_manager import BreakerManager
+from benjamin.core.models.llm_dispatch import LLMDispatcher, LLMDispatchRejected, llm_priority
+from benjamin.core.models.llm_provider import BenjaminLLM, LLMUnavailable
+
+
+def test_dispatcher_serves_interactive_before_queued_background() -> None:
+    dispatcher = LLMDispatcher(max_in_flight=1)
+    order: list[str] = []
+    release = threading.Event()
+
+    def hold() -> None:
+        with dispatcher.slot("maintenance"):
+            release.wait(timeout=2)
+
+    def queued(priority: str) -> None:
+        with dispatcher.slot(priority):
+            order.append(priority)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    time.sleep(0.05)
+    background = threading.Thread(target=queued, args=("maintenance",))
+    background.start()
+    time.sleep(0.05)
+    interactive = threading.Thread(target=queued, args=("interactive",))
+    interactive.start()
+    time.sleep(0.05)
+
+    assert dispatcher.snapshot()["waiting"] == {"interactive": 1, "rule": 0, "maintenance": 1}
+    release.set()
+    for thread in (holder, background, interactive):
+        thread.join()
+
+    assert order == ["interactive", "maintenance"]
+
+
+def test_dispatcher_enforces_per_class_token_budget() -> None:
+    dispatcher = LLMDispatcher(max_in_flight=2, token_budgets={"rule": 100})
+
+    with dispatcher.slot("rule", tokens=80):
+        pass
+    with pytest.raises(LLMDispatchRejected):
+        with dispatcher.slot("rule", tokens=40):
+            pass
+    with dispatcher.slot("interactive", tokens=500):
+        pass
+
+
+def test_llm_call_log_reports_priority_and_queue_wait(monkeypatch, tmp_path, caplog) -> None:
+    monkeypatch.setenv("BENJAMIN_LLM_PROVIDER", "vllm")
+    llm = BenjaminLLM(breaker_manager=BreakerManager(state_dir=tmp_path))
+    monkeypatch.setattr(llm._compat, "chat_completion", lambda **kwargs: "ok")
+
+    with caplog.at_level(logging.INFO, logger="benjamin.llm"), llm_priority("rule"):
+        assert llm.complete_text(system="s", user="u") == "ok"
+
+    fields = [record.extra_fields for record in caplog.records if record.getMessage() == "llm_call"][-1]
+    assert fields["priority"] == "rule"
+    assert fields["queue_wait_ms"] >= 0
+
+
+def test_llm_budget_rejection_surfaces_as_unavailable(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_LLM_PROVIDER", "vllm")
+    llm = BenjaminLLM(breaker_manager=BreakerManager(state_dir=tmp_path))
+    monkeypatch.setattr(llm._compat, "chat_completion", lambda **kwargs: "ok")
+    monkeypatch.setattr(
+        "benjamin.core.models.llm_provider.get_llm_dispatcher",
+        lambda: LLMDispatcher(max_in_flight=1, token_budgets={"maintenance": 1}),
+    )
+
+    with llm_priority("maintenance"), pytest.raises(LLMUnavailable):
+        llm.complete_text(system="s", user="u")
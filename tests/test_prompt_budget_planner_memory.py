@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from benjamin.core.infra.breaker_manager import BreakerManager
+from benjamin.core.models.llm_provider import BenjaminLLM
+from benjamin.core.models.prompt_budget import BudgetItem, PromptBudget, estimate_tokens
+from benjamin.core.models.prompts import planner_system_prompt
+from benjamin.core.orchestration.planner import Planner
+
+
+def test_estimate_tokens_approximates_subword_pieces() -> None:
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("hello, world") == 5
+    assert estimate_tokens("internationalization") > estimate_tokens("intl")
+
+
+def test_prompt_budget_keeps_highest_scoring_items_in_original_order() -> None:
+    items = [
+        BudgetItem(text="alpha " * 40, section="a", score=0.1),
+        BudgetItem(text="quarterly report due", section="a", score=0.9),
+        BudgetItem(text="invoice from vendor", section="b", score=0.5),
+    ]
+
+    packed = PromptBudget(max_tokens=20).pack(items)
+
+    assert [item.text for item in packed] == ["quarterly report due", "invoice from vendor"]
+
+
+def test_planner_memory_block_respects_token_budget_and_relevance(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("BENJAMIN_PROMPT_BUDGET_PLANNER", "40")
+    planner = Planner(llm=BenjaminLLM(breaker_manager=BreakerManager(state_dir=tmp_path)))
+    memory = {
+        "semantic": [
+            SimpleNamespace(key="preference:editor", value="Use vim keybindings " * 10),
+            SimpleNamespace(key="preference:inbox", value="Flag invoices from Acme"),
+        ],
+        "episodic": [SimpleNamespace(summary="Reviewed Acme invoices yesterday")],
+    }
+
+    block = planner._memory_block(memory, goal="check acme invoices")
+
+    assert "preference:inbox" in block
+    assert "Reviewed Acme invoices" in block
+    assert "vim" not in block
+    assert estimate_tokens(block) <= 40
+
+
+def test_json_prompt_prefix_is_static_across_calls(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_LLM_PROVIDER", "vllm")
+    llm = BenjaminLLM(breaker_manager=BreakerManager(state_dir=tmp_path))
+    captured: list[dict] = []
+
+    def fake_chat_completion(**kwargs) -> str:
+        captured.append(kwargs)
+        return "{}"
+
+    monkeypatch.setattr(llm._compat, "chat_completion", fake_chat_completion)
+
+    for goal in ("goal one", "goal two"):
+        llm.complete_json(system=planner_system_prompt(), user=goal, schema_hint={"goal": "string", "steps": "array"})
+
+    assert captured[0]["system"] == captured[1]["system"]
+    assert "gmail.search" in captured[0]["system"]
+    assert "Schema hint" in captured[0]["system"]
+    assert captured[0]["user"] == "goal one"
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from benjamin.core.infra.breaker_manager import BreakerManager, ServiceDegradedError
+from benjamin.core.infra.ratelimit import RateLimiter, RateLimitExceeded
+
+
+def test_token_bucket_is_shared_between_limiters_on_same_state_dir(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_RATE_LIMIT_GMAIL", "0.5/2")
+    api_side = RateLimiter(state_dir=tmp_path)
+    worker_side = RateLimiter(state_dir=tmp_path)
+
+    api_side.acquire("gmail", max_wait_s=0)
+    worker_side.acquire("gmail", max_wait_s=0)
+    with pytest.raises(RateLimitExceeded):
+        api_side.acquire("gmail", max_wait_s=0)
+
+    assert (tmp_path / "ratelimit.shm").exists()
+    assert not (tmp_path / "ratelimit.json").exists()
+    snapshot = worker_side.snapshot()["services"]["gmail"]
+    assert snapshot["burst"] == 2.0
+    assert snapshot["tokens"] < 1
+
+
+def test_rate_limited_call_does_not_trip_breaker(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_RATE_LIMIT_CALENDAR", "0.1/1")
+    monkeypatch.setenv("BENJAMIN_RATE_LIMIT_MAX_WAIT_S", "0")
+    monkeypatch.setenv("BENJAMIN_BREAKER_FAILURE_THRESHOLD", "1")
+    manager = BreakerManager(state_dir=tmp_path)
+    calls: list[int] = []
+
+    assert manager.wrap("calendar", lambda: calls.append(1) or "ok") == "ok"
+    with pytest.raises(ServiceDegradedError) as excinfo:
+        manager.wrap("calendar", lambda: calls.append(2))
+
+    assert isinstance(excinfo.value, RateLimitExceeded)
+    assert calls == [1]
+    assert manager.snapshot()["calendar"]["state"] == "closed"
+
+
+def test_retry_budget_caps_retries_to_fraction_of_requests(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_RETRY_BUDGET_RATIO", "0.5")
+    monkeypatch.setenv("BENJAMIN_RETRY_BUDGET_MIN", "0")
+    limiter = RateLimiter(state_dir=tmp_path)
+
+    assert limiter.allow_retry("llm") is False
+    limiter.acquire("llm")
+    limiter.acquire("llm")
+    assert limiter.allow_retry("llm") is True
+    assert limiter.allow_retry("llm") is False
+    assert limiter.snapshot()["services"]["llm"]["retry_budget"]["rejected_total"] == 2
+
+
+def test_shared_buckets_do_not_touch_files_per_call(monkeypatch, tmp_path) -> None:
+    limiter = RateLimiter(state_dir=tmp_path)
+    opened: list[str] = []
+    original_open = os.open
+
+    def counting_open(path, *args, **kwargs):  # type: ignore[no-untyped-def]
+        opened.append(str(path))
+        return original_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "open", counting_open)
+    for _ in range(15):
+        limiter.acquire("gmail")
+
+    assert opened == []
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["ratelimit.shm"]
+
+
+def test_discord_burst_queues_instead_of_failing(monkeypatch, tmp_path) -> None:
+    monkeypatch.delenv("BENJAMIN_RATE_LIMIT_DISCORD", raising=False)
+    monkeypatch.delenv("BENJAMIN_RATE_LIMIT_MAX_WAIT_S_DISCORD", raising=False)
+    monkeypatch.setenv("BENJAMIN_RATE_LIMIT_MAX_WAIT_S", "0")
+    clock = {"now": 1_000.0}
+    slept: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        slept.append(seconds)
+        clock["now"] += seconds + 0.001
+
+    monkeypatch.setattr(
+        "benjamin.core.infra.ratelimit.time",
+        SimpleNamespace(time=lambda: clock["now"], monotonic=lambda: clock["now"], sleep=fake_sleep),
+    )
+    limiter = RateLimiter(state_dir=tmp_path)
+
+    for _ in range(8):
+        limiter.acquire("discord")
+
+    assert len(slept) == 3
+    assert limiter.snapshot()["services"]["discord"]["rejected_total"] == 0
+    with pytest.raises(RateLimitExceeded):
+        limiter.acquire("discord", max_wait_s=0)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from benjamin.core.notifications.notifier import NotificationRouter
+from benjamin.core.rules.evaluator import run_rules_evaluation
+from benjamin.core.rules.runtime import get_rules_runtime
+from benjamin.core.rules.schemas import Rule, RuleActionNotify, RuleCondition, RuleTrigger
+from benjamin.core.rules.store import RuleStore
+
+
+class SlowEmailConnector:
+    def __init__(self, delay_s: float) -> None:
+        self.delay_s = delay_s
+
+    def search_messages(self, query: str, max_results: int) -> list[dict]:
+        time.sleep(self.delay_s)
+        return [{"id": f"{query}-1", "subject": f"alert {query}", "snippet": ""}][:max_results]
+
+
+class BlockingNotifier:
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.sent: list[str] = []
+
+    def send(self, title: str, body: str, meta: dict | None = None) -> None:
+        del body, meta
+        if title == "stuck":
+            self.release.wait(5)
+        self.sent.append(title)
+
+
+def _rule(name: str, query: str) -> Rule:
+    return Rule(
+        name=name,
+        trigger=RuleTrigger(type="gmail", query=query, max_results=5),
+        condition=RuleCondition(contains="alert"),
+        actions=[RuleActionNotify(type="notify", title=name, body_template="{{count}}")],
+    )
+
+
+def test_rules_fetch_concurrently_and_time_out_individually(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_RULES_CONCURRENCY", "4")
+    monkeypatch.setenv("BENJAMIN_RULES_TIMEOUT_S", "1")
+    store = RuleStore(tmp_path)
+    for name in ("a", "b", "c", "stuck"):
+        store.upsert(_rule(name, f"q-{name}"))
+    notifier = BlockingNotifier()
+
+    try:
+        results = run_rules_evaluation(
+            state_dir=str(tmp_path),
+            router=NotificationRouter(channels=[notifier]),
+            email_connector=SlowEmailConnector(delay_s=0.3),
+        )
+    finally:
+        notifier.release.set()
+
+    runtime = get_rules_runtime(tmp_path)
+    assert runtime.last_tick["fetch_ms"] < 900
+    assert runtime.last_tick["timed_out"] == 1
+    by_id = {rule.id: rule for rule in store.list_all()}
+    outcomes = {by_id[result.rule_id].name: result for result in results}
+    assert outcomes["stuck"].ok is False
+    assert outcomes["stuck"].notes == ["rule_timeout"]
+    assert by_id[outcomes["stuck"].rule_id].state.seen_ids == []
+    assert all(outcomes[name].ok and outcomes[name].matched for name in ("a", "b", "c"))
+    assert by_id[outcomes["a"].rule_id].state.seen_ids == ["q-a-1"]
+
+
+def test_timed_out_rule_stops_acting_and_is_counted_as_runaway(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_RULES_CONCURRENCY", "2")
+    monkeypatch.setenv("BENJAMIN_RULES_TIMEOUT_S", "0.5")
+    store = RuleStore(tmp_path)
+    store.upsert(_rule("fast", "q-fast"))
+    stuck = _rule("stuck", "q-stuck").model_copy(
+        update={
+            "actions": [
+                RuleActionNotify(type="notify", title="stuck", body_template="{{count}}"),
+                RuleActionNotify(type="notify", title="after-timeout", body_template="{{count}}"),
+            ],
+            "max_actions_per_run": 5,
+        }
+    )
+    store.upsert(stuck)
+    notifier = BlockingNotifier()
+
+    try:
+        run_rules_evaluation(
+            state_dir=str(tmp_path),
+            router=NotificationRouter(channels=[notifier]),
+            email_connector=SlowEmailConnector(delay_s=0),
+        )
+        runtime = get_rules_runtime(tmp_path)
+        assert runtime.last_tick["timed_out"] == 1
+        assert runtime.snapshot()["runaway_workers"] == 1
+    finally:
+        notifier.release.set()
+
+    deadline = time.monotonic() + 3
+    while runtime.snapshot()["runaway_workers"] and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert runtime.snapshot()["runaway_workers"] == 0
+    assert runtime.snapshot()["runaway_total"] == 1
+    assert "after-timeout" not in notifier.sent
+    assert sorted(notifier.sent) == ["fast", "stuck"]
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from benjamin.core.notifications.notifier import NotificationRouter
+from benjamin.core.rules.evaluator import run_rules_evaluation
+from benjamin.core.rules.runtime import get_rules_runtime
+from benjamin.core.rules.schemas import Rule, RuleActionNotify, RuleCondition, RuleTrigger
+from benjamin.core.rules.store import RuleStore
+
+
+class CountingEmailConnector:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def search_messages(self, query: str, max_results: int) -> list[dict]:
+        del query
+        self.calls += 1
+        return [{"id": f"msg_{self.calls}", "subject": "Invoice due", "snippet": "pay soon"}][:max_results]
+
+
+class RecordingNotifier:
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+
+    def send(self, title: str, body: str, meta: dict | None = None) -> None:
+        self.calls.append({"title": title, "body": body, "meta": meta or {}})
+
+
+def _rule(name: str) -> Rule:
+    return Rule(
+        name=name,
+        trigger=RuleTrigger(type="gmail", query="invoice", max_results=5),
+        condition=RuleCondition(contains="invoice"),
+        actions=[RuleActionNotify(type="notify", title="Inbox", body_template="{{count}} new")],
+    )
+
+
+def test_runtime_is_reused_and_reloads_only_on_change(tmp_path) -> None:
+    store = RuleStore(tmp_path)
+    store.upsert(_rule("first"))
+    email = CountingEmailConnector()
+    notifier = RecordingNotifier()
+    router = NotificationRouter(channels=[notifier])
+
+    def tick() -> list:
+        return run_rules_evaluation(state_dir=str(tmp_path), router=router, email_connector=email)
+
+    runtime = get_rules_runtime(tmp_path)
+    first = tick()
+    orchestrator = runtime.orchestrator
+    second = tick()
+
+    assert [result.matched for result in first + second] == [True, True]
+    assert runtime.orchestrator is orchestrator
+    assert runtime.reload_count == 1
+    assert runtime.last_tick is not None and runtime.last_tick["reloaded"] is False
+    assert len(notifier.calls) == 2
+
+    store.upsert(_rule("second"))
+    third = tick()
+
+    assert len(third) == 2
+    assert runtime.reload_count == 2
+    assert runtime.snapshot()["tick_latency"]["count"] == 3
+    persisted = {rule.name: rule for rule in store.list_all()}
+    assert len(persisted["first"].state.seen_ids) == 3
+
+
+def test_runtime_keeps_job_run_idempotency(tmp_path) -> None:
+    RuleStore(tmp_path).upsert(_rule("only"))
+    email = CountingEmailConnector()
+    router = NotificationRouter(channels=[RecordingNotifier()])
+    kwargs = {
+        "state_dir": str(tmp_path),
+        "job_id": "rules-evaluator",
+        "scheduled_run_iso": "2026-01-01T10:00:00+00:00",
+        "router": router,
+        "email_connector": email,
+    }
+
+    assert len(run_rules_evaluation(**kwargs)) == 1
+    assert run_rules_evaluation(**kwargs) == []
+    assert email.calls == 1
+
+
+class EmptyEmailConnector:
+    def search_messages(self, query: str, max_results: int) -> list[dict]:
+        del query, max_results
+        return []
+
+
+def test_tick_without_matches_leaves_rules_file_untouched(tmp_path) -> None:
+    store = RuleStore(tmp_path)
+    for name in ("first", "second"):
+        store.upsert(_rule(name))
+    router = NotificationRouter(channels=[RecordingNotifier()])
+
+    run_rules_evaluation(state_dir=str(tmp_path), router=router, email_connector=EmptyEmailConnector())
+    assert get_rules_runtime(tmp_path).last_tick["persisted"] == 2
+    before = (tmp_path / "rules.jsonl").read_bytes(), (tmp_path / "rules.jsonl").stat().st_mtime_ns
+
+    run_rules_evaluation(state_dir=str(tmp_path), router=router, email_connector=EmptyEmailConnector())
+
+    assert get_rules_runtime(tmp_path).last_tick["persisted"] == 0
+    assert ((tmp_path / "rules.jsonl").read_bytes(), (tmp_path / "rules.jsonl").stat().st_mtime_ns) == before
+    assert all(rule.state.last_run_iso for rule in get_rules_runtime(tmp_path)._rules)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benjamin.core.integrations.google_calendar import GoogleCalendarConnector
+from benjamin.core.notifications.notifier import NotificationRouter
+from benjamin.core.rules.evaluator import run_rules_evaluation
+from benjamin.core.rules.runtime import get_rules_runtime
+from benjamin.core.rules.schemas import Rule, RuleActionNotify, RuleCondition, RuleTrigger
+from benjamin.core.rules.store import RuleStore
+
+
+class RecordingEmailConnector:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, int]] = []
+
+    def search_messages(self, query: str, max_results: int) -> list[dict]:
+        self.calls.append((query, max_results))
+        return [{"id": f"{query}-{index}", "subject": f"invoice {index}", "snippet": ""} for index in range(max_results)]
+
+
+class NoopNotifier:
+    def send(self, title: str, body: str, meta: dict | None = None) -> None:
+        del title, body, meta
+
+
+def _rule(name: str, query: str, max_results: int) -> Rule:
+    return Rule(
+        name=name,
+        trigger=RuleTrigger(type="gmail", query=query, max_results=max_results),
+        condition=RuleCondition(contains="invoice"),
+        actions=[RuleActionNotify(type="notify", title=name, body_template="{{count}}")],
+    )
+
+
+def test_rules_with_same_trigger_share_one_fetch(tmp_path) -> None:
+    store = RuleStore(tmp_path)
+    store.upsert(_rule("narrow", "label:inbox", 2))
+    store.upsert(_rule("wide", "label:inbox", 5))
+    store.upsert(_rule("other", "from:billing", 3))
+    connector = RecordingEmailConnector()
+
+    results = run_rules_evaluation(
+        state_dir=str(tmp_path),
+        router=NotificationRouter(channels=[NoopNotifier()]),
+        email_connector=connector,
+    )
+
+    assert sorted(connector.calls) == [("from:billing", 3), ("label:inbox", 5)]
+    counts = {rule.name: len(rule.state.seen_ids) for rule in store.list_all()}
+    assert counts == {"narrow": 2, "wide": 5, "other": 3}
+    assert all(result.ok for result in results)
+    assert get_rules_runtime(tmp_path).last_tick["trigger_fetches"] == 2
+
+
+class _OverlapDetectingCalendarService:
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def events(self):  # type: ignore[no-untyped-def]
+        return self
+
+    def list(self, **params):  # type: ignore[no-untyped-def]
+        return self
+
+    def execute(self) -> dict:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.02)
+        with self._lock:
+            self.active -= 1
+        return {"items": []}
+
+
+def test_calendar_connector_serializes_concurrent_requests_on_shared_service() -> None:
+    service = _OverlapDetectingCalendarService()
+    connector = GoogleCalendarConnector(token_path="", service=service)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(
+            pool.map(
+                lambda query: connector.search_events("primary", "2026-01-01T00:00:00+00:00", "2026-01-02T00:00:00+00:00", query, 5),
+                ["a", "b", "c", "d"],
+            )
+        )
+
+    assert service.max_active == 1
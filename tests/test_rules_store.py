@@ -24,3 +24,55 @@ def test_rules_store_crud_and_enable(tmp_path) -> None:
 
     assert store.delete(created.id) is True
     assert store.get(created.id) is None
+
+
+def test_rules_store_upsert_many_writes_once_and_tracks_dirty_state(tmp_path, monkeypatch) -> None:
+    store = RuleStore(state_dir=tmp_path)
+    for name in ("a", "b", "c"):
+        store.upsert(Rule(name=name, trigger=RuleTrigger(type="schedule")))
+
+    rules = store.list_all()
+    assert not any(rule.state.dirty for rule in rules)
+    rules[0].state.last_match_iso = "2026-01-01T00:00:00+00:00"
+    rules[1].state.seen_ids.append("item-1")
+    rules[2].state.last_run_iso = "2026-01-01T00:00:00+00:00"
+    dirty = [rule for rule in rules if rule.state.dirty]
+    assert [rule.name for rule in dirty] == [rules[0].name, rules[1].name]
+
+    writes: list[int] = []
+    original_write_all = RuleStore._write_all
+
+    def counting_write_all(self, records):
+        writes.append(len(records))
+        original_write_all(self, records)
+
+    monkeypatch.setattr(RuleStore, "_write_all", counting_write_all)
+    stored = store.upsert_many(dirty)
+
+    assert writes == [3]
+    assert not any(rule.state.dirty for rule in stored)
+    persisted = {rule.name: rule for rule in store.list_all()}
+    assert persisted[rules[0].name].state.last_match_iso == "2026-01-01T00:00:00+00:00"
+    assert persisted[rules[1].name].state.seen_ids == ["item-1"]
+    assert store.upsert_many([]) == []
+    assert writes == [3]
+
+
+def test_rules_store_upsert_many_keeps_concurrent_edits_and_deletes(tmp_path) -> None:
+    store = RuleStore(state_dir=tmp_path)
+    kept = store.upsert(Rule(name="kept", trigger=RuleTrigger(type="schedule")))
+    removed = store.upsert(Rule(name="removed", trigger=RuleTrigger(type="schedule")))
+    working = {rule.id: rule for rule in store.list_all()}
+
+    store.upsert(store.get(kept.id).model_copy(update={"name": "renamed during tick"}))
+    store.delete(removed.id)
+    for rule in working.values():
+        rule.state.last_run_iso = "2026-01-01T00:00:00+00:00"
+
+    stored = store.upsert_many(working.values())
+
+    assert [rule.id for rule in stored] == [kept.id]
+    persisted = store.list_all()
+    assert [rule.id for rule in persisted] == [kept.id]
+    assert persisted[0].name == "renamed during tick"
+    assert persisted[0].state.last_run_iso == "2026-01-01T00:00:00+00:00"
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+
+from benjamin.core.scheduler.lanes import lane_for_job
+from benjamin.core.scheduler.scheduler import SchedulerService
+
+_release = threading.Event()
+_reminder_ran = threading.Event()
+
+
+def _slow_briefing() -> None:
+    _release.wait(5)
+
+
+def _reminder() -> None:
+    _reminder_ran.set()
+
+
+def test_jobs_map_to_lanes() -> None:
+    assert lane_for_job("reminder:abc") == "reminders"
+    assert lane_for_job("daily-briefing") == "briefings"
+    assert lane_for_job("daily-briefing-prefetch") == "briefings"
+    assert lane_for_job("rules-evaluator") == "rules"
+    assert lane_for_job("maintenance:weekly_compact") == "maintenance"
+    assert lane_for_job("something-else") == "default"
+
+
+def test_reminders_run_while_briefing_lane_is_saturated(monkeypatch, tmp_path) -> None:
+    monkeypatch.delenv("BENJAMIN_TEST_MODE", raising=False)
+    monkeypatch.setenv("BENJAMIN_JOBS_BRIEFINGS_WORKERS", "1")
+    monkeypatch.setenv("BENJAMIN_JOBS_MAINTENANCE_EXECUTOR", "thread")
+    _release.clear()
+    _reminder_ran.clear()
+    service = SchedulerService(state_dir=tmp_path)
+    service.start()
+    try:
+        now = datetime.now(timezone.utc)
+        for index in range(3):
+            service.add_one_off(f"daily-briefing:load-{index}", now, _slow_briefing, kwargs={})
+        deadline = time.monotonic() + 3
+        while service.lane_stats()["briefings"]["in_flight"] < 3 and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+        started = time.perf_counter()
+        service.add_one_off("reminder:lane-test", datetime.now(timezone.utc), _reminder, kwargs={})
+        assert _reminder_ran.wait(1.0)
+        assert time.perf_counter() - started < 1.0
+
+        while service.lane_stats()["reminders"]["completed"] < 1 and time.monotonic() < deadline + 1:
+            time.sleep(0.02)
+        stats = service.lane_stats()
+        assert stats["reminders"]["in_flight"] == 0
+        assert stats["briefings"]["max_workers"] == 1
+        assert stats["briefings"]["queued"] == 2
+        assert stats["maintenance"]["executor"] == "thread"
+    finally:
+        _release.set()
+        deadline = time.monotonic() + 3
+        while any(lane["in_flight"] for lane in service.lane_stats().values()) and time.monotonic() < deadline:
+            time.sleep(0.02)
+        service.shutdown()
+
+
+def test_persisted_jobs_move_to_their_lane_on_start(monkeypatch, tmp_path) -> None:
+    monkeypatch.delenv("BENJAMIN_TEST_MODE", raising=False)
+    monkeypatch.setenv("BENJAMIN_JOBS_MAINTENANCE_EXECUTOR", "thread")
+    run_at = datetime(2099, 1, 1, tzinfo=timezone.utc)
+    legacy = SchedulerService(state_dir=tmp_path)
+    legacy.scheduler.add_job(_reminder, trigger="date", id="reminder:legacy", run_date=run_at, executor="default")
+    legacy.scheduler.add_job(_reminder, trigger="date", id="other:legacy", run_date=run_at, executor="default")
+    legacy.scheduler.start(paused=True)
+    legacy.scheduler.shutdown(wait=False)
+
+    service = SchedulerService(state_dir=tmp_path)
+    service.start()
+    try:
+        executors = {job.id: job.executor for job in service.scheduler.get_jobs()}
+    finally:
+        service.shutdown()
+    assert executors == {"reminder:legacy": "reminders", "other:legacy": "default"}
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+from apscheduler.schedulers.base import STATE_PAUSED, STATE_RUNNING
+
+from benjamin.core.ledger.ledger import ExecutionLedger
+from benjamin.core.notifications.notifier import NotificationRouter
+from benjamin.core.scheduler.jobs import run_reminder
+from benjamin.core.scheduler.leader import (
+    LeaderLease,
+    LeadershipLostError,
+    StaleFencingTokenError,
+    check_fencing,
+    register_lease,
+)
+from benjamin.core.scheduler.scheduler import SchedulerService
+
+_ran = threading.Event()
+
+
+def _mark_ran() -> None:
+    _ran.set()
+
+
+def _wait_for(predicate, timeout_s: float = 3.0) -> bool:  # type: ignore[no-untyped-def]
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+def test_lease_takeover_bumps_fencing_token(tmp_path) -> None:
+    first = LeaderLease(tmp_path, holder_id="a", ttl_s=0.3)
+    second = LeaderLease(tmp_path, holder_id="b", ttl_s=0.3)
+
+    assert first.try_acquire() and first.token == 1
+    assert not second.try_acquire()
+    assert first.try_acquire() and first.token == 1
+
+    time.sleep(0.35)
+    assert second.try_acquire() and second.token == 2
+    assert not first.try_acquire()
+    assert not first.is_current()
+
+    second.release()
+    assert first.try_acquire() and first.token == 3
+
+
+def test_check_fencing_rejects_stale_leader(tmp_path) -> None:
+    stale = LeaderLease(tmp_path, holder_id="a", ttl_s=0.2)
+    assert check_fencing(tmp_path) is None
+    register_lease(tmp_path, stale)
+    try:
+        assert stale.try_acquire()
+        assert check_fencing(tmp_path) == 1
+        time.sleep(0.25)
+        assert LeaderLease(tmp_path, holder_id="b", ttl_s=0.2).try_acquire()
+        with pytest.raises(LeadershipLostError):
+            check_fencing(tmp_path)
+    finally:
+        register_lease(tmp_path, None)
+
+
+def test_only_leader_runs_jobs_and_follower_takes_over(monkeypatch, tmp_path) -> None:
+    monkeypatch.delenv("BENJAMIN_TEST_MODE", raising=False)
+    monkeypatch.setenv("BENJAMIN_JOBS_MAINTENANCE_EXECUTOR", "thread")
+    monkeypatch.setenv("BENJAMIN_SCHEDULER_LEASE_TTL_S", "0.6")
+    _ran.clear()
+    leader = SchedulerService(state_dir=tmp_path)
+    follower = SchedulerService(state_dir=tmp_path)
+    leader.start()
+    follower.start()
+    try:
+        assert leader.scheduler.state == STATE_RUNNING
+        assert follower.scheduler.state == STATE_PAUSED
+        assert leader.leader_status()["is_leader"] is True
+        assert follower.leader_status()["is_leader"] is False
+
+        follower.add_one_off("reminder:from-follower", datetime.now(timezone.utc), _mark_ran, kwargs={})
+        assert _ran.wait(2.0)
+
+        token = leader.leader_status()["fencing_token"]
+        leader.shutdown()
+        assert _wait_for(lambda: follower.scheduler.state == STATE_RUNNING)
+        assert follower.leader_status()["fencing_token"] == token + 1
+    finally:
+        leader.shutdown()
+        follower.shutdown()
+
+
+def test_ledger_refuses_writes_with_stale_fencing_token(tmp_path) -> None:
+    old = LeaderLease(tmp_path, holder_id="a", ttl_s=0.2)
+    assert old.try_acquire()
+    time.sleep(0.25)
+    new = LeaderLease(tmp_path, holder_id="b", ttl_s=0.2)
+    assert new.try_acquire() and new.token == 2
+    ledger = ExecutionLedger(tmp_path)
+
+    with pytest.raises(StaleFencingTokenError):
+        ledger.try_start("job:stale", kind="job_run", fencing_token=old.token)
+    assert ledger.try_start("job:fresh", kind="job_run", fencing_token=new.token)
+    with pytest.raises(StaleFencingTokenError):
+        ledger.mark("job:fresh", "failed", fencing_token=old.token)
+    latest = ledger.list_recent()[-1]
+    assert latest.status == "started" and latest.meta["fencing_token"] == 2
+
+
+class _RecordingChannel:
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+
+    def send(self, title: str, body: str, meta: dict | None = None) -> None:
+        del body, meta
+        self.sent.append(title)
+
+
+def test_reminder_that_loses_lease_mid_run_does_not_send(monkeypatch, tmp_path) -> None:
+    lease = LeaderLease(tmp_path, holder_id="a", ttl_s=0.2)
+    assert lease.try_acquire()
+    register_lease(tmp_path, lease)
+    original_try_start = ExecutionLedger.try_start
+
+    def try_start_then_lose_lease(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        started = original_try_start(self, *args, **kwargs)
+        time.sleep(0.25)
+        assert LeaderLease(tmp_path, holder_id="b", ttl_s=5).try_acquire()
+        return started
+
+    monkeypatch.setattr(ExecutionLedger, "try_start", try_start_then_lose_lease)
+    channel = _RecordingChannel()
+    try:
+        with pytest.raises((LeadershipLostError, StaleFencingTokenError)):
+            run_reminder("stand up", str(tmp_path), job_id="reminder:fenced", router=NotificationRouter(channels=[channel]))
+    finally:
+        register_lease(tmp_path, None)
+
+    assert channel.sent == []
+    records = ExecutionLedger(tmp_path).list_recent()
+    assert [record.status for record in records] == ["started", "failed"]
+
+
+def test_reminder_that_loses_lease_mid_run_is_requeued_and_delivered(monkeypatch, tmp_path) -> None:
+    monkeypatch.delenv("BENJAMIN_TEST_MODE", raising=False)
+    monkeypatch.setenv("BENJAMIN_SCHEDULER_LEASE_TTL_S", "0.6")
+    channel = _RecordingChannel()
+    service = SchedulerService(state_dir=tmp_path)
+    calls: list[int] = []
+
+    def router_that_expires_lease(state_dir: object = None) -> NotificationRouter:
+        calls.append(1)
+        if len(calls) == 1:
+            # The lease lapses mid-job: no new leader yet, but this one no longer holds it.
+            service.elector.lease.release()
+        return NotificationRouter(channels=[channel])
+
+    monkeypatch.setattr("benjamin.core.scheduler.jobs.build_notification_router", router_that_expires_lease)
+    service.start()
+    try:
+        run_at = datetime.now(timezone.utc)
+        service.add_one_off(
+            "reminder:lapsed",
+            run_at,
+            run_reminder,
+            kwargs={"message": "stand up", "state_dir": str(tmp_path), "job_id": "reminder:lapsed", "scheduled_run_iso": run_at.isoformat()},
+        )
+        assert _wait_for(lambda: channel.sent == ["Reminder"], timeout_s=5.0)
+    finally:
+        service.shutdown()
+
+    assert len(calls) == 2
+    statuses = [record.status for record in ExecutionLedger(tmp_path).list_recent()]
+    assert statuses == ["started", "failed", "started", "succeeded"]
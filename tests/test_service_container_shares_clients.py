@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from benjamin.core.draft.drafter import Drafter
+from benjamin.core.infra.services import get_services, reset_services
+from benjamin.core.orchestration.planner import Planner
+from benjamin.core.retrieval.helper import RetrievalHelper
+from benjamin.core.summarize.summarizer import Summarizer
+
+
+def test_components_share_one_llm_and_breaker_manager(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("BENJAMIN_LLM_PROVIDER", "vllm")
+
+    planner = Planner()
+    summarizer = Summarizer()
+    drafter = Drafter()
+    helper = RetrievalHelper()
+
+    assert planner.llm is summarizer.llm is drafter.llm is helper.llm
+    assert planner.llm.breaker_manager is get_services(tmp_path).breaker_manager()
+    assert get_services(str(tmp_path)) is get_services()
+
+    monkeypatch.setenv("BENJAMIN_LLM_MODEL", "other-model")
+    assert Summarizer().llm is not planner.llm
+    assert Summarizer().llm.config.model == "other-model"
+
+
+def test_reset_services_runs_shutdown_hooks(tmp_path) -> None:
+    container = get_services(tmp_path)
+    calls: list[str] = []
+    container.on_shutdown(lambda: calls.append("first"))
+    container.on_shutdown(lambda: calls.append("second"))
+
+    reset_services()
+
+    assert calls == ["second", "first"]
+    assert get_services(tmp_path) is not container
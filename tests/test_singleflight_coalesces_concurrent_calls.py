@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from benjamin.core.cache.singleflight import SingleFlight, singleflight_key
+from benjamin.core.infra.breaker_manager import BreakerManager
+from benjamin.core.models.llm_provider import BenjaminLLM
+
+
+def _run_concurrently(count: int, fn) -> list:
+    barrier = threading.Barrier(count)
+    results: list = [None] * count
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        try:
+            results[index] = fn()
+        except Exception as exc:
+            results[index] = exc
+
+    threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_singleflight_shares_result_between_concurrent_callers() -> None:
+    flights = SingleFlight()
+    calls = {"count": 0}
+
+    def slow() -> str:
+        calls["count"] += 1
+        time.sleep(0.2)
+        return "done"
+
+    key = singleflight_key("test", "query", 5)
+    results = _run_concurrently(5, lambda: flights.do(key, slow))
+
+    assert results == ["done"] * 5
+    assert calls["count"] == 1
+    assert flights.stats()["followers"] == 4
+    assert flights.in_flight() == 0
+
+
+def test_singleflight_shares_exception_and_allows_retry() -> None:
+    flights = SingleFlight()
+
+    def boom() -> str:
+        time.sleep(0.2)
+        raise RuntimeError("upstream down")
+
+    results = _run_concurrently(3, lambda: flights.do("k", boom))
+    assert all(isinstance(item, RuntimeError) for item in results)
+
+    assert flights.do("k", lambda: "recovered") == "recovered"
+    with pytest.raises(ValueError):
+        flights.do("other", lambda: (_ for _ in ()).throw(ValueError("x")))
+
+
+def test_llm_identical_concurrent_prompts_hit_backend_once(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_LLM_PROVIDER", "vllm")
+    llm = BenjaminLLM(breaker_manager=BreakerManager(state_dir=tmp_path))
+    calls = {"count": 0}
+
+    def fake_chat_completion(**kwargs) -> str:
+        calls["count"] += 1
+        time.sleep(0.2)
+        return '{"ok": true}'
+
+    monkeypatch.setattr(llm._compat, "chat_completion", fake_chat_completion)
+
+    results = _run_concurrently(4, lambda: llm.complete_json(system="rules", user="same prompt"))
+
+    assert results == [{"ok": True}] * 4
+    assert calls["count"] == 1
+
+
+def test_llm_clients_on_different_endpoints_do_not_share_results(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BENJAMIN_LLM_PROVIDER", "vllm")
+    clients = []
+    for name in ("primary", "fallback"):
+        monkeypatch.setenv("BENJAMIN_VLLM_URL", f"http://{name}.local/v1/chat/completions")
+        llm = BenjaminLLM(breaker_manager=BreakerManager(state_dir=tmp_path / name))
+
+        def fake_chat_completion(name: str = name, **kwargs) -> str:
+            time.sleep(0.2)
+            return f'{{"endpoint": "{name}"}}'
+
+        monkeypatch.setattr(llm._compat, "chat_completion", fake_chat_completion)
+        clients.append(llm)
+
+    barrier = threading.Barrier(2)
+    results: list = [None, None]
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        results[index] = clients[index].complete_json(system="rules", user="same prompt")
+
+    threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [{"endpoint": "primary"}, {"endpoint": "fallback"}]